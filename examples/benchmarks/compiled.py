@@ -0,0 +1,86 @@
+"""Compiled historical file benchmark, reports updates per
+second replaying the raw, gzip compressed and compiled
+(utils.compile_file) versions of each file, processing the
+updates only and creating MarketBooks (as per simulation),
+raw files are also replayed with the standard library json
+decoder (as per betfairlightweight without [speed]).
+
+    python examples/benchmarks/compiled.py [file ..]
+"""
+
+import os
+import sys
+import gzip
+import time
+import shutil
+import logging
+import tempfile
+
+from flumine import config, utils
+from flumine.streams import historicalstream
+
+logging.disable(logging.CRITICAL)
+
+FILES = ["tests/resources/1.200806927", "tests/resources/SELF-1.181223995"]
+REPEAT = 5
+
+
+def best_of(func) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def create_stream(file_path: str):
+    listener = historicalstream.HistoricListener(max_latency=None)
+    return historicalstream.FlumineHistoricalGeneratorStream(
+        file_path, listener, "marketSubscription", 1
+    )
+
+
+def process(file_path: str) -> None:
+    stream = create_stream(file_path)
+    stream.listener.register_stream(1, "marketSubscription")
+    for _ in stream._process_file():
+        pass
+
+
+def market_books(file_path: str) -> None:
+    for _ in create_stream(file_path)._read_loop():
+        pass
+
+
+def main(files: list) -> None:
+    print("best of %s, updates/s" % REPEAT)
+    print("%-20s %-10s %12s %12s" % ("file", "format", "process", "market_books"))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for file_path in files:
+            name = os.path.basename(file_path)
+            gz_path = os.path.join(tmp_dir, name + ".gz")
+            with open(file_path, "rb") as f, gzip.open(gz_path, "wb") as o:
+                shutil.copyfileobj(f, o)
+            compiled_path = os.path.join(tmp_dir, name)
+            updates = utils.compile_file(file_path, compiled_path)
+            for label, path, decoder in (
+                ("raw", file_path, None),
+                ("raw json", file_path, "json"),
+                ("gzip", gz_path, None),
+                ("compiled", compiled_path, None),
+            ):
+                config.simulation_json_decoder = decoder
+                print(
+                    "%-20s %-10s %12d %12d"
+                    % (
+                        name,
+                        label,
+                        updates / best_of(lambda: process(path)),
+                        updates / best_of(lambda: market_books(path)),
+                    )
+                )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or FILES)
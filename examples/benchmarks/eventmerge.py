@@ -0,0 +1,75 @@
+"""Event processing merge benchmark, compares the previous
+sort and pop(0) chronological mux of market book generators
+with merge_market_book_generators on a synthetic event.
+
+    python examples/benchmarks/eventmerge.py [markets] [updates]
+"""
+
+import sys
+import time
+import random
+from types import SimpleNamespace
+
+from flumine.simulation.utils import merge_market_book_generators
+
+MARKETS = 100
+UPDATES = 2000  # per market
+REPEAT = 3
+
+
+def create_generators(markets: int, updates: int) -> list:
+    rng = random.Random(1)
+    generators = []
+    for market in range(markets):
+        epoch, market_books = 1_600_000_000_000, []
+        for _ in range(updates):
+            epoch += rng.choice((0, 50, 50, 100, 1000))  # ties on publish time
+            market_books.append(
+                [SimpleNamespace(market_id=market, publish_time_epoch=epoch)]
+            )
+        generators.append(market_books)
+    return generators
+
+
+def sort_merge(generators: list):
+    # previous FlumineSimulation.run implementation
+    cycles = []  # [[epoch, [MarketBook], gen], ..]
+    for stream_gen in generators:
+        market_book = next(stream_gen)
+        publish_time_epoch = market_book[0].publish_time_epoch
+        cycles.append([publish_time_epoch, market_book, stream_gen])
+    while cycles:
+        cycles.sort(key=lambda x: x[0])
+        _, market_book, stream_gen = cycles.pop(0)
+        yield market_book
+        try:
+            market_book = next(stream_gen)
+        except StopIteration:
+            continue
+        publish_time_epoch = market_book[0].publish_time_epoch
+        cycles.append([publish_time_epoch, market_book, stream_gen])
+
+
+def run(merge, market_books: list) -> tuple:
+    timings, order = [], None
+    for _ in range(REPEAT):
+        generators = [iter(m) for m in market_books]
+        start = time.perf_counter()
+        order = [market_book[0] for market_book in merge(generators)]
+        timings.append(time.perf_counter() - start)
+    return min(timings), order
+
+
+def main(markets: int = MARKETS, updates: int = UPDATES) -> None:
+    market_books = create_generators(markets, updates)
+    total = markets * updates
+    print("%s markets, %s updates, best of %s" % (markets, total, REPEAT))
+    sort_time, sort_order = run(sort_merge, market_books)
+    heap_time, heap_order = run(merge_market_book_generators, market_books)
+    print("sort/pop(0) %8.3fs %10d updates/s" % (sort_time, total / sort_time))
+    print("heap        %8.3fs %10d updates/s" % (heap_time, total / heap_time))
+    print("identical order: %s" % (sort_order == heap_order))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
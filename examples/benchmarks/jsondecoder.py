@@ -0,0 +1,77 @@
+"""Historical file json decoder benchmark, reports lines
+per second per decoder (config.simulation_json_decoder)
+decoding only and processing through the market caches.
+
+    python examples/benchmarks/jsondecoder.py [file ..]
+"""
+
+import sys
+import time
+import logging
+import importlib
+
+from flumine import config
+from flumine.streams import historicalstream
+
+logging.disable(logging.CRITICAL)
+
+FILES = ["tests/resources/1.200806927", "tests/resources/SELF-1.181223995"]
+DECODERS = [None, "json", "orjson", "simdjson", "ujson"]  # None = default
+REPEAT = 5
+
+
+def best_of(func) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def decode(lines: list, loads) -> None:
+    for _ in historicalstream.decode_lines(iter(lines), loads):
+        pass
+
+
+def process(files: list) -> None:
+    for file_path in files:
+        listener = historicalstream.HistoricListener(max_latency=None)
+        stream = historicalstream.FlumineHistoricalGeneratorStream(
+            file_path, listener, "marketSubscription", 1
+        )
+        listener.register_stream(1, "marketSubscription")
+        for _ in stream._process_file():
+            pass
+
+
+def main(files: list) -> None:
+    lines = []
+    for file_path in files:
+        with open(file_path) as f:
+            lines += f.readlines()
+    print("%s lines, best of %s" % (len(lines), REPEAT))
+    print("%-10s %15s %15s" % ("decoder", "decode", "process"))
+    for decoder in DECODERS:
+        if decoder is not None:
+            try:
+                importlib.import_module(decoder)
+            except ImportError:
+                print("%-10s %31s" % (decoder, "not installed"))
+                continue
+        loads = historicalstream.get_json_loads(decoder)
+        config.simulation_json_decoder = decoder
+        decode_time = best_of(lambda: decode(lines, loads))
+        process_time = best_of(lambda: process(files))
+        print(
+            "%-10s %9d l/s %9d l/s"
+            % (
+                decoder or "default",
+                len(lines) / decode_time,
+                len(lines) / process_time,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or FILES)
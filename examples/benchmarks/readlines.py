@@ -0,0 +1,77 @@
+"""Historical file reader benchmark, compares reading the
+entire file into memory (default) with the bounded memory
+reader (config.simulation_read_buffer_size) on synthetic
+files built from a market file, reporting throughput and
+peak python memory (tracemalloc).
+
+    python examples/benchmarks/readlines.py [size_mb ..]
+"""
+
+import os
+import sys
+import time
+import tempfile
+import tracemalloc
+
+from flumine.streams.historicalstream import read_lines
+
+SOURCE = "tests/resources/1.200806927"
+SIZES = [10, 100]  # MB, e.g. 10 100 1000
+BUFFER_SIZES = [64 * 1024, 1024 * 1024]
+
+
+def create_file(path: str, size_mb: int) -> int:
+    with open(SOURCE) as f:
+        data = f.read()
+    size = size_mb * 1024 * 1024
+    with open(path, "w") as f:
+        while f.tell() < size:
+            f.write(data)
+    return os.path.getsize(path)
+
+
+def read(path: str, buffer_size: int = None) -> int:
+    with open(path, "r") as f:
+        if buffer_size:
+            lines = read_lines(f, buffer_size)
+        else:
+            lines = f.readlines()
+        return sum(1 for _ in lines)
+
+
+def measure(path: str, buffer_size: int = None) -> tuple:
+    start = time.perf_counter()
+    read(path, buffer_size)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    read(path, buffer_size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(sizes: list) -> None:
+    print("%-8s %-12s %10s %12s" % ("file", "reader", "MB/s", "peak MB"))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size_mb in sizes:
+            path = os.path.join(tmp_dir, "%sMB" % size_mb)
+            file_size = create_file(path, size_mb) / 1024 / 1024
+            readers = [("readlines", None)] + [
+                ("buffer %sK" % (b // 1024), b) for b in BUFFER_SIZES
+            ]
+            for label, buffer_size in readers:
+                elapsed, peak = measure(path, buffer_size)
+                print(
+                    "%-8s %-12s %10.0f %12.1f"
+                    % (
+                        "%sMB" % size_mb,
+                        label,
+                        file_size / elapsed,
+                        peak / 1024 / 1024,
+                    )
+                )
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
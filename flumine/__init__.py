@@ -2,6 +2,7 @@ import logging
 
 from .flumine import Flumine
 from .simulation.simulation import FlumineSimulation
+from .simulation.parallel import ParallelSimulation
 from .strategy.strategy import BaseStrategy
 from .exceptions import FlumineException
 from .__version__ import __title__, __version__, __author__
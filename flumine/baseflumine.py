@@ -1,14 +1,14 @@
 import time
-import queue
 import logging
 import threading
-from typing import Type
+from typing import Optional, Type
 from betfairlightweight import resources
 
 from .strategy.strategy import Strategies, BaseStrategy
 from .streams.streams import Streams
 from .events import events
-from .worker import BackgroundWorker
+from .worker import BackgroundWorker, log_profiler
+from .handlerqueue import HandlerQueue
 from .clients import Clients, BaseClient, VenueType
 from .markets.markets import Markets
 from .markets.market import Market
@@ -24,6 +24,7 @@ from .controls.tradingcontrols import (
     MarketValidation,
 )
 from .controls.loggingcontrols import LoggingControl
+from .profiler import Profiler
 from .exceptions import FlumineException, ClientError
 from . import config, utils
 
@@ -46,7 +47,7 @@ class BaseFlumine:
         self.clients = Clients()
 
         # FIFO queue
-        self.handler_queue = queue.Queue()
+        self.handler_queue = HandlerQueue()
 
         # markets
         self.markets = Markets()
@@ -79,6 +80,9 @@ class BaseFlumine:
         # workers
         self._workers = []
 
+        # event loop timings (optional)
+        self.profiler = None
+
     def run(self) -> None:
         raise NotImplementedError
 
@@ -101,6 +105,23 @@ class BaseFlumine:
         self.strategies(strategy, self.clients, self)  # store in strategies
         self.log_control(events.StrategyEvent(strategy))
 
+    def enable_profiler(
+        self, interval: Optional[int] = 60, sample_rate: int = 10
+    ) -> Profiler:
+        """Records event loop stage timings of every
+        `sample_rate` event, a summary is logged every
+        `interval` seconds (timings are reset) if provided.
+        """
+        logger.info("Enabling profiler")
+        self.profiler = Profiler(sample_rate)
+        if interval:
+            self.add_worker(
+                BackgroundWorker(
+                    self, function=log_profiler, interval=interval, start_delay=interval
+                )
+            )
+        return self.profiler
+
     def add_worker(self, worker: BackgroundWorker) -> None:
         logger.info("Adding worker %s", worker.name)
         self._workers.append(worker)
@@ -131,6 +152,7 @@ class BaseFlumine:
         return
 
     def _process_market_books(self, event: events.MarketBookEvent) -> None:
+        profiler = self.profiler if self.profiler and self.profiler.sampling else None
         for market_book in event.event:
             market_id = market_book.market_id
 
@@ -159,24 +181,44 @@ class BaseFlumine:
                 continue
 
             # process market
+            if profiler:
+                start = time.perf_counter()
             market(market_book)
+            if profiler:
+                profiler.record("market", None, start)
 
             # process middleware
             for middleware in self._market_middleware:
+                if profiler:
+                    start = time.perf_counter()
                 utils.call_middleware_error_handling(middleware, market)
+                if profiler:
+                    profiler.record("middleware", middleware, start)
 
+            stream_id = market_book.streaming_unique_id
             for strategy in self.strategies:
-                if market_book.streaming_unique_id in strategy.stream_ids:
+                if stream_id in strategy.stream_ids and strategy.market_in_view(
+                    stream_id, market_id, market_book.market_definition
+                ):
                     if market_is_new:
                         utils.call_strategy_error_handling(
                             strategy.process_new_market, market, market_book
                         )
-                    if utils.call_strategy_error_handling(
+                    if profiler:
+                        start = time.perf_counter()
+                    check = utils.call_strategy_error_handling(
                         strategy.check_market_book, market, market_book
-                    ):
+                    )
+                    if profiler:
+                        profiler.record("check_market_book", strategy, start)
+                    if check:
+                        if profiler:
+                            start = time.perf_counter()
                         utils.call_strategy_error_handling(
                             strategy.process_market_book, market, market_book
                         )
+                        if profiler:
+                            profiler.record("process_market_book", strategy, start)
         if self.markets.live_orders:
             self.markets.live_orders_event.set()
         else:
@@ -282,12 +324,18 @@ class BaseFlumine:
                         market.market_book
                         and market.market_book.streaming_unique_id
                         in strategy.stream_ids
+                        and strategy.market_in_view(
+                            market.market_book.streaming_unique_id,
+                            market.market_id,
+                            market.market_book.market_definition,
+                        )
                     ) or strategy.market_cached(market.market_id):
                         utils.call_strategy_error_handling(
                             strategy.process_market_catalogue, market, market_catalogue
                         )
 
     def _process_current_orders(self, event: events.CurrentOrdersEvent) -> None:
+        profiler = self.profiler if self.profiler and self.profiler.sampling else None
         # update state
         if event.event:
             if event.callback:
@@ -318,17 +366,21 @@ class BaseFlumine:
         for market in self.markets:
             if market.closed is False and market.blotter.active:
                 # complete orders if required
-                for order in market.blotter.live_orders:
+                for order in list(market.blotter.live_orders):
                     if order.complete:
-                        if order in market.blotter.live_orders:
+                        if market.blotter.has_live_order(order):
                             market.blotter.complete_order(order)
                 # loop strategies
                 for strategy in self.strategies:
                     strategy_orders = market.blotter.strategy_orders(strategy)
                     if strategy_orders:
+                        if profiler:
+                            start = time.perf_counter()
                         utils.call_process_orders_error_handling(
                             strategy, market, strategy_orders
                         )
+                        if profiler:
+                            profiler.record("process_orders", strategy, start)
 
     def _process_custom_event(self, event: events.CustomEvent) -> None:
         try:
@@ -356,10 +408,12 @@ class BaseFlumine:
             recorder = True
             market_id = market_book["id"]
             stream_id = market_book["_stream_id"]
+            market_definition = None
         else:
             recorder = False
             market_id = market_book.market_id
             stream_id = market_book.streaming_unique_id
+            market_definition = market_book.market_definition
         market = self.markets.markets.get(market_id)
         if market is None:
             logger.warning(
@@ -376,7 +430,10 @@ class BaseFlumine:
             market.blotter.process_closed_market(market, event.event)
 
         for strategy in self.strategies:
-            if stream_id in strategy.stream_ids or strategy.market_filter == {}:
+            if (
+                stream_id in strategy.stream_ids
+                and strategy.market_in_view(stream_id, market_id, market_definition)
+            ) or strategy.market_filter == {}:
                 strategy.process_closed_market(market, event.event)
 
         if recorder is False and self.clients.simulated:
@@ -392,6 +449,7 @@ class BaseFlumine:
                     moreAvailable=False,
                     clearedOrders=[market.cleared(client)],
                 )
+                cleared_markets.client = client
                 self._process_cleared_markets(
                     events.ClearedMarketsEvent(cleared_markets)
                 )
@@ -483,6 +541,7 @@ class BaseFlumine:
             "streams": [s for s in self.streams],
             "logging_controls": self._logging_controls,
             "threads": threading.enumerate(),
+            "profiler": self.profiler.info if self.profiler else None,
         }
 
     def __enter__(self):
@@ -497,6 +556,10 @@ class BaseFlumine:
         # login
         self.clients.login()
         self.clients.update_account_details()
+        # prioritise execution thread pools if required
+        for client in self.clients:
+            if client.execution_priorities or config.execution_priorities:
+                client.execution.enable_execution_priorities()
         # add default and start all workers
         self._add_default_workers()
         for w in self._workers:
@@ -32,6 +32,7 @@ class BaseClient:
         simulated_full_match: bool = False,
         execution_cls=None,
         order_stream_cls=None,
+        execution_priorities: dict = None,
     ):
         if hasattr(betting_client, "lightweight"):
             assert (
@@ -58,6 +59,8 @@ class BaseClient:
         self.commission_paid = 0
 
         self._execution_cls = execution_cls  # custom execution
+        # thread pool priority per package type, e.g. {"Cancel": 0, "Place": 1}
+        self.execution_priorities = execution_priorities
         self.order_stream_cls = order_stream_cls  # custom order stream
         self.execution = None  # set during flumine init
         self.trading_controls = []
@@ -136,4 +139,5 @@ class BaseClient:
             "order_stream_conflate_ms": self.order_stream_conflate_ms,
             "best_price_execution": self.best_price_execution,
             "paper_trade": self.paper_trade,
+            "execution_priorities": self.execution_priorities,
         }
@@ -3,6 +3,18 @@ import os
 simulated = False
 simulated_strategy_isolation = True
 simulation_available_prices = False
+# read historical files in chunks of n bytes rather than entire file into memory
+simulation_read_buffer_size = None
+# directory to store historical file checkpoints (skip ahead when using inplay/seconds_to_start)
+simulation_checkpoint_directory = None
+# json module used to decode historical files (e.g. 'orjson', 'simdjson'), defaults to betfairlightweight
+simulation_json_decoder = None
+# create historical MarketBooks directly from the cache with rarely used attributes created on access
+simulation_lazy_market_books = False
+
+# live market streams with the same data filter, conflation and timeout are coalesced
+# into a single superset subscription where possible (filters differing by a single key)
+coalesce_market_streams = False
 
 # overrides even when value passed to Transaction / market.place_order
 customer_strategy_ref = None
@@ -13,10 +25,28 @@ current_time = None  # used for simulation
 
 raise_errors = False  # used for call_check_market / call_process_market_book
 
+# handler queue back pressure policy (live), None or 'drop_stale_market_books'
+handler_queue_policy = None
+
 max_execution_workers = 32  # max number of workers in execution thread pool
+# execution thread pool priority per package type (lower first), None is FIFO
+# e.g. {"Cancel": 0, "Replace": 1, "Update": 2, "Place": 3}, overridden by client.execution_priorities
+execution_priorities = None
+# execution http sessions connected at startup and kept alive in the background (live)
+http_session_warm_count = 0
 
 async_place_orders = False  # async place orders
 
+# collapse a cancel and place on the same runner in a transaction into a replace (betfair)
+collapse_cancel_place = False
+
+# merge compatible betfair order packages received within n seconds (e.g. 0.002)
+execution_batch_window = None
+
+# execute betfair order packages as coroutines on an asyncio event loop thread (requires aiohttp)
+asyncio_execution = False
+max_asyncio_connections = 100  # max in flight asyncio requests
+
 # latencies used for simulation
 place_latency = 0.120
 cancel_latency = 0.170
@@ -36,7 +36,7 @@ class BaseEvent:
     EVENT_TYPE = None
     QUEUE_TYPE = None
 
-    __slots__ = ["_time_created", "event", "venue", "callback"]
+    __slots__ = ["_time_created", "_time_queued", "event", "venue", "callback"]
 
     def __init__(self, event, venue: VenueType = VenueType.BETFAIR):
         self._time_created = datetime.datetime.now(datetime.timezone.utc)
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncioEngine:
+    """
+    Dedicated thread running an asyncio event loop
+    with a shared aiohttp session, order packages
+    are executed as coroutines allowing many in
+    flight requests without a thread per request.
+    """
+
+    def __init__(self, name: str, max_connections: int = 100):
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for asyncio execution")
+        self.name = name
+        self.max_connections = max_connections
+        self.loop = asyncio.new_event_loop()
+        self.in_flight = 0
+        self._http_session = None
+        self._thread = threading.Thread(name=name, target=self._run, daemon=True)
+
+    def start(self) -> None:
+        logger.info("Starting AsyncioEngine %s", self.name)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro) -> Future:
+        """Threadsafe, schedules coroutine on the event loop"""
+        return asyncio.run_coroutine_threadsafe(self._track(coro), self.loop)
+
+    async def _track(self, coro):
+        self.in_flight += 1
+        try:
+            return await coro
+        finally:
+            self.in_flight -= 1
+
+    async def post(
+        self,
+        url: str,
+        data: str,
+        headers: dict,
+        connect_timeout: float,
+        read_timeout: float,
+    ) -> tuple:
+        """Returns response status code and content"""
+        if self._http_session is None:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections)
+            )
+        async with self._http_session.post(
+            url,
+            data=data,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=connect_timeout, sock_read=read_timeout
+            ),
+        ) as response:
+            return response.status, await response.read()
+
+    async def _close(self) -> None:
+        tasks = [
+            t
+            for t in asyncio.all_tasks(self.loop)
+            if t is not asyncio.current_task(self.loop)
+        ]
+        if tasks:
+            await asyncio.wait(tasks)
+        if self._http_session:
+            await self._http_session.close()
+
+    def shutdown(self, timeout: float = 30) -> None:
+        logger.info("Shutting down AsyncioEngine %s", self.name)
+        if self._thread.is_alive():
+            # wait for in flight requests
+            asyncio.run_coroutine_threadsafe(self._close(), self.loop).result(timeout)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+        self.loop.close()
+
+    @property
+    def info(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "max_connections": self.max_connections,
+        }
@@ -1,15 +1,20 @@
 import time
 import logging
+import threading
 import requests
-from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from .. import config
 from ..order.orderpackage import BaseOrderPackage, OrderPackageType, BaseOrder
 from ..events.events import OrderEvent
+from .prioritypool import PriorityThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
 MAX_SESSION_AGE = 200  # seconds since last request
+SESSION_REFRESH_AGE = 60  # seconds since last request before kept alive
+SESSION_WARM_TIMEOUT = 3.05
 BET_ID_START = 100000000000  # simulated start betId->
 
 
@@ -23,6 +28,10 @@ class BaseExecution:
         self._bet_id = BET_ID_START
         self._sessions = []
         self._sessions_created = 0
+        self._sessions_requested = 0
+        self._sessions_reused = 0
+        self._sessions_evicted = 0
+        self._sessions_lock = threading.Lock()  # session counters
 
     def handler(self, order_package: BaseOrderPackage):
         """Handles order_package, capable of place, cancel,
@@ -39,7 +48,7 @@ class BaseExecution:
             func = self.execute_replace
         else:
             raise NotImplementedError()
-        self._thread_pool.submit(func, order_package, http_session)
+        self._submit(func, order_package, http_session)
         logger.info(
             "Thread pool submit",
             extra={
@@ -54,6 +63,26 @@ class BaseExecution:
             },
         )
 
+    def _submit(self, func: Callable, order_package: BaseOrderPackage, *args) -> Future:
+        """Submits func to the thread pool, prioritised by
+        package type if execution priorities are enabled
+        (client.execution_priorities or
+        config.execution_priorities).
+        """
+        if isinstance(self._thread_pool, PriorityThreadPoolExecutor):
+            lane = order_package.package_type.value
+            priorities = (
+                order_package.client.execution_priorities or config.execution_priorities
+            )
+            return self._thread_pool.submit(
+                func,
+                order_package,
+                *args,
+                priority=priorities.get(lane, 0) if priorities else 0,
+                lane=lane,
+            )
+        return self._thread_pool.submit(func, order_package, *args)
+
     def execute_place(
         self, order_package: BaseOrderPackage, http_session: requests.Session
     ) -> None:
@@ -75,6 +104,8 @@ class BaseExecution:
         raise NotImplementedError
 
     def _get_http_session(self) -> requests.Session:
+        with self._sessions_lock:
+            self._sessions_requested += 1
         while self._sessions:
             try:
                 _session = self._sessions.pop(0)
@@ -82,6 +113,8 @@ class BaseExecution:
                     self._return_http_session(_session, err=True)
                     continue
                 else:
+                    with self._sessions_lock:
+                        self._sessions_reused += 1
                     return _session
             except IndexError:
                 continue
@@ -91,7 +124,8 @@ class BaseExecution:
         session = requests.Session()
         session.time_created = time.time()
         session.time_returned = time.time()
-        self._sessions_created += 1
+        with self._sessions_lock:
+            self._sessions_created += 1
         logger.info(
             "New requests.Session created",
             extra={
@@ -119,11 +153,96 @@ class BaseExecution:
                     "err": err,
                 },
             )
+            with self._sessions_lock:
+                self._sessions_evicted += 1
             del http_session
         else:
             http_session.time_returned = time.time()
             self._sessions.append(http_session)
 
+    def refresh_http_sessions(self, warm_count: int) -> None:
+        """Keeps idle sessions alive and tops up the pool
+        to `warm_count` sessions (connected to every venue
+        url used by the clients) so that connection setup
+        is not paid on the order path, called from a
+        background worker.
+        """
+        urls = self.http_session_urls
+        if not urls:
+            return
+        for http_session in list(self._sessions):
+            if (time.time() - http_session.time_returned) > SESSION_REFRESH_AGE:
+                try:
+                    self._sessions.remove(http_session)
+                except ValueError:
+                    continue  # taken by execution thread
+                warmed = self._warm_http_session(http_session, urls)
+                self._return_http_session(http_session, err=not warmed)
+        for _ in range(min(warm_count, self._max_workers) - len(self._sessions)):
+            http_session = self._create_new_session()
+            warmed = self._warm_http_session(http_session, urls)
+            self._return_http_session(http_session, err=not warmed)
+            if not warmed:
+                break
+
+    @staticmethod
+    def _warm_http_session(http_session: requests.Session, urls: list) -> bool:
+        # any response leaves a keep-alive connection (per host) in the session pool
+        for url in urls:
+            try:
+                http_session.head(url, timeout=SESSION_WARM_TIMEOUT)
+            except requests.RequestException as e:
+                logger.warning(
+                    "Unable to warm requests.Session",
+                    extra={"session": http_session, "url": url, "exception": e},
+                )
+                return False
+        return True
+
+    @property
+    def http_session_urls(self) -> list:
+        # distinct client urls used to warm / keep alive sessions
+        return []
+
+    @property
+    def http_session_info(self) -> dict:
+        with self._sessions_lock:
+            requested, reused = self._sessions_requested, self._sessions_reused
+            created, evicted = self._sessions_created, self._sessions_evicted
+        return {
+            "live_sessions_count": len(self._sessions),
+            "sessions_created": created,
+            "sessions_reused": reused,
+            "sessions_evicted": evicted,
+            "sessions_requested": requested,
+            "reuse_ratio": round(reused / requested, 4) if requested else None,
+        }
+
+    def enable_execution_priorities(self) -> None:
+        """Replaces the thread pool with a PriorityThreadPoolExecutor,
+        order packages are then executed by package type priority
+        (client/config.execution_priorities), called on start.
+        """
+        if not isinstance(self._thread_pool, PriorityThreadPoolExecutor):
+            thread_pool = self._thread_pool
+            self._thread_pool = PriorityThreadPoolExecutor(
+                max_workers=self._max_workers
+            )
+            thread_pool.shutdown(wait=False)
+
+    def reset_thread_pool_info(self) -> Optional[dict]:
+        """Returns thread pool info and resets max
+        depth and per package type queue times.
+        """
+        if isinstance(self._thread_pool, PriorityThreadPoolExecutor):
+            return self._thread_pool.reset()
+
+    @property
+    def thread_pool_info(self) -> Optional[dict]:
+        # only recorded when execution priorities are enabled
+        if isinstance(self._thread_pool, PriorityThreadPoolExecutor):
+            return self._thread_pool.info
+
     def _order_logger(
         self, order: BaseOrder, instruction_report, package_type: OrderPackageType
     ):
@@ -142,7 +261,7 @@ class BaseExecution:
             dt = False if order.async_ and not order.simulated else True
             order.responses.placed(instruction_report, dt=dt)
             if instruction_report.bet_id:
-                order.bet_id = instruction_report.bet_id
+                self._update_bet_id(order, instruction_report.bet_id)
                 self.flumine.log_control(OrderEvent(order, venue=order.VENUE))
         elif package_type == OrderPackageType.CANCEL:
             order.responses.cancelled(instruction_report)
@@ -150,9 +269,15 @@ class BaseExecution:
             order.responses.updated(instruction_report)
         elif package_type == OrderPackageType.REPLACE:
             order.responses.placed(instruction_report)
-            order.bet_id = instruction_report.bet_id
+            self._update_bet_id(order, instruction_report.bet_id)
             self.flumine.log_control(OrderEvent(order, venue=order.VENUE))
 
+    def _update_bet_id(self, order: BaseOrder, bet_id: str) -> None:
+        order.bet_id = bet_id
+        market = self.flumine.markets.markets.get(order.market_id)
+        if market:
+            market.blotter.update_bet_id(order)
+
     def shutdown(self):
         logger.info("Shutting down Execution (%s)" % self.__class__.__name__)
         self._thread_pool.shutdown(wait=True)
@@ -0,0 +1,151 @@
+import time
+import logging
+import threading
+from collections import deque
+from typing import Callable
+
+from ..order.orderpackage import BaseOrderPackage
+
+logger = logging.getLogger(__name__)
+
+
+class OrderPackageBatcher:
+    """
+    Micro batching of order packages, compatible
+    packages (same client, market, package type,
+    market version, customer strategy ref and async)
+    received within `window` seconds are merged into
+    a single package (up to the venue order limit)
+    before being passed to `handler`.
+
+    Orders are shared with the merged package so
+    instruction reports are processed against the
+    original orders.
+    """
+
+    def __init__(self, handler: Callable, window: float):
+        self.handler = handler
+        self.window = window
+        self.packages_received = 0
+        self.packages_sent = 0
+        self._pending = {}  # key: [<OrderPackage>, ..]
+        self._deadlines = deque()  # (deadline, key, batch) in window order
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread = threading.Thread(
+            name="OrderPackageBatcher", target=self._run, daemon=True
+        )
+
+    def start(self) -> None:
+        logger.info("Starting OrderPackageBatcher", extra={"window": self.window})
+        self._running = True
+        self._thread.start()
+
+    def add(self, order_package: BaseOrderPackage) -> None:
+        key = self._key(order_package)
+        limit = order_package.order_limit(order_package.package_type)
+        flush = None
+        with self._condition:
+            self.packages_received += 1
+            batch = self._pending.get(key)
+            if (
+                batch
+                and sum(len(p._orders) for p in batch) + len(order_package._orders)
+                > limit
+            ):
+                flush = self._pending.pop(key)
+                batch = None
+            if batch:
+                batch.append(order_package)
+            else:
+                batch = self._pending[key] = [order_package]
+                self._deadlines.append((time.monotonic() + self.window, key, batch))
+                self._condition.notify()
+        if flush:
+            self._dispatch(flush)
+
+    def _run(self) -> None:
+        while self._running:
+            with self._condition:
+                if not self._deadlines:
+                    self._condition.wait()
+                    continue
+                deadline, key, batch = self._deadlines[0]
+                timeout = deadline - time.monotonic()
+                if timeout > 0:
+                    self._condition.wait(timeout)
+                    continue
+                self._deadlines.popleft()
+                if self._pending.get(key) is not batch:
+                    continue  # flushed on limit
+                del self._pending[key]
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: list) -> None:
+        try:
+            self.handler(self.merge(batch))
+        except Exception as e:
+            logger.error(
+                "OrderPackageBatcher dispatch error",
+                extra={"order_packages": [p.info for p in batch], "exception": e},
+                exc_info=True,
+            )
+        self.packages_sent += 1
+
+    @staticmethod
+    def merge(batch: list) -> BaseOrderPackage:
+        if len(batch) == 1:
+            return batch[0]
+        first = batch[0]
+        order_package = first.__class__(
+            client=first.client,
+            market_id=first.market_id,
+            orders=[order for p in batch for order in p._orders],
+            package_type=first.package_type,
+            bet_delay=first.bet_delay,
+            async_=first.async_,
+            market_version=first._market_version,
+            customer_strategy_ref=first.customer_strategy_ref,
+        )
+        # latency measured from the first package
+        order_package._time_created = min(p._time_created for p in batch)
+        logger.info(
+            "Order packages merged",
+            extra={
+                "order_package": order_package.info,
+                "merged_order_packages": [p.id for p in batch],
+            },
+        )
+        return order_package
+
+    @staticmethod
+    def _key(order_package: BaseOrderPackage) -> tuple:
+        return (
+            order_package.client,
+            order_package.market_id,
+            order_package.package_type,
+            order_package._market_version,
+            order_package.customer_strategy_ref,
+            order_package.async_,
+        )
+
+    def shutdown(self) -> None:
+        logger.info("Shutting down OrderPackageBatcher")
+        with self._condition:
+            self._running = False
+            batches = list(self._pending.values())
+            self._pending.clear()
+            self._deadlines.clear()
+            self._condition.notify()
+        for batch in batches:
+            self._dispatch(batch)
+        if self._thread.is_alive():
+            self._thread.join()
+
+    @property
+    def info(self) -> dict:
+        return {
+            "window": self.window,
+            "packages_received": self.packages_received,
+            "packages_sent": self.packages_sent,
+        }
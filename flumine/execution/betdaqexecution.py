@@ -240,7 +240,7 @@ class BetdaqExecution(BaseExecution):
             dt = True if status else False
             order.responses.placed(instruction_report, dt=dt)
             if order_id:
-                order.bet_id = order_id
+                self._update_bet_id(order, order_id)
                 self.flumine.log_control(OrderEvent(order, venue=order.VENUE))
         elif package_type == OrderPackageType.CANCEL:
             order.responses.cancelled(instruction_report)
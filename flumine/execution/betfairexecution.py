@@ -1,64 +1,114 @@
+import time
+import asyncio
 import logging
+import threading
 import requests
-from typing import Callable
-from betfairlightweight import BetfairError
+from typing import Callable, Optional
+from betfairlightweight import BetfairError, resources
+from betfairlightweight.compat import json
+from betfairlightweight.exceptions import APIError, InvalidResponse, StatusCodeError
+from betfairlightweight.utils import clean_locals
 
 from .baseexecution import BaseExecution
+from .asyncioengine import AsyncioEngine
+from .batcher import OrderPackageBatcher
 from ..clients.clients import VenueType
 from ..order.orderpackage import BaseOrderPackage, OrderPackageType
 from ..exceptions import OrderExecutionError
+from .. import config
 
 logger = logging.getLogger(__name__)
 
+# package_type: (trading function, api method, response resource)
+ASYNCIO_REQUESTS = {
+    OrderPackageType.PLACE: ("place", "placeOrders", resources.PlaceOrders),
+    OrderPackageType.CANCEL: ("cancel", "cancelOrders", resources.CancelOrders),
+    OrderPackageType.UPDATE: ("update", "updateOrders", resources.UpdateOrders),
+    OrderPackageType.REPLACE: ("replace", "replaceOrders", resources.ReplaceOrders),
+}
+
 
 class BetfairExecution(BaseExecution):
     VENUE = VenueType.BETFAIR
 
+    def __init__(self, flumine, max_workers: int = config.max_execution_workers):
+        super(BetfairExecution, self).__init__(flumine, max_workers=max_workers)
+        self._asyncio_engine = None
+        self._asyncio_lock = threading.Lock()
+        self._batcher = None
+        self._batcher_lock = threading.Lock()
+
+    def handler(self, order_package: BaseOrderPackage):
+        """Handles order_package, merged with compatible
+        packages if config.execution_batch_window before
+        being executed.
+        """
+        if config.execution_batch_window and order_package.retry_count == 0:
+            self._get_batcher().add(order_package)
+        else:
+            self._execute_handler(order_package)
+
+    def _execute_handler(self, order_package: BaseOrderPackage) -> None:
+        # executed as a coroutine on the asyncio engine if
+        # config.asyncio_execution otherwise thread pool
+        if config.asyncio_execution:
+            asyncio_engine = self._get_asyncio_engine()
+            if asyncio_engine:
+                self._asyncio_handler(order_package, asyncio_engine)
+                return
+        super(BetfairExecution, self).handler(order_package)
+
     def execute_place(
         self, order_package: BaseOrderPackage, http_session: requests.Session
     ) -> None:
         response = self._execution_helper(self.place, order_package, http_session)
         if response:
-            for order, instruction_report in zip(
-                order_package, response.place_instruction_reports
-            ):
-                with order.trade:
-                    self._order_logger(
-                        order, instruction_report, OrderPackageType.PLACE
-                    )
-                    if instruction_report.status == "SUCCESS":
-                        if instruction_report.order_status == "PENDING":
-                            pass  # async request pending processing
-                        elif instruction_report.order_status == "EXPIRED":
-                            # avoids setting FOK orders to executable after process.py set them as complete
-                            order.execution_complete()
-                        else:
-                            order.executable()  # let process.py pick it up
-                    elif instruction_report.status == "FAILURE":
-                        if (
-                            order.current_order.bet_id is None
-                        ):  # Must check this one, not order.bet_id
-                            # If the bet id has not been assigned to the failed order, order stream update
-                            # will never be sent for process.py to pick up. Therefore, the order must be
-                            # invalidated here and now.
-                            order.current_order.size_remaining = 0.0
+            self._process_place(order_package, response)
+
+    def _process_place(self, order_package: BaseOrderPackage, response) -> None:
+        for order, instruction_report in zip(
+            order_package, response.place_instruction_reports
+        ):
+            with order.trade:
+                self._order_logger(order, instruction_report, OrderPackageType.PLACE)
+                if instruction_report.status == "SUCCESS":
+                    if instruction_report.order_status == "PENDING":
+                        pass  # async request pending processing
+                    elif instruction_report.order_status == "EXPIRED":
+                        # avoids setting FOK orders to executable after process.py set them as complete
                         order.execution_complete()
-                    elif instruction_report.status == "TIMEOUT":
-                        # https://docs.developer.betfair.com/display/1smk3cen4v3lu3yomq5qye0ni/Betting+Enums#BettingEnums-ExecutionReportStatus
-                        pass
+                    else:
+                        order.executable()  # let process.py pick it up
+                elif instruction_report.status == "FAILURE":
+                    if (
+                        order.current_order.bet_id is None
+                    ):  # Must check this one, not order.bet_id
+                        # If the bet id has not been assigned to the failed order, order stream update
+                        # will never be sent for process.py to pick up. Therefore, the order must be
+                        # invalidated here and now.
+                        order.current_order.size_remaining = 0.0
+                    order.execution_complete()
+                elif instruction_report.status == "TIMEOUT":
+                    # https://docs.developer.betfair.com/display/1smk3cen4v3lu3yomq5qye0ni/Betting+Enums#BettingEnums-ExecutionReportStatus
+                    pass
 
-            # update transaction counts
-            order_package.client.add_transaction(len(order_package))
+        # update transaction counts
+        order_package.client.add_transaction(len(order_package))
 
     def place(self, order_package: BaseOrderPackage, session: requests.Session):
         return order_package.client.betting_client.betting.place_orders(
+            session=session, **self._place_kwargs(order_package)
+        )
+
+    @staticmethod
+    def _place_kwargs(order_package: BaseOrderPackage) -> dict:
+        return dict(
             market_id=order_package.market_id,
             instructions=order_package.place_instructions,
             customer_ref=order_package.id.hex,
             market_version=order_package.market_version,
             customer_strategy_ref=order_package.customer_strategy_ref,
             async_=order_package.async_,
-            session=session,
         )
 
     def execute_cancel(
@@ -66,45 +116,50 @@ class BetfairExecution(BaseExecution):
     ) -> None:
         response = self._execution_helper(self.cancel, order_package, http_session)
         if response:
-            failed_transaction_count = 0
-            order_lookup = {o.bet_id: o for o in order_package}
-            for instruction_report in response.cancel_instruction_reports:
-                # get order (can't rely on the order they are returned)
-                order = order_lookup.pop(instruction_report.instruction.bet_id)
-                with order.trade:
-                    self._order_logger(
-                        order, instruction_report, OrderPackageType.CANCEL
-                    )
-                    if instruction_report.status == "SUCCESS":
-                        if (
-                            instruction_report.size_cancelled == order.size_remaining
-                            or order.size_remaining
-                            == 0  # handle orders stream update / race condition
-                        ):
-                            order.execution_complete()
-                        else:
-                            order.executable()
-                    elif instruction_report.status == "FAILURE":
-                        if instruction_report.error_code == "BET_TAKEN_OR_LAPSED":
-                            order.execution_complete()
-                        else:
-                            order.executable()
-                        failed_transaction_count += 1
-                    elif instruction_report.status == "TIMEOUT":
-                        order.executable()
+            self._process_cancel(order_package, response)
 
-            # reset any not returned so that they can be picked back up
-            for order in order_lookup.values():
-                with order.trade:
+    def _process_cancel(self, order_package: BaseOrderPackage, response) -> None:
+        failed_transaction_count = 0
+        order_lookup = {o.bet_id: o for o in order_package}
+        for instruction_report in response.cancel_instruction_reports:
+            # get order (can't rely on the order they are returned)
+            order = order_lookup.pop(instruction_report.instruction.bet_id)
+            with order.trade:
+                self._order_logger(order, instruction_report, OrderPackageType.CANCEL)
+                if instruction_report.status == "SUCCESS":
+                    if (
+                        instruction_report.size_cancelled == order.size_remaining
+                        or order.size_remaining
+                        == 0  # handle orders stream update / race condition
+                    ):
+                        order.execution_complete()
+                    else:
+                        order.executable()
+                elif instruction_report.status == "FAILURE":
+                    if instruction_report.error_code == "BET_TAKEN_OR_LAPSED":
+                        order.execution_complete()
+                    else:
+                        order.executable()
+                    failed_transaction_count += 1
+                elif instruction_report.status == "TIMEOUT":
                     order.executable()
 
-            # update transaction counts
-            if failed_transaction_count:
-                order_package.client.add_transaction(
-                    failed_transaction_count, failed=True
-                )
+        # reset any not returned so that they can be picked back up
+        for order in order_lookup.values():
+            with order.trade:
+                order.executable()
+
+        # update transaction counts
+        if failed_transaction_count:
+            order_package.client.add_transaction(failed_transaction_count, failed=True)
 
     def cancel(self, order_package: BaseOrderPackage, session: requests.Session):
+        return order_package.client.betting_client.betting.cancel_orders(
+            session=session, **self._cancel_kwargs(order_package)
+        )
+
+    @staticmethod
+    def _cancel_kwargs(order_package: BaseOrderPackage) -> dict:
         # temp copy to prevent an empty list of instructions sent
         # this can occur if order is matched during the execution
         # cycle, resulting in all orders being cancelled!
@@ -112,11 +167,10 @@ class BetfairExecution(BaseExecution):
         if not cancel_instructions:
             logger.warning("Empty cancel_instructions", extra=order_package.info)
             raise OrderExecutionError()
-        return order_package.client.betting_client.betting.cancel_orders(
+        return dict(
             market_id=order_package.market_id,
             instructions=cancel_instructions,
             customer_ref=order_package.id.hex,
-            session=session,
         )
 
     def execute_update(
@@ -124,34 +178,38 @@ class BetfairExecution(BaseExecution):
     ) -> None:
         response = self._execution_helper(self.update, order_package, http_session)
         if response:
-            failed_transaction_count = 0
-            for order, instruction_report in zip(
-                order_package, response.update_instruction_reports
-            ):
-                with order.trade:
-                    self._order_logger(
-                        order, instruction_report, OrderPackageType.UPDATE
-                    )
-                    if instruction_report.status == "SUCCESS":
-                        order.executable()
-                    elif instruction_report.status == "FAILURE":
-                        order.executable()
-                        failed_transaction_count += 1
-                    elif instruction_report.status == "TIMEOUT":
-                        order.executable()
+            self._process_update(order_package, response)
 
-            # update transaction counts
-            if failed_transaction_count:
-                order_package.client.add_transaction(
-                    failed_transaction_count, failed=True
-                )
+    def _process_update(self, order_package: BaseOrderPackage, response) -> None:
+        failed_transaction_count = 0
+        for order, instruction_report in zip(
+            order_package, response.update_instruction_reports
+        ):
+            with order.trade:
+                self._order_logger(order, instruction_report, OrderPackageType.UPDATE)
+                if instruction_report.status == "SUCCESS":
+                    order.executable()
+                elif instruction_report.status == "FAILURE":
+                    order.executable()
+                    failed_transaction_count += 1
+                elif instruction_report.status == "TIMEOUT":
+                    order.executable()
+
+        # update transaction counts
+        if failed_transaction_count:
+            order_package.client.add_transaction(failed_transaction_count, failed=True)
 
     def update(self, order_package: BaseOrderPackage, session: requests.Session):
         return order_package.client.betting_client.betting.update_orders(
+            session=session, **self._update_kwargs(order_package)
+        )
+
+    @staticmethod
+    def _update_kwargs(order_package: BaseOrderPackage) -> dict:
+        return dict(
             market_id=order_package.market_id,
             instructions=order_package.update_instructions,
             customer_ref=order_package.id.hex,
-            session=session,
         )
 
     def execute_replace(
@@ -159,37 +217,37 @@ class BetfairExecution(BaseExecution):
     ) -> None:
         response = self._execution_helper(self.replace, order_package, http_session)
         if response:
-            failed_transaction_count = 0
-            market = self.flumine.markets.markets[order_package.market_id]
-            for order, instruction_report in zip(
-                order_package, response.replace_instruction_reports
-            ):
-                with order.trade:
-                    # process cancel response
-                    if (
-                        instruction_report.cancel_instruction_reports.status
-                        == "SUCCESS"
-                    ):
-                        self._order_logger(
-                            order,
-                            instruction_report.cancel_instruction_reports,
-                            OrderPackageType.CANCEL,
-                        )
-                        order.execution_complete()
-                    elif (
-                        instruction_report.cancel_instruction_reports.status
-                        == "FAILURE"
-                    ):
-                        order.executable()
-                        failed_transaction_count += 1
-                    elif (
-                        instruction_report.cancel_instruction_reports.status
-                        == "TIMEOUT"
-                    ):
-                        order.executable()
+            self._process_replace(order_package, response)
+
+    def _process_replace(self, order_package: BaseOrderPackage, response) -> None:
+        failed_transaction_count = 0
+        market = self.flumine.markets.markets[order_package.market_id]
+        for order, instruction_report in zip(
+            order_package, response.replace_instruction_reports
+        ):
+            with order.trade:
+                # cancel and place collapsed in the transaction
+                replacement_order, order.replacement_order = (
+                    order.replacement_order,
+                    None,
+                )
+                # process cancel response
+                if instruction_report.cancel_instruction_reports.status == "SUCCESS":
+                    self._order_logger(
+                        order,
+                        instruction_report.cancel_instruction_reports,
+                        OrderPackageType.CANCEL,
+                    )
+                    order.execution_complete()
+                elif instruction_report.cancel_instruction_reports.status == "FAILURE":
+                    order.executable()
+                    failed_transaction_count += 1
+                elif instruction_report.cancel_instruction_reports.status == "TIMEOUT":
+                    order.executable()
 
-                    # process place response
-                    if instruction_report.place_instruction_reports.status == "SUCCESS":
+                # process place response
+                if instruction_report.place_instruction_reports.status == "SUCCESS":
+                    if replacement_order is None:
                         # create new order
                         replacement_order = order.trade.create_order_replacement(
                             order,
@@ -206,31 +264,79 @@ class BetfairExecution(BaseExecution):
                         market.place_order(
                             replacement_order, execute=False, client=order.client
                         )
-                        replacement_order.executable()
-                    elif (
-                        instruction_report.place_instruction_reports.status == "FAILURE"
-                    ):
-                        pass  # todo
-                    elif (
-                        instruction_report.place_instruction_reports.status == "TIMEOUT"
-                    ):
-                        pass  # todo
+                    else:
+                        # size remaining at cancel (order matched since transaction)
+                        size = (
+                            instruction_report.place_instruction_reports.instruction.limit_order.size
+                        )
+                        if size != replacement_order.order_type.size:
+                            logger.warning(
+                                "Replacement order size differs from placed size",
+                                extra={
+                                    "bet_id": order.bet_id,
+                                    "order_id": replacement_order.id,
+                                    "size": replacement_order.order_type.size,
+                                    "placed_size": size,
+                                },
+                            )
+                            replacement_order.order_type.size = size
+                        self._order_logger(
+                            replacement_order,
+                            instruction_report.place_instruction_reports,
+                            OrderPackageType.REPLACE,
+                        )
+                    replacement_order.executable()
+                elif replacement_order is None:
+                    pass  # todo FAILURE/TIMEOUT
+                elif instruction_report.cancel_instruction_reports.status == "FAILURE":
+                    # place as requested in the transaction
+                    self._place_replacement_order(order_package, replacement_order)
+                else:
+                    replacement_order.execution_complete()
 
-            # update transaction counts
-            order_package.client.add_transaction(len(order_package))
-            if failed_transaction_count:
-                order_package.client.add_transaction(
-                    failed_transaction_count, failed=True
-                )
+        # orders complete before the request was sent
+        for order in order_package:
+            if order.replacement_order is not None:
+                with order.trade:
+                    replacement_order, order.replacement_order = (
+                        order.replacement_order,
+                        None,
+                    )
+                    self._place_replacement_order(order_package, replacement_order)
+
+        # update transaction counts
+        order_package.client.add_transaction(len(order_package))
+        if failed_transaction_count:
+            order_package.client.add_transaction(failed_transaction_count, failed=True)
+
+    def _place_replacement_order(
+        self, order_package: BaseOrderPackage, replacement_order
+    ) -> None:
+        self.handler(
+            order_package.__class__(
+                client=order_package.client,
+                market_id=order_package.market_id,
+                orders=[replacement_order],
+                package_type=OrderPackageType.PLACE,
+                bet_delay=order_package.bet_delay,
+                market_version=order_package._market_version,
+                customer_strategy_ref=order_package.customer_strategy_ref,
+            )
+        )
 
     def replace(self, order_package: BaseOrderPackage, session: requests.Session):
         return order_package.client.betting_client.betting.replace_orders(
+            session=session, **self._replace_kwargs(order_package)
+        )
+
+    @staticmethod
+    def _replace_kwargs(order_package: BaseOrderPackage) -> dict:
+        return dict(
             market_id=order_package.market_id,
             instructions=order_package.replace_instructions,
             customer_ref=order_package.id.hex,
             market_version=order_package.market_version,
             async_=order_package.async_,
-            session=session,
         )
 
     def _execution_helper(
@@ -266,15 +372,7 @@ class BetfairExecution(BaseExecution):
                     },
                     exc_info=True,
                 )
-                if order_package.retry():
-                    self.handler(order_package)
-                else:
-                    # reset orders
-                    if order_package.package_type == OrderPackageType.PLACE:
-                        order_package.reset_orders(complete=True)
-                    else:
-                        order_package.reset_orders()
-
+                self._retry_or_reset(order_package)
                 self._return_http_session(http_session, err=True)
                 return
             except Exception as e:
@@ -307,3 +405,189 @@ class BetfairExecution(BaseExecution):
         else:
             logger.warning("Empty package, not executing", extra=order_package.info)
             self._return_http_session(http_session)
+
+    def _retry_or_reset(self, order_package: BaseOrderPackage) -> None:
+        if order_package.retry():
+            self.handler(order_package)
+        else:
+            # reset orders
+            if order_package.package_type == OrderPackageType.PLACE:
+                order_package.reset_orders(complete=True)
+            else:
+                order_package.reset_orders()
+
+    @property
+    def http_session_urls(self) -> list:
+        urls = []
+        for client in self.flumine.clients:
+            if client.execution is self and client.betting_client:
+                url = client.betting_client.betting.url
+                if url not in urls:
+                    urls.append(url)
+        return urls
+
+    def _get_batcher(self) -> OrderPackageBatcher:
+        if self._batcher is None:
+            with self._batcher_lock:
+                if self._batcher is None:
+                    batcher = OrderPackageBatcher(
+                        self._execute_handler, config.execution_batch_window
+                    )
+                    batcher.start()
+                    self._batcher = batcher
+        return self._batcher
+
+    # asyncio execution (config.asyncio_execution)
+
+    def _get_asyncio_engine(self) -> Optional[AsyncioEngine]:
+        if self._asyncio_engine is None:
+            with self._asyncio_lock:
+                if self._asyncio_engine is None:
+                    try:
+                        asyncio_engine = AsyncioEngine(
+                            "BetfairExecutionAsyncio",
+                            max_connections=config.max_asyncio_connections,
+                        )
+                    except ImportError:
+                        logger.error(
+                            "aiohttp not installed, using thread pool execution",
+                            exc_info=True,
+                        )
+                        asyncio_engine = False
+                    else:
+                        asyncio_engine.start()
+                    self._asyncio_engine = asyncio_engine
+        return self._asyncio_engine
+
+    def _asyncio_handler(
+        self, order_package: BaseOrderPackage, asyncio_engine: AsyncioEngine
+    ) -> None:
+        if order_package.package_type not in ASYNCIO_REQUESTS:
+            raise NotImplementedError()
+        asyncio_engine.submit(self._execute_async(order_package, asyncio_engine))
+        logger.info(
+            "Asyncio submit",
+            extra={
+                "trading_function": ASYNCIO_REQUESTS[order_package.package_type][0],
+                "latency": round(order_package.elapsed_seconds, 4),
+                "order_package": order_package.info,
+                "asyncio": asyncio_engine.info,
+            },
+        )
+
+    async def _execute_async(
+        self, order_package: BaseOrderPackage, asyncio_engine: AsyncioEngine
+    ) -> None:
+        """Coroutine equivalent of execute_<trading_function>
+        and _execution_helper.
+        """
+        trading_function, method, resource = ASYNCIO_REQUESTS[
+            order_package.package_type
+        ]
+        if order_package.elapsed_seconds > 0.1 and order_package.retry_count == 0:
+            logger.warning(
+                "High latency between current time and OrderPackage creation time",
+                extra={
+                    "trading_function": trading_function,
+                    "latency": round(order_package.elapsed_seconds, 3),
+                    "order_package": order_package.info,
+                    "asyncio": asyncio_engine.info,
+                },
+            )
+        if not order_package.orders:
+            logger.warning("Empty package, not executing", extra=order_package.info)
+            return
+        try:
+            response = await self._request_async(
+                order_package, asyncio_engine, trading_function, method, resource
+            )
+        except BetfairError as e:
+            logger.error(
+                "Execution error",
+                extra={
+                    "trading_function": trading_function,
+                    "response": e,
+                    "order_package": order_package.info,
+                },
+                exc_info=True,
+            )
+            # retry back-off sleeps so run outside of the event loop
+            await asyncio.wrap_future(
+                self._submit(self._retry_or_reset, order_package),
+                loop=asyncio_engine.loop,
+            )
+            return
+        except Exception as e:
+            logger.critical(
+                "Execution unknown error",
+                extra={
+                    "trading_function": trading_function,
+                    "exception": e,
+                    "order_package": order_package.info,
+                },
+                exc_info=True,
+            )
+            return
+        logger.info(
+            "execute_%s" % trading_function,
+            extra={
+                "trading_function": trading_function,
+                "elapsed_time": response.elapsed_time,
+                "response": response._data,
+                "order_package": order_package.info,
+                "asyncio": asyncio_engine.info,
+            },
+        )
+        # response processing (order updates, logging and replacement
+        # placing) blocks so run on the thread pool as per execute_<>
+        await asyncio.wrap_future(
+            self._submit(
+                getattr(self, "_process_%s" % trading_function),
+                order_package,
+                response,
+            ),
+            loop=asyncio_engine.loop,
+        )
+
+    async def _request_async(
+        self,
+        order_package: BaseOrderPackage,
+        asyncio_engine: AsyncioEngine,
+        trading_function: str,
+        method: str,
+        resource,
+    ):
+        # mirrors betfairlightweight BaseEndpoint.request/process_response
+        betting = order_package.client.betting_client.betting
+        params = clean_locals(
+            getattr(self, "_%s_kwargs" % trading_function)(order_package)
+        )
+        method = "%s%s" % (betting.URI, method)
+        time_sent = time.time()
+        try:
+            status_code, content = await asyncio_engine.post(
+                betting.url,
+                betting.create_req(method, params),
+                betting.client.request_headers,
+                betting.connect_timeout,
+                betting.read_timeout,
+            )
+        except Exception as e:
+            raise APIError(None, method, params, e)
+        elapsed_time = time.time() - time_sent
+        if status_code != 200:
+            raise StatusCodeError(status_code)
+        try:
+            response_json = json.loads(content.decode("utf-8"))
+        except ValueError:
+            raise InvalidResponse(content)
+        betting._error_handler(response_json, method, params)
+        return betting.process_response(response_json, resource, elapsed_time, None)
+
+    def shutdown(self):
+        if self._batcher:
+            self._batcher.shutdown()
+        if self._asyncio_engine:
+            # in flight requests are processed on the thread pool
+            self._asyncio_engine.shutdown()
+        super(BetfairExecution, self).shutdown()
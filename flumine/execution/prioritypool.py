@@ -0,0 +1,111 @@
+import time
+import heapq
+import queue
+import itertools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from ..profiler import Profiler
+
+SHUTDOWN_PRIORITY = float("inf")  # worker exit sentinel processed last
+
+
+class PriorityWorkQueue(queue.Queue):
+    """
+    Thread pool work queue ordered by priority (lower
+    first, FIFO within a priority) recording queue time
+    (put to get) per lane (order package type).
+
+    The priority and lane of the next work item are set
+    by PriorityThreadPoolExecutor.submit, items put
+    otherwise are 0 (worker exit sentinels last).
+    """
+
+    # called by put/get whilst holding self.mutex
+    def _init(self, maxsize: int) -> None:
+        self.queue = []
+        self.max_depth = 0
+        self._count = itertools.count()  # FIFO tie break
+        self.next_priority = (0, None)  # (priority, lane) of the next work item
+        self._queue_time = Profiler(sample_rate=1)
+
+    def _qsize(self) -> int:
+        return len(self.queue)
+
+    def _put(self, work_item) -> None:
+        if work_item is None:
+            priority, lane = SHUTDOWN_PRIORITY, None
+        else:
+            priority, lane = self.next_priority
+        heapq.heappush(
+            self.queue,
+            (priority, next(self._count), lane, time.monotonic(), work_item),
+        )
+        depth = len(self.queue)
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def _get(self):
+        _, _, lane, time_queued, work_item = heapq.heappop(self.queue)
+        if lane is not None:
+            self._queue_time.add(lane, None, time.monotonic() - time_queued)
+        return work_item
+
+    def reset(self) -> dict:
+        """Returns info and resets max depth
+        and queue timings.
+        """
+        with self.mutex:
+            info = self._info()
+            self.max_depth = len(self.queue)
+            self._queue_time.reset()
+        return info
+
+    @property
+    def info(self) -> dict:
+        with self.mutex:
+            return self._info()
+
+    def _info(self) -> dict:
+        return {
+            "depth": len(self.queue),
+            "max_depth": self.max_depth,
+            "queue_time": self._queue_time.info,
+        }
+
+
+class PriorityThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor using a PriorityWorkQueue so
+    that risk reducing packages (e.g. cancels) are not
+    queued behind a burst of places when all workers
+    are busy.
+    """
+
+    def __init__(self, max_workers: int = None, thread_name_prefix: str = ""):
+        super(PriorityThreadPoolExecutor, self).__init__(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._work_queue = PriorityWorkQueue()
+        self._priority_lock = threading.Lock()
+
+    def submit(
+        self, fn, /, *args, priority: float = 0, lane: str = None, **kwargs
+    ) -> Future:
+        """Submits fn with a priority (lower first) and
+        lane used to record queue time.
+        """
+        with self._priority_lock:
+            self._work_queue.next_priority = (priority, lane)
+            try:
+                return super(PriorityThreadPoolExecutor, self).submit(
+                    fn, *args, **kwargs
+                )
+            finally:
+                self._work_queue.next_priority = (0, None)
+
+    def reset(self) -> dict:
+        return self._work_queue.reset()
+
+    @property
+    def info(self) -> dict:
+        return self._work_queue.info
@@ -8,6 +8,7 @@ from ..order.orderpackage import (
     BetfairOrderPackage,
     BetdaqOrderPackage,
 )
+from ..order.ordertype import OrderTypes
 from ..events import events
 from ..exceptions import ControlError, OrderError
 from ..utils import chunks, get_market_notes
@@ -101,6 +102,29 @@ class Transaction:
             self._pending_orders = True
         return True
 
+    def place_orders(
+        self,
+        orders: list,
+        market_version: int = None,
+        execute: bool = True,
+        force: bool = False,
+    ) -> list:
+        """Place multiple orders, controls are validated
+        per order (as per place_order) with the market
+        exposure calculated once for the batch.
+        Returns a list of place_order results.
+        """
+        blotter = self.market.blotter
+        batch_started = blotter.start_exposure_batch()
+        try:
+            return [
+                self.place_order(order, market_version, execute, force)
+                for order in orders
+            ]
+        finally:
+            if batch_started:
+                blotter.end_exposure_batch()
+
     def cancel_order(
         self, order, size_reduction: float = None, force: bool = False
     ) -> bool:
@@ -189,6 +213,12 @@ class Transaction:
         return True
 
     def execute(self) -> int:
+        if (
+            config.collapse_cancel_place
+            and self._pending_cancel
+            and self._pending_place
+        ):
+            self._collapse_cancel_place()
         packages = []
         if self._pending_place:
             packages += self._create_order_package(
@@ -227,6 +257,66 @@ class Transaction:
             self._pending_orders = False
         return len(packages)
 
+    def _collapse_cancel_place(self) -> None:
+        """Combines a full cancel and a place on the same
+        trade, runner, side and persistence (limit orders,
+        place size equal to the size remaining) into a single
+        replace, the placed order is used as the replacement.
+
+        Betfair places the size remaining at cancel time, if
+        the order is matched before execution the replacement
+        order size is updated on the replace response.
+        """
+        if self._client.VENUE != VenueType.BETFAIR or self._client.paper_trade:
+            return
+        pending_place = defaultdict(list)
+        for place in self._pending_place:
+            if place[0].order_type.ORDER_TYPE == OrderTypes.LIMIT:
+                pending_place[self._replace_key(place[0])].append(place)
+        for cancel in list(self._pending_cancel):
+            order = cancel[0]
+            if (
+                order.order_type.ORDER_TYPE != OrderTypes.LIMIT
+                or order.update_data.get("size_reduction") is not None
+            ):
+                continue
+            places = pending_place.get(self._replace_key(order))
+            for place in places or []:
+                replacement_order, market_version = place
+                if (
+                    replacement_order.order_type.size == order.size_remaining
+                    and replacement_order.order_type.price != order.order_type.price
+                ):
+                    places.remove(place)
+                    self._pending_place.remove(place)
+                    self._pending_cancel.remove(cancel)
+                    order.update_data["new_price"] = replacement_order.order_type.price
+                    order.replacement_order = replacement_order
+                    order.replacing()
+                    self._pending_replace.append((order, market_version))
+                    logger.info(
+                        "Cancel and place collapsed into replace",
+                        extra={
+                            "market_id": self.market.market_id,
+                            "bet_id": order.bet_id,
+                            "order_id": order.id,
+                            "replacement_order_id": replacement_order.id,
+                            "transaction_id": self._id,
+                        },
+                    )
+                    break
+
+    @staticmethod
+    def _replace_key(order) -> tuple:
+        # same trade, responses are processed under the trade lock
+        return (
+            order.trade.id,
+            order.selection_id,
+            order.handicap,
+            order.side,
+            order.order_type.persistence_type,
+        )
+
     def _validate_controls(self, order, package_type: OrderPackageType) -> bool:
         # return False on violation
         try:
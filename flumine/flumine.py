@@ -1,9 +1,10 @@
+import time
 import logging
 
 from .baseflumine import BaseFlumine
 from .clients import BetdaqClient
 from .events.events import EventType
-from . import worker
+from . import config, worker
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,12 @@ class Flumine(BaseFlumine):
             while True:
                 event = handler_queue_get()
                 event_type = event.EVENT_TYPE
+                profiler = self.profiler
+                if profiler and profiler.sample():
+                    profiler.add("handler_queue", None, event.elapsed_seconds)
+                    start = time.perf_counter()
+                else:
+                    profiler = None
 
                 if event_type == MARKET_BOOK_EVENT:
                     self._process_market_books(event)
@@ -63,6 +70,8 @@ class Flumine(BaseFlumine):
                 else:
                     logger.error("Unknown item in handler_queue: %s" % str(event))
 
+                if profiler:
+                    profiler.record("event", event_type, start)
                 del event
 
     def _add_default_workers(self):
@@ -85,6 +94,14 @@ class Flumine(BaseFlumine):
                 start_delay=10,  # wait for streams to populate
             )
         )
+        self.add_worker(
+            worker.BackgroundWorker(
+                self,
+                function=worker.log_handler_queue,
+                interval=60,
+                start_delay=60,
+            )
+        )
         if not all([client.market_recording_mode for client in self.clients]):
             self.add_worker(
                 worker.BackgroundWorker(
@@ -102,6 +119,23 @@ class Flumine(BaseFlumine):
                     start_delay=10,  # wait for login
                 )
             )
+        if self.betfair_execution.thread_pool_info is not None:
+            self.add_worker(
+                worker.BackgroundWorker(
+                    self,
+                    function=worker.log_execution_thread_pool,
+                    interval=60,
+                    start_delay=60,
+                )
+            )
+        if config.http_session_warm_count:
+            self.add_worker(
+                worker.BackgroundWorker(
+                    self,
+                    function=worker.refresh_http_sessions,
+                    interval=30,
+                )
+            )
         if any(isinstance(client, BetdaqClient) for client in self.clients):
             self.add_worker(
                 worker.BackgroundWorker(
@@ -112,6 +146,14 @@ class Flumine(BaseFlumine):
                 )
             )
 
+    @property
+    def info(self) -> dict:
+        info = super(Flumine, self).info
+        info["handler_queue"] = self.handler_queue.info
+        info["http_sessions"] = self.betfair_execution.http_session_info
+        info["execution_thread_pool"] = self.betfair_execution.thread_pool_info
+        return info
+
     def __repr__(self) -> str:
         return "<Flumine>"
 
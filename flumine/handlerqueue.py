@@ -0,0 +1,91 @@
+import time
+import queue
+
+from .events.events import EventType
+from .profiler import Profiler
+from . import config
+
+MARKET_BOOK_EVENT = EventType.MARKET_BOOK
+
+# back pressure policies (config.handler_queue_policy)
+DROP_STALE_MARKET_BOOKS = "drop_stale_market_books"
+
+
+class HandlerQueue(queue.Queue):
+    """
+    Unbounded FIFO handler queue recording depth
+    and event residence time (put to get) with an
+    optional back pressure policy:
+
+        drop_stale_market_books: a queued MarketBook
+        is removed once a newer MarketBook for the
+        same stream/market is queued, the newer book
+        is processed in its own queue position so
+        ordering with other events is maintained.
+    """
+
+    def __init__(self):
+        super(HandlerQueue, self).__init__()
+        self.max_depth = 0
+        self.dropped = 0  # MarketBooks dropped by policy
+        self._residence = Profiler(sample_rate=1)
+        self._market_books = {}  # (stream, market_id): queued MarketBookEvent
+
+    # called by put/get whilst holding self.mutex
+    def _put(self, item) -> None:
+        item._time_queued = time.monotonic()
+        if (
+            config.handler_queue_policy == DROP_STALE_MARKET_BOOKS
+            and item.EVENT_TYPE == MARKET_BOOK_EVENT
+        ):
+            self._drop_stale_market_books(item)
+        self.queue.append(item)
+        depth = len(self.queue)
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def _get(self):
+        item = self.queue.popleft()
+        self._residence.add("residence", None, time.monotonic() - item._time_queued)
+        if self._market_books and item.EVENT_TYPE == MARKET_BOOK_EVENT:
+            for market_book in item.event:
+                key = (market_book.streaming_unique_id, market_book.market_id)
+                if self._market_books.get(key) is item:
+                    del self._market_books[key]
+        return item
+
+    def _drop_stale_market_books(self, event) -> None:
+        market_books = self._market_books
+        for market_book in event.event:
+            key = (market_book.streaming_unique_id, market_book.market_id)
+            queued_event = market_books.get(key)
+            if queued_event is not None and queued_event is not event:
+                # emptied events remain queued (processed as a no-op)
+                queued_event.event[:] = [
+                    m
+                    for m in queued_event.event
+                    if (m.streaming_unique_id, m.market_id) != key
+                ]
+                self.dropped += 1
+            market_books[key] = event
+
+    def reset(self) -> dict:
+        """Returns info and resets max depth,
+        dropped count and residence timings.
+        """
+        with self.mutex:
+            info = self.info
+            self.max_depth = len(self.queue)
+            self.dropped = 0
+            self._residence.reset()
+        return info
+
+    @property
+    def info(self) -> dict:
+        return {
+            "depth": len(self.queue),
+            "max_depth": self.max_depth,
+            "dropped": self.dropped,
+            "policy": config.handler_queue_policy,
+            "residence": self._residence.info.get("residence"),
+        }
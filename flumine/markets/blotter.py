@@ -48,17 +48,45 @@ class Blotter:
         # cached lists/dicts for faster lookup
         self._trades = defaultdict(list)  # {Trade: [Order,]}
         self._trade_lookup = {}  # {Trade.id: Trade}
-        self._live_orders = []
+        self._bet_id_lookup = {}  # {Order.bet_id: Order}
+        self._live_orders = {}  # {Order: None} insertion ordered with O(1) removal
+        self._selection_live_orders = defaultdict(
+            dict
+        )  # {(selectionId, handicap): {Order: None}}
+        # position of the completed orders placed before the first live order
+        self._exposure_ledger = (
+            {}
+        )  # {(Strategy, selectionId, handicap): [count, index, position]}
+        self._exposure_batch = None  # {Strategy: {(selectionId, handicap): profits}}
+        self._strategy_trades = defaultdict(list)  # {Strategy: [Trade,]}
+        self._strategy_runners = defaultdict(dict)  # {Strategy: {lookup: None}}
         self._strategy_orders = defaultdict(list)
         self._strategy_selection_orders = defaultdict(list)
         self._client_orders = defaultdict(list)
         self._client_strategy_orders = defaultdict(list)
+        # status partitioned indexes {key: {OrderStatus: {Order: None}}}
+        self._strategy_status_orders = defaultdict(lambda: defaultdict(dict))
+        self._strategy_selection_status_orders = defaultdict(lambda: defaultdict(dict))
+        self._client_status_orders = defaultdict(lambda: defaultdict(dict))
+        self._client_strategy_status_orders = defaultdict(lambda: defaultdict(dict))
+        self._order_status_indexes = {}  # {Order: (sequence, (status_orders,..))}
 
     def get_order_bet_id(self, bet_id: str) -> Optional[BaseOrder]:
-        try:
-            return self._bet_id_lookup[bet_id]
-        except KeyError:
-            return
+        order = self._bet_id_lookup.get(bet_id)
+        if order is None or order.bet_id != bet_id:
+            # bet_id assigned without update_bet_id, rebuild lookup
+            self._bet_id_lookup = {
+                order.bet_id: order for order in self if order.bet_id is not None
+            }
+            order = self._bet_id_lookup.get(bet_id)
+        return order
+
+    def update_bet_id(self, order) -> None:
+        """Adds order to the bet_id lookup, to be
+        called when order.bet_id is assigned.
+        """
+        if order.bet_id is not None:
+            self._bet_id_lookup[order.bet_id] = order
 
     def get_trade(self, trade_id: str) -> Optional["Trade"]:
         """Returns the Trade with the given trade_id if one exists, else None."""
@@ -70,7 +98,7 @@ class Blotter:
         trade_status: Optional[List] = None,
     ) -> list:
         """Returns all trades related to a strategy."""
-        trades = [t for t in self._trades if t.strategy == strategy]
+        trades = self._strategy_trades[strategy]
         if trade_status:
             return [t for t in trades if t.status in trade_status]
         return trades
@@ -82,9 +110,12 @@ class Blotter:
         matched_only: Optional[bool] = None,
     ) -> list:
         """Returns all orders related to a strategy."""
-        orders = self._strategy_orders[strategy]
         if order_status:
-            orders = [o for o in orders if o.status in order_status]
+            orders = self._get_status_orders(
+                self._strategy_status_orders.get(strategy), order_status
+            )
+        else:
+            orders = self._strategy_orders[strategy]
         if matched_only:
             orders = [o for o in orders if o.size_matched > 0]
         return orders
@@ -98,9 +129,15 @@ class Blotter:
         matched_only: Optional[bool] = None,
     ) -> list:
         """Returns all orders related to a strategy selection."""
-        orders = self._strategy_selection_orders[(strategy, selection_id, handicap)]
         if order_status:
-            orders = [o for o in orders if o.status in order_status]
+            orders = self._get_status_orders(
+                self._strategy_selection_status_orders.get(
+                    (strategy, selection_id, handicap)
+                ),
+                order_status,
+            )
+        else:
+            orders = self._strategy_selection_orders[(strategy, selection_id, handicap)]
         if matched_only:
             orders = [o for o in orders if o.size_matched > 0]
         return orders
@@ -111,9 +148,12 @@ class Blotter:
         order_status: Optional[List[OrderStatus]] = None,
         matched_only: Optional[bool] = None,
     ) -> list:
-        orders = self._client_orders[client]
         if order_status:
-            orders = [o for o in orders if o.status in order_status]
+            orders = self._get_status_orders(
+                self._client_status_orders.get(client), order_status
+            )
+        else:
+            orders = self._client_orders[client]
         if matched_only:
             orders = [o for o in orders if o.size_matched > 0]
         return orders
@@ -125,21 +165,53 @@ class Blotter:
         order_status: Optional[List[OrderStatus]] = None,
         matched_only: Optional[bool] = None,
     ) -> list:
-        orders = self._client_strategy_orders[(client, strategy)]
         if order_status:
-            orders = [o for o in orders if o.status in order_status]
+            orders = self._get_status_orders(
+                self._client_strategy_status_orders.get((client, strategy)),
+                order_status,
+            )
+        else:
+            orders = self._client_strategy_orders[(client, strategy)]
         if matched_only:
             orders = [o for o in orders if o.size_matched > 0]
         return orders
 
+    def _get_status_orders(self, status_orders: Optional[dict], order_status) -> list:
+        """Returns orders from the status partitioned
+        index in blotter (insertion) order.
+        """
+        if not status_orders:
+            return []
+        orders = []
+        for status in set(order_status):
+            orders_with_status = status_orders.get(status)
+            if orders_with_status:
+                orders.extend(orders_with_status)
+        if len(orders) > 1:
+            order_status_indexes = self._order_status_indexes
+            orders.sort(key=lambda o: order_status_indexes[o][0])
+        return orders
+
+    def update_order_status(self, order, old_status: Optional[OrderStatus]) -> None:
+        """Moves order between status partitions,
+        called by BaseOrder._update_status.
+        """
+        for status_orders in self._order_status_indexes[order][1]:
+            del status_orders[old_status][order]
+            status_orders[order.status][order] = None
+
     @property
     def live_orders(self) -> Iterable:
-        return iter(list(self._live_orders))
+        # no copy, use list(blotter.live_orders) if completing orders whilst iterating
+        return iter(self._live_orders)
 
     @property
     def has_live_orders(self) -> bool:
         return bool(self._live_orders)
 
+    def has_live_order(self, order) -> bool:
+        return order in self._live_orders
+
     def process_closed_market(self, market, market_book) -> None:
         number_of_winners = len(
             [runner for runner in market_book.runners if runner.status == "WINNER"]
@@ -194,33 +266,52 @@ class Blotter:
         Optionally include a potential new order to facilitate determining if said order would
         exceed an exposure limit
         """
-        orders = self.strategy_orders(strategy)
-        runners = set([order.lookup for order in orders])
+        batch = self._exposure_batch
+        if batch is not None and exclusion is None:
+            # pending orders have no exposure so runner profits are unchanged within a batch
+            profits = batch.setdefault(strategy, {})
+        else:
+            profits = {}
+        # same insertion sequence as a set of every order lookup so that
+        # iteration (and summation) order is unchanged
+        runners = set(lookup for lookup in self._strategy_runners[strategy])
         if new_order is not None:
             runners.add(new_order.lookup)
-        worst_possible_profits = [
-            self.get_exposures(
-                strategy,
-                lookup,
-                exclusion=exclusion,
-                new_order=(
-                    new_order
-                    if new_order is not None and new_order.lookup == lookup
-                    else None
-                ),
-            )
-            for lookup in runners
-        ]
-        worst_possible_profits_on_loses = [
-            wpp["worst_possible_profit_on_lose"] for wpp in worst_possible_profits
-        ]
-        differences = [
-            wpp["worst_possible_profit_on_win"] - wpp["worst_possible_profit_on_lose"]
-            for wpp in worst_possible_profits
-        ] + (market_book.number_of_active_runners - len(runners)) * [0]
+        worst_possible_profits_on_loses = []
+        differences = []
+        for lookup in runners:
+            key = lookup[1:]
+            if new_order is not None and new_order.lookup == lookup:
+                position = self._get_position((strategy, *key), exclusion)
+                if not new_order == exclusion:
+                    self._add_position_order(position, new_order)
+                wpp = self._get_worst_possible_profits(position)
+            else:
+                wpp = profits.get(key)
+                if wpp is None:
+                    wpp = profits[key] = self._get_worst_possible_profits(
+                        self._get_position((strategy, *key), exclusion)
+                    )
+            worst_possible_profits_on_loses.append(wpp[1])
+            differences.append(wpp[0] - wpp[1])
+        differences += (market_book.number_of_active_runners - len(runners)) * [0]
         worst_differences = sorted(differences)[: market_book.number_of_winners]
         return sum(worst_possible_profits_on_loses) + sum(worst_differences)
 
+    def start_exposure_batch(self) -> bool:
+        """Caches market exposure positions until
+        end_exposure_batch is called, only valid whilst
+        orders are being placed (pending orders have no
+        exposure). Returns False if already started.
+        """
+        if self._exposure_batch is not None:
+            return False
+        self._exposure_batch = {}
+        return True
+
+    def end_exposure_batch(self) -> None:
+        self._exposure_batch = None
+
     def selection_exposure(self, strategy, lookup: tuple) -> float:
         """Returns strategy/selection exposure, which is the worse-case loss arising
         from the selection either winning or losing. Can be positive or zero.
@@ -237,7 +328,144 @@ class Blotter:
     def get_exposures(
         self, strategy, lookup: tuple, exclusion=None, new_order=None
     ) -> dict:
-        """Returns strategy/selection exposures as a dict."""
+        """Returns strategy/selection exposures as a dict.
+
+        Completed orders placed before the first live order
+        are read from the exposure ledger so only the orders
+        after it need to be processed.
+        """
+        position = self._get_position((strategy, *lookup[1:]), exclusion)
+        if new_order is not None and not new_order == exclusion:
+            self._add_position_order(position, new_order)
+        return self._get_position_exposures(position)
+
+    def _get_position(self, key: tuple, exclusion=None) -> list:
+        """Returns strategy/selection position [back_exp,
+        back_profit, lay_exp, lay_profit, moc_win_liability,
+        moc_lose_liability, unmatched backs, unmatched lays]
+        with orders processed in placement order (as per
+        _calculate_exposures) so values are identical.
+        """
+        orders = self._strategy_selection_orders.get(key)
+        if not orders:
+            return self._create_position()
+        ledger = self._exposure_ledger.get(key)
+        if ledger is None:
+            ledger = self._exposure_ledger[key] = [0, -1, self._create_position()]
+        count, position = ledger[0], ledger[2]
+        if count < len(orders):
+            # fold completed orders up to the first live order
+            live_orders = self._live_orders
+            while count < len(orders) and orders[count] not in live_orders:
+                self._add_position_order(position, orders[count])
+                count += 1
+            if count != ledger[0]:
+                ledger[0] = count
+                ledger[1] = self._order_status_indexes[orders[count - 1]][0]
+        if exclusion is not None and self._in_ledger(exclusion, key):
+            position, count = self._create_position(), 0
+        else:
+            position = position[:6] + [list(position[6]), list(position[7])]
+        for order in orders[count:]:
+            if order == exclusion:
+                continue
+            self._add_position_order(position, order)
+        return position
+
+    def _in_ledger(self, order, key: tuple) -> bool:
+        ledger = self._exposure_ledger.get(key)
+        order_index = self._order_status_indexes.get(order)
+        if ledger is None or order_index is None or order_index[0] > ledger[1]:
+            return False
+        return (order.trade.strategy, order.selection_id, order.handicap) == key
+
+    @staticmethod
+    def _create_position() -> list:
+        return [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, [], []]
+
+    @staticmethod
+    def _add_position_order(position: list, order) -> None:
+        if order.status in PENDING_STATUS:
+            return
+        if order.order_type.ORDER_TYPE == ORDER_TYPE_LIMIT:
+            _size_matched = order.size_matched  # cache
+            _order_side = order.side
+            if _size_matched:
+                if order.order_type.price_ladder_definition == "LINE_RANGE":
+                    average_price_matched = 2.0
+                else:
+                    average_price_matched = order.average_price_matched
+                if _order_side == "BACK":
+                    position[0] += -_size_matched
+                    position[1] += (average_price_matched - 1) * _size_matched
+                else:
+                    position[2] += (average_price_matched - 1) * -_size_matched
+                    position[3] += _size_matched
+            if not order.complete:
+                _size_remaining = order.size_remaining  # cache
+                if order.order_type.price_ladder_definition == "LINE_RANGE":
+                    order_type_price = 2.0
+                else:
+                    order_type_price = order.order_type.price
+                if order_type_price and _size_remaining:
+                    if _order_side == "BACK":
+                        position[6].append((order_type_price, _size_remaining))
+                    else:
+                        position[7].append((order_type_price, _size_remaining))
+        elif order.order_type.ORDER_TYPE in ORDER_TYPES_SP:
+            if order.side == "BACK":
+                position[5] -= order.order_type.liability
+            else:
+                position[4] -= order.order_type.liability
+        else:
+            raise ValueError("Unexpected order type: %s" % order.order_type.ORDER_TYPE)
+
+    @staticmethod
+    def _get_matched_exposure(position: list) -> tuple:
+        # as per calculate_matched_exposure
+        return (
+            round(position[1] + position[2], 2),
+            round(position[3] + position[0], 2),
+        )
+
+    def _get_worst_possible_profits(self, position: list) -> tuple:
+        """Returns (worst_possible_profit_on_win,
+        worst_possible_profit_on_lose) of a position.
+        """
+        matched_exposure = self._get_matched_exposure(position)
+        unmatched_exposure = calculate_unmatched_exposure(position[6], position[7])
+        return (
+            matched_exposure[0] + unmatched_exposure[0] + position[4],
+            matched_exposure[1] + unmatched_exposure[1] + position[5],
+        )
+
+    def _get_position_exposures(self, position: list) -> dict:
+        matched_exposure = self._get_matched_exposure(position)
+        unmatched_exposure = calculate_unmatched_exposure(position[6], position[7])
+
+        worst_possible_profit_on_win = (
+            matched_exposure[0] + unmatched_exposure[0] + position[4]
+        )
+        worst_possible_profit_on_lose = (
+            matched_exposure[1] + unmatched_exposure[1] + position[5]
+        )
+
+        return {
+            "matched_profit_if_win": matched_exposure[0],
+            "matched_profit_if_lose": matched_exposure[1],
+            "worst_potential_unmatched_profit_if_win": unmatched_exposure[0],
+            "worst_potential_unmatched_profit_if_lose": unmatched_exposure[1],
+            "worst_possible_profit_on_win": worst_possible_profit_on_win,
+            "worst_possible_profit_on_lose": worst_possible_profit_on_lose,
+        }
+
+    def _calculate_exposures(
+        self, strategy, lookup: tuple, exclusion=None, new_order=None
+    ) -> dict:
+        """Returns strategy/selection exposures as a dict,
+        calculated from every order rather than the
+        exposure ledger (used to validate the ledger).
+        """
         mb, ml = [], []  # matched bets, (price, size)
         ub, ul = [], []  # unmatched bets, (price, size)
         moc_win_liability = 0.0
@@ -300,10 +528,29 @@ class Blotter:
             "worst_possible_profit_on_lose": worst_possible_profit_on_lose,
         }
 
+    def refresh_order_exposure(self, order) -> None:
+        """Resets the ledger of a completed order so that
+        it is recalculated on the next query, required if
+        a completed order is updated e.g. current order
+        update or non runner adjustment.
+        """
+        key = (order.trade.strategy, order.selection_id, order.handicap)
+        if self._in_ledger(order, key):
+            del self._exposure_ledger[key]
+
+    def check_exposures(self, strategy, lookup: tuple) -> bool:
+        """Returns True if the ledger exposures match
+        a full recalculation from every order.
+        """
+        return self.get_exposures(strategy, lookup) == self._calculate_exposures(
+            strategy, lookup
+        )
+
     """ getters / setters """
 
     def complete_order(self, order) -> None:
-        self._live_orders.remove(order)
+        del self._live_orders[order]
+        del self._selection_live_orders[(order.selection_id, order.handicap)][order]
 
     def has_order(self, customer_order_ref: str) -> bool:
         return customer_order_ref in self._orders
@@ -311,26 +558,43 @@ class Blotter:
     def has_trade(self, trade) -> bool:
         return trade in self._trades
 
-    @property
-    def _bet_id_lookup(self):
-        return {order.bet_id: order for order in self}
-
     __contains__ = has_order
 
     def __setitem__(self, customer_order_ref: str, order) -> None:
         self.active = True
         self._orders[customer_order_ref] = order
+        if order.bet_id is not None:
+            self._bet_id_lookup[order.bet_id] = order
         self._trade_lookup[order.trade.id] = order.trade
-        self._live_orders.append(order)
+        self._live_orders[order] = None
+        self._selection_live_orders[(order.selection_id, order.handicap)][order] = None
         strategy = order.trade.strategy
+        if order.trade not in self._trades:
+            self._strategy_trades[strategy].append(order.trade)
         self._trades[order.trade].append(order)
         self._strategy_orders[strategy].append(order)
+        self._strategy_runners[strategy][order.lookup] = None
         self._strategy_selection_orders[
             (strategy, order.selection_id, order.handicap)
         ].append(order)
         client = order.client
         self._client_orders[client].append(order)
         self._client_strategy_orders[(client, strategy)].append(order)
+        status_indexes = (
+            self._strategy_status_orders[strategy],
+            self._strategy_selection_status_orders[
+                (strategy, order.selection_id, order.handicap)
+            ],
+            self._client_status_orders[client],
+            self._client_strategy_status_orders[(client, strategy)],
+        )
+        for status_orders in status_indexes:
+            status_orders[order.status][order] = None
+        self._order_status_indexes[order] = (
+            len(self._order_status_indexes),
+            status_indexes,
+        )
+        order._blotter = self
 
     def __getitem__(self, customer_order_ref: str):
         return self._orders[customer_order_ref]
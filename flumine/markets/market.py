@@ -97,6 +97,24 @@ class Market:
         ) as t:
             return t.place_order(order, market_version, execute, force)
 
+    def place_orders(
+        self,
+        orders: list,
+        market_version: int = None,
+        execute: bool = True,
+        force: bool = False,
+        client=None,
+        customer_strategy_ref=None,
+    ) -> list:
+        if not orders:
+            return []
+        if customer_strategy_ref is None and config.customer_strategy_ref is None:
+            customer_strategy_ref = str(orders[0].trade.strategy)[:15]
+        with self.transaction(
+            client=client, customer_strategy_ref=customer_strategy_ref
+        ) as t:
+            return t.place_orders(orders, market_version, execute, force)
+
     def cancel_order(
         self, order, size_reduction: float = None, force: bool = False
     ) -> bool:
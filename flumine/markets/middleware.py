@@ -1,6 +1,7 @@
 import os
 import logging
 from collections import defaultdict
+from typing import Optional
 from betfairlightweight.resources.bettingresources import RunnerBook
 
 from ..order.order import OrderStatus, OrderTypes
@@ -45,15 +46,36 @@ class SimulatedMiddleware(Middleware):
         # {marketId: {(selectionId, handicap): RunnerAnalytics}}
         self.markets = defaultdict(dict)
         self._runner_removals = []
+        # {marketId: {(selectionId, handicap): (last Order, [Order,])}} sorted live orders
+        self._sorted_orders = defaultdict(dict)
 
     def __call__(self, market) -> None:
         market_analytics = self.markets[market.market_id]
         runner_removals = []  # [(selectionId, handicap, adjustmentFactor)..]
+        traded_updates = self._get_traded_updates(market.market_book)
+        changed_runners = self._get_changed_runners(market.market_book)
+        if changed_runners is not None:
+            # clear traded from the previous update on unchanged runners
+            for key, runner_analytics in market_analytics.items():
+                if runner_analytics.traded and key not in changed_runners:
+                    runner_analytics.traded = {}
 
         for runner in market.market_book.runners:
+            if (
+                changed_runners is not None
+                and (runner.selection_id, runner.handicap) not in changed_runners
+            ):
+                continue
             if runner.status == "ACTIVE":
-                self._process_runner(market_analytics, runner)
-            elif runner.status == "REMOVED":
+                self._process_runner(market_analytics, runner, traded_updates)
+                continue
+            # runner skipped so next traded deltas are not sequential
+            runner_analytics = market_analytics.get(
+                (runner.selection_id, runner.handicap)
+            )
+            if runner_analytics:
+                runner_analytics.sequential = False
+            if runner.status == "REMOVED":
                 _removal = (
                     runner.selection_id,
                     runner.handicap,
@@ -75,13 +97,14 @@ class SimulatedMiddleware(Middleware):
         market.context["simulated"] = market_analytics
         # process simulated orders
         if market.blotter.active:
-            self._process_simulated_orders(market, market_analytics)
+            self._process_simulated_orders(market, market_analytics, changed_runners)
 
     def remove_market(self, market) -> None:
         try:
             del self.markets[market.market_id]
         except KeyError:
             pass
+        self._sorted_orders.pop(market.market_id, None)
 
     def _process_runner_removal(
         self,
@@ -173,13 +196,17 @@ class SimulatedMiddleware(Middleware):
                             order.selection_id,
                             extra=order.info,
                         )
+                # completed order exposure may have changed
+                market.blotter.refresh_order_exposure(order)
 
     @staticmethod
     def _calculate_reduction_factor(price: float, adjustment_factor: float) -> float:
         price_adjusted = round(price * (1 - (adjustment_factor / 100)), 2)
         return max(price_adjusted, 1.01)  # min: 1.01
 
-    def _process_simulated_orders(self, market, market_analytics: dict) -> None:
+    def _process_simulated_orders(
+        self, market, market_analytics: dict, changed_runners: set = None
+    ) -> None:
         """
         #538 smart matching
           - isolation per order
@@ -188,69 +215,115 @@ class SimulatedMiddleware(Middleware):
             Prevent double counting of passive liquidity per strategy
           - isolation per instance
             Prevent double counting of passive liquidity on all orders regardless of strategy (interaction across strategies)
+        Orders are processed per runner using the blotter
+        live order index (sorted copy cached until an order
+        is added or completed), traded is copied into a ledger per
+        strategy (or instance) on first use and consumed in
+        place. If changed_runners is provided orders on
+        unchanged runners are skipped (nothing traded or
+        market change) unless taking SP after reconciliation.
         """
-        # isolation per strategy (default)
-        if config.simulated_strategy_isolation:
-            for strategy, orders in market.blotter._strategy_orders.items():
-                live_orders = [
-                    o for o in orders if o.status in LIVE_STATUS and o.simulated
-                ]
-                if live_orders:
-                    _lookup = {
-                        k: (v.runner, v.traded.copy())
-                        for k, v in market_analytics.items()
-                    }
-                    live_orders_sorted = self._sort_orders(live_orders)
-                    for order in live_orders_sorted:
-                        runner_traded = _lookup[(order.selection_id, order.handicap)]
-                        order.simulated(market.market_book, runner_traded)
-        else:  # isolation per instance
-            live_orders = list(market.blotter.live_orders)
-            if live_orders:
-                _lookup = {
-                    k: (v.runner, v.traded.copy()) for k, v in market_analytics.items()
-                }
-                live_orders_sorted = self._sort_orders(live_orders)
-                for order in live_orders_sorted:
-                    if order.status in LIVE_STATUS and order.simulated:
-                        runner_traded = _lookup[(order.selection_id, order.handicap)]
-                        order.simulated(market.market_book, runner_traded)
+        strategy_isolation = config.simulated_strategy_isolation
+        market_book = market.market_book
+        bsp_reconciled = market_book.bsp_reconciled
+        sorted_orders = self._sorted_orders[market.market_id]
+        for key, orders in market.blotter._selection_live_orders.items():
+            if not orders:
+                continue
+            runner_changed = changed_runners is None or key in changed_runners
+            if not runner_changed and not bsp_reconciled:
+                continue
+            last_order = next(reversed(orders))
+            sorted_runner_orders = sorted_orders.get(key)
+            if (
+                sorted_runner_orders is None
+                or sorted_runner_orders[0] is not last_order
+                or len(sorted_runner_orders[1]) != len(orders)
+            ):
+                # order(s) added or completed since last sort
+                sorted_runner_orders = sorted_orders[key] = (
+                    last_order,
+                    self._sort_orders(list(orders)),
+                )
+            runner_analytics = None
+            ledger = {}  # {strategy: traded}
+            for order in sorted_runner_orders[1]:
+                if (
+                    order.status in LIVE_STATUS
+                    and order.simulated
+                    and (runner_changed or order.simulated.take_sp)
+                ):
+                    if runner_analytics is None:
+                        runner_analytics = market_analytics[key]
+                    strategy = order.trade.strategy if strategy_isolation else None
+                    try:
+                        traded = ledger[strategy]
+                    except KeyError:
+                        traded = ledger[strategy] = runner_analytics.traded.copy()
+                    order.simulated(market_book, (runner_analytics.runner, traded))
 
     @staticmethod
-    def _sort_orders(orders: list) -> list:
+    def _order_priority(order) -> tuple:
         # order by betId (default), side (Lay,Back) and then price
-        lay_orders = sorted(
-            [
-                o
-                for o in orders
-                if o.side == "LAY"
-                and o.order_type.ORDER_TYPE != OrderTypes.MARKET_ON_CLOSE
-            ],
-            key=lambda x: -x.order_type.price,
-        )
-        back_orders = sorted(
-            [
-                o
-                for o in orders
-                if o.side == "BACK"
-                and o.order_type.ORDER_TYPE != OrderTypes.MARKET_ON_CLOSE
-            ],
-            key=lambda x: x.order_type.price,
-        )
-        moc = [
-            o for o in orders if o.order_type.ORDER_TYPE == OrderTypes.MARKET_ON_CLOSE
-        ]
-        return lay_orders + back_orders + moc
+        if order.order_type.ORDER_TYPE == OrderTypes.MARKET_ON_CLOSE:
+            return 2, 0
+        elif order.side == "LAY":
+            return 0, -order.order_type.price
+        else:
+            return 1, order.order_type.price
+
+    @classmethod
+    def _sort_orders(cls, orders: list) -> list:
+        # sorted in place
+        orders.sort(key=cls._order_priority)
+        return orders
 
     @staticmethod
-    def _process_runner(market_analytics: dict, runner: RunnerBook) -> None:
+    def _get_changed_runners(market_book) -> Optional[set]:
+        """
+        Runners {(selectionId, handicap)} updated by the
+        streaming update (historical replay), None if all
+        runners are to be processed
+        """
+        if config.simulation_available_prices:
+            # available matching is not limited to changes
+            return None
+        return getattr(market_book, "streaming_changed_runners", None)
+
+    @staticmethod
+    def _get_traded_updates(market_book) -> Optional[dict]:
+        """
+        Traded ladder deltas from the raw streaming update
+        {(selectionId, handicap): trd}, only available when
+        the previous update was processed (historical replay)
+        """
+        if not getattr(market_book, "streaming_sequential", False):
+            return None
+        streaming_update = market_book.streaming_update
+        if not streaming_update or streaming_update.get("img"):
+            return None
+        return {
+            (rc["id"], rc.get("hc", 0)): rc["trd"]
+            for rc in streaming_update.get("rc", ())
+            if "trd" in rc
+        }
+
+    @staticmethod
+    def _process_runner(
+        market_analytics: dict, runner: RunnerBook, traded_updates: dict = None
+    ) -> None:
         try:
             runner_analytics = market_analytics[(runner.selection_id, runner.handicap)]
         except KeyError:
             runner_analytics = market_analytics[
                 (runner.selection_id, runner.handicap)
             ] = RunnerAnalytics(runner)
-        runner_analytics(runner)
+        if traded_updates is None:
+            runner_analytics(runner)
+        else:
+            runner_analytics(
+                runner, traded_updates.get((runner.selection_id, runner.handicap))
+            )
 
 
 class RunnerAnalytics:
@@ -261,14 +334,20 @@ class RunnerAnalytics:
         self._p_v = {
             i["price"]: i["size"] for i in runner.ex.traded_volume
         }  # cached current volume
+        self.sequential = True  # previous update processed
 
-    def __call__(self, runner: RunnerBook):
+    def __call__(self, runner: RunnerBook, traded_update: list = None):
         _tv = runner.ex.traded_volume
-        if self._traded_volume == _tv:
+        if traded_update and self.sequential:
+            # apply streaming delta rather than diff full ladder
+            self.traded = self._calculate_traded_update(traded_update)
+            self._traded_volume = _tv
+        elif self._traded_volume == _tv:
             self.traded = {}
         else:
             self.traded = self._calculate_traded(_tv)
             self._traded_volume = _tv
+        self.sequential = True
         self.runner = runner
 
     def _calculate_traded(self, traded_volume: list) -> dict:
@@ -287,6 +366,25 @@ class RunnerAnalytics:
         self._p_v = c_v
         return traded
 
+    def _calculate_traded_update(self, traded_update: list) -> dict:
+        p_v, traded = self._p_v, {}
+        # apply delta to cached volume
+        for price, size in traded_update:
+            if size == 0:
+                p_v.pop(price, None)
+                continue
+            if price in p_v:
+                new_value = float(size) - float(p_v[price])
+                if new_value > 0:
+                    traded[price] = round(new_value, 2)
+            else:
+                traded[price] = size
+            p_v[price] = size
+        if len(traded) > 1:
+            # match ladder (price) order
+            return dict(sorted(traded.items()))
+        return traded
+
 
 class SimulatedSportsDataMiddleware(Middleware):
     """
@@ -313,9 +411,14 @@ class SimulatedSportsDataMiddleware(Middleware):
                     continue
                 if pt > update.publish_time_epoch:
                     for strategy in market.flumine.strategies:
+                        stream_id = market.market_book.streaming_unique_id
                         if (
-                            market.market_book.streaming_unique_id
-                            in strategy.stream_ids
+                            stream_id in strategy.stream_ids
+                            and strategy.market_in_view(
+                                stream_id,
+                                market.market_id,
+                                market.market_book.market_definition,
+                            )
                         ):
                             if call_strategy_error_handling(
                                 strategy.check_sports_data, market, update
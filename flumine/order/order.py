@@ -90,6 +90,7 @@ class BaseOrder:
         self.each_way_divisor = 1
         self.number_of_dead_heat_winners = None
         self.status = None
+        self._blotter = None  # status partitioned indexes updated on status change
         self.complete = False
         self.status_log = []
         self.violation_msg = None
@@ -99,6 +100,7 @@ class BaseOrder:
 
         self.bet_id = None
         self.update_data = {}  # stores cancel/update/replace data
+        self.replacement_order = None  # placed order when cancel/place collapsed
         self.responses = Responses()  # raw api responses
         self.simulated = SimulatedOrder(self)  # used in simulated execution
         self._simulated = bool(self.simulated)  # cache in current class (2x quicker)
@@ -118,7 +120,9 @@ class BaseOrder:
     # status
     def _update_status(self, status: OrderStatus) -> None:
         self.status_log.append(status)
-        self.status = status
+        old_status, self.status = self.status, status
+        if self._blotter is not None:
+            self._blotter.update_order_status(self, old_status)
         self.date_time_status_update = datetime.datetime.now(datetime.timezone.utc)
         self.complete = self._is_complete()
         if logger.isEnabledFor(logging.INFO):
@@ -66,6 +66,10 @@ class BaseOrderPackage(BaseEvent):
     def reset_orders(self, complete: bool = False) -> None:
         for order in self:
             with order.trade:
+                if order.replacement_order is not None:
+                    # cancel and place collapsed into replace
+                    order.replacement_order.execution_complete()
+                    order.replacement_order = None
                 if complete:
                     order.execution_complete()
                 else:
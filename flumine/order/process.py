@@ -71,6 +71,11 @@ def process_current_orders(
                     continue
             # process order status
             process_current_order(order, current_order, log_control)
+            # bet_id (async placement) and completed order exposure may have changed
+            market = markets.markets.get(order.market_id)
+            if market:
+                market.blotter.update_bet_id(order)
+                market.blotter.refresh_order_exposure(order)
 
 
 def process_current_order(order: BaseOrder, current_order, log_control) -> None:
@@ -164,6 +169,8 @@ def process_betdaq_current_orders(
             continue
         # process order status
         process_betdaq_current_order(order, current_order)
+        # completed order exposure may have changed
+        market.blotter.refresh_order_exposure(order)
 
 
 def process_betdaq_current_order(order: BaseOrder, current_order) -> None:
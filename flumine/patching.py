@@ -12,6 +12,13 @@ simulation, with more speed, less CPU + ram and minimal reduction
 in usability.
 """
 
+from betfairlightweight.resources import MarketBook
+from betfairlightweight.utils import utcnow
+from betfairlightweight.resources.bettingresources import (
+    KeyLine,
+    PriceLadderDescription,
+)
+
 
 class SP:
     __slots__ = [
@@ -49,3 +56,70 @@ class EX:
         self.available_to_back = availableToBack
         self.available_to_lay = availableToLay
         self.traded_volume = tradedVolume
+
+
+class LazyMarketBook(MarketBook):
+    """
+    MarketBook created directly from a MarketBookCache
+    serialise dict (no kwargs copies), attributes
+    rarely used by flumine are created on first access.
+    """
+
+    _lazy_attributes = {
+        "bet_delay_models": "betDelayModels",
+        "complete": "complete",
+        "cross_matching": "crossMatching",
+        "is_market_data_delayed": "isMarketDataDelayed",
+        "number_of_runners": "numberOfRunners",
+        "runners_voidable": "runnersVoidable",
+        "suspend_reason": "suspendReason",
+        "total_available": "totalAvailable",
+    }
+
+    def __init__(
+        self,
+        data: dict,
+        market_definition,
+        runners: list,
+        streaming_unique_id: int,
+        streaming_snap: bool,
+    ):
+        self.streaming_unique_id = streaming_unique_id
+        self.streaming_update = data.pop("streaming_update", None)
+        self.streaming_snap = streaming_snap
+        self.market_definition = market_definition
+        self.elapsed_time = None
+        self._datetime_created = self._datetime_updated = utcnow()
+        self._data = data
+        self.market_id = data["marketId"]
+        self.bet_delay = data["betDelay"]
+        self.bsp_reconciled = data["bspReconciled"]
+        self.inplay = data["inplay"]
+        self.number_of_active_runners = data["numberOfActiveRunners"]
+        self.number_of_winners = data["numberOfWinners"]
+        self.status = data["status"]
+        self.total_matched = data["totalMatched"]
+        self.version = data["version"]
+        self.runners = runners
+        self.publish_time_epoch = data["publishTime"]
+        self.publish_time = self.strip_datetime(self.publish_time_epoch)
+
+    def __getattr__(self, name: str):
+        if name[0] == "_":
+            # private/dunder lookups (copy, pickle) before _data is set
+            raise AttributeError(name)
+        try:
+            value = self._data.get(self._lazy_attributes[name])
+        except KeyError:
+            if name == "last_match_time":
+                value = self.strip_datetime(self._data.get("lastMatchTime"))
+            elif name == "key_line_description":
+                key_line = self._data.get("keyLineDescription")
+                value = KeyLine(**key_line) if key_line else None
+            elif name == "price_ladder_definition":
+                price_ladder = self._data.get("priceLadderDefinition")
+                value = PriceLadderDescription(**price_ladder) if price_ladder else None
+            else:
+                raise AttributeError(name)
+        self.__dict__[name] = value
+        return value
@@ -0,0 +1,92 @@
+from time import perf_counter
+
+# bucket i holds timings of [2 ** (i - 1), 2 ** i) microseconds
+BUCKET_COUNT = 40
+LAST_BUCKET = BUCKET_COUNT + 1  # index within timings list
+
+
+class Profiler:
+    """
+    Low overhead timings of the main event loop
+    stages (handler_queue, event, market, middleware
+    and strategy functions) recorded in power of two
+    microsecond buckets, percentiles are therefore
+    accurate to within a factor of two.
+    Only every `sample_rate` event is recorded.
+    """
+
+    def __init__(self, sample_rate: int = 10):
+        self.sample_rate = sample_rate
+        self.sampling = True  # current event is recorded
+        self._event_count = 0
+        self._stages = {}  # {(stage, obj): [total, max, buckets..]}
+
+    def sample(self) -> bool:
+        # called per event to determine if it should be recorded
+        self._event_count += 1
+        self.sampling = self._event_count % self.sample_rate == 0
+        return self.sampling
+
+    def record(self, stage: str, obj, start: float) -> None:
+        """Records time since start (time.perf_counter),
+        obj is the strategy/middleware/event type or None
+        (named on summary to keep recording cheap)
+        """
+        self.add(stage, obj, perf_counter() - start)
+
+    def add(self, stage: str, obj, elapsed: float) -> None:
+        try:
+            timings = self._stages[(stage, obj)]
+        except KeyError:
+            timings = self._stages[(stage, obj)] = [0.0, 0.0] + [0] * BUCKET_COUNT
+        timings[0] += elapsed
+        if elapsed > timings[1]:
+            timings[1] = elapsed
+        bucket = int(elapsed * 1e6).bit_length() + 2
+        if bucket > LAST_BUCKET:
+            bucket = LAST_BUCKET
+        timings[bucket] += 1
+
+    def reset(self) -> dict:
+        """Clears and returns the current timings"""
+        stages, self._stages = self._stages, {}
+        return stages
+
+    @staticmethod
+    def summary(stages: dict) -> dict:
+        """Returns (sampled) count, total, mean, p50,
+        p99 and max (seconds) per stage e.g.
+        {"check_market_book.LowestLayer": {..}}
+        """
+        summary = {}
+        for (stage, obj), timings in list(stages.items()):
+            total, maximum, buckets = timings[0], timings[1], timings[2:]
+            count = sum(buckets)
+            if not count:
+                continue
+            if obj is not None:
+                stage = "%s.%s" % (stage, getattr(obj, "name", type(obj).__name__))
+            summary[stage] = {
+                "count": count,
+                "total": round(total, 6),
+                "mean": round(total / count, 6),
+                "p50": _percentile(buckets, count, 0.5, maximum),
+                "p99": _percentile(buckets, count, 0.99, maximum),
+                "max": round(maximum, 6),
+            }
+        return summary
+
+    @property
+    def info(self) -> dict:
+        return self.summary(self._stages)
+
+
+def _percentile(buckets: list, count: int, percentile: float, maximum: float) -> float:
+    # upper bound of the bucket containing the percentile (capped at max)
+    target = count * percentile
+    cumulative = 0
+    for bucket, bucket_count in enumerate(buckets):
+        cumulative += bucket_count
+        if cumulative >= target:
+            return round(min((2**bucket) / 1e6, maximum), 6)
+    return round(maximum, 6)
@@ -0,0 +1,246 @@
+import os
+import logging
+import multiprocessing
+from collections import defaultdict
+from typing import Callable, Optional
+from betfairlightweight import resources
+
+from .simulation import FlumineSimulation
+from ..controls.loggingcontrols import LoggingControl
+from ..events import events
+from ..utils import chunks, get_file_md
+
+logger = logging.getLogger(__name__)
+
+
+class SimulationResultsControl(LoggingControl):
+    """
+    Logging control added to each worker process
+    to record picklable results (Order.info and
+    cleared market dicts with client username) for
+    merging.
+    """
+
+    NAME = "SIMULATION_RESULTS_CONTROL"
+
+    def __init__(self, *args, **kwargs):
+        super(SimulationResultsControl, self).__init__(*args, **kwargs)
+        self.orders = []
+        self.cleared_markets = []
+
+    def _process_cleared_orders_meta(
+        self, event: events.ClearedOrdersMetaEvent
+    ) -> None:
+        self.orders.extend(order.info for order in event.event)
+
+    def _process_cleared_markets(self, event: events.ClearedMarketsEvent) -> None:
+        # client is not picklable, username used to rebuild client totals
+        client = getattr(event.event, "client", None)
+        username = client.username if client else None
+        for cleared_market in event.event.orders:
+            self.cleared_markets.append(
+                {
+                    "username": username,
+                    "marketId": cleared_market.market_id,
+                    "eventId": cleared_market.event_id,
+                    "eventTypeId": cleared_market.event_type_id,
+                    "customerStrategyRef": cleared_market.customer_strategy_ref,
+                    "betCount": cleared_market.bet_count,
+                    "betOutcome": cleared_market.bet_outcome,
+                    "commission": cleared_market.commission,
+                    "profit": cleared_market.profit,
+                }
+            )
+
+
+def _run_process(setup: Callable[[list], FlumineSimulation], markets: list) -> dict:
+    framework = setup(markets)
+    results_control = SimulationResultsControl()
+    framework.add_logging_control(results_control)
+    framework.run()
+    return {
+        "process_id": os.getpid(),
+        "markets": markets,
+        "orders": results_control.orders,
+        "cleared_markets": results_control.cleared_markets,
+    }
+
+
+class SimulationResults:
+    """
+    Merged results from a ParallelSimulation run,
+    orders are Order.info dicts as order objects
+    cannot be shared across processes.
+    """
+
+    def __init__(self):
+        self.orders = []
+        self.cleared_markets = []
+        self.process_count = 0
+
+    def add(self, result: dict) -> None:
+        self.orders.extend(result["orders"])
+        self.cleared_markets.extend(result["cleared_markets"])
+        self.process_count += 1
+
+    @property
+    def profit(self) -> float:
+        return round(sum(c["profit"] for c in self.cleared_markets), 2)
+
+    @property
+    def bet_count(self) -> int:
+        return sum(c["betCount"] for c in self.cleared_markets)
+
+    @property
+    def client_totals(self) -> dict:
+        # {username: {"profit": float, "bet_count": int}}
+        totals = {}
+        for c in self.cleared_markets:
+            client_total = totals.setdefault(
+                c.get("username"), {"profit": 0, "bet_count": 0}
+            )
+            client_total["profit"] += c["profit"]
+            client_total["bet_count"] += c["betCount"]
+        for client_total in totals.values():
+            client_total["profit"] = round(client_total["profit"], 2)
+        return totals
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+
+class ParallelSimulation:
+    """
+    Multi process simulation, markets (or event
+    groups if event_processing) are sharded across
+    worker processes with each process recycled
+    after `max_tasks_per_child` shards to contain
+    memory.
+
+    `setup` must be picklable (module level) and
+    return a FlumineSimulation with clients and
+    strategies added for the markets provided:
+
+        def setup(markets: list) -> FlumineSimulation:
+            framework = FlumineSimulation(client=clients.SimulatedClient())
+            framework.add_strategy(
+                LowestLayer(market_filter={"markets": markets})
+            )
+            return framework
+    """
+
+    def __init__(
+        self,
+        setup: Callable[[list], FlumineSimulation],
+        markets: list,
+        workers: int = None,
+        markets_per_process: int = 8,
+        event_processing: bool = False,
+        event_groups: dict = None,
+        max_tasks_per_child: Optional[int] = 1,
+        mp_context: str = None,
+    ):
+        """
+        :param setup: Function to create FlumineSimulation for a list of markets
+        :param markets: List of market file paths
+        :param workers: Number of processes (defaults to cpu count)
+        :param markets_per_process: Markets per shard (event groups are never split)
+        :param event_processing: Shard by event group rather than market
+        :param event_groups: Event id to group mapping (as per market_filter)
+        :param max_tasks_per_child: Shards processed before worker is recycled
+        :param mp_context: multiprocessing start method (fork/spawn/forkserver)
+        """
+        self.setup = setup
+        self.markets = markets
+        self.workers = workers or os.cpu_count()
+        self.markets_per_process = markets_per_process
+        self.event_processing = event_processing
+        self.event_groups = event_groups or {}
+        self.max_tasks_per_child = max_tasks_per_child
+        self.mp_context = mp_context
+        self._logging_controls = []
+
+    def add_logging_control(self, logging_control: LoggingControl) -> None:
+        # receives merged ClearedMarketsEvents from all processes
+        logger.info("Adding logging control %s", logging_control.NAME)
+        self._logging_controls.append(logging_control)
+
+    def create_shards(self) -> list:
+        markets = sorted(self.markets)
+        if not self.event_processing:
+            return list(chunks(markets, self.markets_per_process))
+        event_group_markets = defaultdict(list)
+        for market in markets:
+            market_definition = get_file_md(market)
+            event_id = getattr(market_definition, "event_id", None)
+            event_group = self.event_groups.get(event_id, event_id)
+            event_group_markets[event_group].append(market)
+        shards, shard = [], []
+        for group_markets in event_group_markets.values():
+            if shard and len(shard) + len(group_markets) > self.markets_per_process:
+                shards.append(shard)
+                shard = []
+            shard.extend(group_markets)
+        if shard:
+            shards.append(shard)
+        return shards
+
+    def run(self) -> SimulationResults:
+        shards = self.create_shards()
+        logger.info(
+            "Starting parallel simulation",
+            extra={
+                "market_count": len(self.markets),
+                "shard_count": len(shards),
+                "workers": self.workers,
+            },
+        )
+        for c in self._logging_controls:
+            c.start()
+        results = SimulationResults()
+        ctx = multiprocessing.get_context(self.mp_context)
+        try:
+            with ctx.Pool(
+                processes=min(self.workers, len(shards)) or 1,
+                maxtasksperchild=self.max_tasks_per_child,
+            ) as pool:
+                jobs = [
+                    pool.apply_async(_run_process, (self.setup, shard))
+                    for shard in shards
+                ]
+                for job in jobs:
+                    result = job.get()
+                    results.add(result)
+                    self._log_cleared_markets(result)
+        finally:
+            # shutdown logging controls (worker errors are raised)
+            for c in self._logging_controls:
+                c.logging_queue.put(events.TerminationEvent(self))
+                c.join()
+        logger.info(
+            "Parallel simulation complete",
+            extra={
+                "profit": results.profit,
+                "bet_count": results.bet_count,
+                "clients": results.client_totals,
+            },
+        )
+        return results
+
+    def _log_cleared_markets(self, result: dict) -> None:
+        if not self._logging_controls:
+            return
+        for cleared_market in result["cleared_markets"]:
+            event = events.ClearedMarketsEvent(
+                resources.ClearedOrders(
+                    moreAvailable=False, clearedOrders=[cleared_market]
+                )
+            )
+            for c in self._logging_controls:
+                c.logging_queue.put(event)
+
+    def __repr__(self) -> str:
+        return "<ParallelSimulation>"
+
+    def __str__(self) -> str:
+        return "<ParallelSimulation>"
@@ -1,7 +1,7 @@
 import logging
 from collections import defaultdict
 
-from .utils import SimulatedDateTime
+from .utils import SimulatedDateTime, merge_market_book_generators
 from ..baseflumine import BaseFlumine
 from ..clients import BaseClient
 from ..events import events
@@ -55,31 +55,14 @@ class FlumineSimulation(BaseFlumine):
                             extra={"markets": [s.market_filter for s in streams]},
                         )
                         self.simulated_datetime.reset_real_datetime()
-                        # create cycles
-                        cycles = []  # [[epoch, [MarketBook], gen], ..]
-                        for stream in streams:
-                            stream_gen = stream.create_generator()()
-                            market_book = next(stream_gen)
-                            publish_time_epoch = market_book[0].publish_time_epoch
-                            cycles.append([publish_time_epoch, market_book, stream_gen])
-                        # process cycles
-                        while cycles:
-                            # order by epoch
-                            cycles.sort(key=lambda x: x[0])
-                            # get current
-                            _, market_book, stream_gen = cycles.pop(0)
-                            # process current
+                        # mux streams chronologically
+                        stream_gens = [
+                            stream.create_generator()() for stream in streams
+                        ]
+                        for market_book in merge_market_book_generators(stream_gens):
                             self._process_market_books(
                                 events.MarketBookEvent(market_book)
                             )
-                            # gen next
-                            try:
-                                market_book = next(stream_gen)
-                            except StopIteration:
-                                continue
-                            publish_time_epoch = market_book[0].publish_time_epoch
-                            # add back
-                            cycles.append([publish_time_epoch, market_book, stream_gen])
                         self.handler_queue.clear()
                         logger.info(
                             "Completed historical event group '%s'", event_group
@@ -160,7 +143,7 @@ class FlumineSimulation(BaseFlumine):
         orders through strategies
         """
         blotter = market.blotter
-        for order in blotter.live_orders:
+        for order in list(blotter.live_orders):
             if order.complete:
                 blotter.complete_order(order)
             else:
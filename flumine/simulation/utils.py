@@ -1,5 +1,8 @@
+import heapq
 import datetime
+import itertools
 from contextlib import contextmanager
+from typing import Iterator
 
 from .. import config
 
@@ -42,6 +45,41 @@ class SimulatedDateTime:
         datetime.datetime = self._real_datetime
 
 
+def merge_market_book_generators(generators: list) -> Iterator[list]:
+    """Chronologically mux market book generators (event processing)
+    using a heap, O(log n) per update. Ties on publish time are yielded
+    in the order they were (re)queued, first in first out.
+    """
+    sequence = itertools.count()
+    heap = []  # [(epoch, sequence, [MarketBook], gen), ..]
+    for gen in generators:
+        try:
+            market_book = next(gen)
+        except StopIteration:
+            continue
+        heap.append(
+            (market_book[0].publish_time_epoch, next(sequence), market_book, gen)
+        )
+    heapq.heapify(heap)
+    while heap:
+        _, _, market_book, gen = heap[0]
+        yield market_book
+        try:
+            next_market_book = next(gen)
+        except StopIteration:
+            heapq.heappop(heap)
+            continue
+        heapq.heapreplace(
+            heap,
+            (
+                next_market_book[0].publish_time_epoch,
+                next(sequence),
+                next_market_book,
+                gen,
+            ),
+        )
+
+
 class SimulatedPlaceResponse:
     def __init__(
         self,
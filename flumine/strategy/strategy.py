@@ -1,12 +1,19 @@
 import logging
+from collections import defaultdict
 from typing import Iterator, List, Optional, Type, Union
 from betfairlightweight import filters
-from betfairlightweight.resources import MarketBook, MarketCatalogue, Race, CricketMatch
+from betfairlightweight.resources import (
+    MarketBook,
+    MarketCatalogue,
+    MarketDefinition,
+    Race,
+    CricketMatch,
+)
 
 from .runnercontext import RunnerContext
 from ..markets.market import Market
 from ..streams.marketstream import BaseStream, MarketStream
-from ..utils import create_cheap_hash, STRATEGY_NAME_HASH_LENGTH
+from ..utils import create_cheap_hash, market_filter_match, STRATEGY_NAME_HASH_LENGTH
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +95,9 @@ class BaseStrategy:
         self._invested = {}  # {(marketId, selectionId, handicap): RunnerContext}
         self.streams = []  # list of streams strategy is subscribed
         self.historic_stream_ids = set()
+        # {Stream: [market_filter, ..]} coalesced streams (config.coalesce_market_streams)
+        self.stream_market_filters = defaultdict(list)
+        self._market_views = {}  # {(Stream, marketId): bool}
         # cache
         self.name_hash = create_cheap_hash(self.name, STRATEGY_NAME_HASH_LENGTH)
 
@@ -152,6 +162,8 @@ class BaseStrategy:
                 to_remove.append(invested)
         for i in to_remove:
             del self._invested[i]
+        for key in [key for key in self._market_views if key[1] == market_id]:
+            del self._market_views[key]
 
     def validate_order(self, runner_context: RunnerContext, order) -> bool:
         # allow multiple orders per trade
@@ -229,11 +241,46 @@ class BaseStrategy:
         for stream in self.streams:
             try:
                 if market_id in stream._listener.stream._caches:
+                    if stream in self.stream_market_filters:
+                        if not self._market_views.get((stream, market_id)):
+                            continue
                     return True
             except AttributeError:
                 continue
         return False
 
+    def market_in_view(
+        self,
+        stream_id: int,
+        market_id: str,
+        market_definition: Optional[MarketDefinition] = None,
+    ) -> bool:
+        """Markets from coalesced streams are only processed
+        if they match the strategy market filter(s), assumes
+        stream_id is in stream_ids.
+        """
+        if not self.stream_market_filters:
+            return True
+        for stream in self.streams:
+            if stream.stream_id == stream_id:
+                break
+        else:
+            return True
+        market_filters = self.stream_market_filters.get(stream)
+        if market_filters is None:
+            return True
+        try:
+            return self._market_views[(stream, market_id)]
+        except KeyError:
+            in_view = any(
+                market_filter_match(market_filter, market_id, market_definition)
+                for market_filter in market_filters
+            )
+            if market_definition is not None:
+                # definition attributes unknown until received
+                self._market_views[(stream, market_id)] = in_view
+            return in_view
+
     @property
     def stream_ids(self) -> Union[list, set]:
         if self.historic_stream_ids:
@@ -1,7 +1,13 @@
+import os
+import pickle
+import hashlib
 import logging
+import importlib
 import datetime
+import itertools
 import smart_open
-from typing import Optional
+import betfairlightweight
+from typing import Callable, Iterator, Optional, TextIO
 from betfairlightweight.streaming import StreamListener, HistoricalGeneratorStream
 from betfairlightweight.streaming.stream import MarketStream, RaceStream, CricketStream
 from betfairlightweight.streaming.cache import (
@@ -13,11 +19,16 @@ from betfairlightweight.resources.baseresource import BaseResource
 from betfairlightweight.compat import json
 
 from .basestream import BaseStream
+from ..patching import LazyMarketBook
+from .. import config
 from ..exceptions import ListenerError
-from ..utils import create_time
+from ..utils import create_time, is_compiled_file, read_compiled_file
 
 logger = logging.getLogger(__name__)
 
+# minimum run of inactive updates to skip when replaying
+CHECKPOINT_MIN_UPDATES = 1000
+
 
 class FlumineMarketStream(MarketStream):
     """
@@ -40,6 +51,8 @@ class FlumineMarketStream(MarketStream):
             market_id = market_book["id"]
             full_image = market_book.get("img", False)
             market_book_cache = self._caches.get(market_id)
+            # deltas can only be used if the previous update was yielded
+            sequential = not full_image and market_book_cache is not None
 
             if (
                 full_image or market_book_cache is None
@@ -119,6 +132,8 @@ class FlumineMarketStream(MarketStream):
             # check if refresh required
             if active and not market_book_cache.active:
                 market_book_cache.refresh_cache()
+                sequential = False
+            market_book_cache.streaming_sequential = sequential
 
             market_book_cache.update_cache(market_book, publish_time, active=active)
             self._updates_processed += 1
@@ -248,6 +263,12 @@ class HistoricListener(StreamListener):
         except ValueError:
             logger.error("value error: %s" % raw_data)
             return
+        return self.on_update(data)
+
+    def on_update(self, data: Optional[dict]) -> Optional[bool]:
+        # pre-decoded data, None if the line could not be decoded
+        if data is None:
+            return
 
         # remove error handler / operation check
 
@@ -256,23 +277,242 @@ class HistoricListener(StreamListener):
         return self.stream._process(data[self.stream._lookup], publish_time)
 
 
+def get_json_loads(decoder: Optional[str]) -> Callable:
+    """Returns `loads` of the json module provided,
+    defaults to betfairlightweight (orjson if installed)
+    """
+    if decoder is None:
+        return json.loads
+    try:
+        return importlib.import_module(decoder).loads
+    except (ImportError, AttributeError):
+        logger.warning("Unable to use json decoder '%s', using default", decoder)
+        return json.loads
+
+
+def decode_lines(lines: Iterator[str], loads: Callable) -> Iterator:
+    """Decodes lines ahead of processing, yields None
+    if a line is invalid so that a value is always
+    yielded per line.
+    """
+    for line in lines:
+        try:
+            yield loads(line)
+        except ValueError:
+            logger.error("value error: %s" % line)
+            yield None
+
+
+def read_lines(f: TextIO, buffer_size: int) -> Iterator[str]:
+    """Bounded memory line reader, reads `buffer_size`
+    chunks and yields complete lines (without newline).
+    """
+    remainder = ""
+    pending = []  # chunks without a newline, joined once the line is complete
+    while True:
+        chunk = f.read(buffer_size)
+        if not chunk:
+            break
+        if "\n" not in chunk:
+            pending.append(chunk)
+            continue
+        if pending:
+            pending.append(chunk)
+            chunk = "".join(pending)
+            pending = []
+        lines = (remainder + chunk).split("\n")
+        remainder = lines.pop()
+        yield from lines
+    if remainder or pending:
+        yield remainder + "".join(pending)
+
+
+def get_changed_runners(cache: MarketBookCache) -> Optional[set]:
+    # runners updated by the last delta, None if all runners may have changed
+    if not cache.streaming_sequential or "marketDefinition" in cache.streaming_update:
+        return None
+    return {(rc["id"], rc.get("hc", 0)) for rc in cache.streaming_update.get("rc", ())}
+
+
+def create_cache_resource(cache: MarketBookCache, unique_id: int):
+    market_book = cache.create_resource(unique_id, snap=True)
+    market_book.streaming_sequential = cache.streaming_sequential
+    market_book.streaming_changed_runners = get_changed_runners(cache)
+    return market_book
+
+
+def create_market_book(cache: MarketBookCache, unique_id: int) -> LazyMarketBook:
+    """Faster version of `cache.create_resource`"""
+    data = cache.serialise
+    runners = data.pop("runners")
+    market_book = LazyMarketBook(
+        data,
+        cache._market_definition_resource,
+        [runner.resource for runner in cache.runners],
+        unique_id,
+        True,
+    )
+    data["runners"] = runners
+    market_book.streaming_sequential = cache.streaming_sequential
+    market_book.streaming_changed_runners = get_changed_runners(cache)
+    return market_book
+
+
 class FlumineHistoricalGeneratorStream(HistoricalGeneratorStream):
     """Super fast historical stream"""
 
     def _read_loop(self) -> dict:
         unique_id = self.unique_id
         self.listener.register_stream(unique_id, self.operation)
-        listener_on_data = self.listener.on_data  # cache functions
         caches = self.listener.stream._caches
+        if config.simulation_lazy_market_books and not self.listener.lightweight:
+            create_resource = create_market_book
+        else:
+            create_resource = create_cache_resource
+        for active in self._process_file():
+            if active:
+                yield [
+                    create_resource(cache, unique_id)
+                    for cache in caches.values()
+                    if cache.active
+                ]
+
+    def _process_file(self) -> Iterator[bool]:
+        stream = self.listener.stream
+        compiled = is_compiled_file(self.file_path)
+        updates = self._read_updates(compiled)
+        checkpoint_path = self._checkpoint_path()
+        loads = None
+        if compiled:
+            # pre-parsed so skip json decode
+            stream_process = stream._process
+
+            def process(update: tuple) -> bool:
+                return stream_process(update[1], update[0])
+
+        elif config.simulation_json_decoder:
+            process = self.listener.on_update
+            loads = get_json_loads(config.simulation_json_decoder)
+        else:
+            process = self.listener.on_data  # cache functions
+
+        def decode(lines: Iterator) -> Iterator:
+            # decode ahead (checkpoint replay skips lines without decoding)
+            if loads is None:
+                return lines
+            return decode_lines(lines, loads)
+
+        if checkpoint_path is None:
+            for update in decode(updates):
+                yield process(update)
+        elif os.path.exists(checkpoint_path):
+            # skip ahead over inactive updates
+            with open(checkpoint_path, "rb") as f:
+                checkpoints = pickle.load(f)
+            line_number = 0
+            for run_start, resume, state in checkpoints:
+                for update in decode(
+                    itertools.islice(updates, run_start - line_number)
+                ):
+                    yield process(update)
+                for _ in itertools.islice(updates, resume - run_start):
+                    pass
+                caches, inplay_publish_times = pickle.loads(state)
+                stream._caches.clear()
+                stream._caches.update(caches)
+                stream.inplay_publish_times.clear()
+                stream.inplay_publish_times.update(inplay_publish_times)
+                line_number = resume
+                yield True
+            for update in decode(updates):
+                yield process(update)
+        else:
+            checkpoints = []  # [(run_start, resume, state), ..]
+            run_start = None
+            for line_number, update in enumerate(decode(updates)):
+                active = process(update)
+                if active:
+                    if (
+                        run_start is not None
+                        and line_number - run_start >= CHECKPOINT_MIN_UPDATES
+                    ):
+                        # state after the first active update
+                        state = pickle.dumps(
+                            (stream._caches, stream.inplay_publish_times),
+                            protocol=pickle.HIGHEST_PROTOCOL,
+                        )
+                        checkpoints.append((run_start, line_number + 1, state))
+                    run_start = None
+                elif run_start is None:
+                    run_start = line_number
+                yield active
+            self._create_checkpoint(checkpoint_path, checkpoints)
+
+    def _read_updates(self, compiled: bool) -> Iterator:
+        if compiled:
+            yield from read_compiled_file(self.file_path)
+            return
+        buffer_size = config.simulation_read_buffer_size
         with smart_open.open(self.file_path, "r") as f:
-            file = f.readlines()  # read entire file into memory (faster)
-            for update in file:
-                if listener_on_data(update):
-                    yield [
-                        cache.create_resource(unique_id, snap=True)
-                        for cache in caches.values()
-                        if cache.active
-                    ]
+            if buffer_size:
+                yield from read_lines(f, buffer_size)  # bounded memory
+            else:
+                yield from f.readlines()  # read entire file into memory (faster)
+
+    def _checkpoint_path(self) -> Optional[str]:
+        """Checkpoints are only created for market streams
+        filtered by inplay / seconds_to_start where the
+        initial updates are processed but not yielded.
+        """
+        directory = config.simulation_checkpoint_directory
+        listener = self.listener
+        if (
+            directory is None
+            or self.operation != "marketSubscription"
+            or (not listener.inplay and listener.seconds_to_start is None)
+        ):
+            return
+        try:
+            file_stat = os.stat(self.file_path)
+        except (OSError, TypeError):
+            return  # local files only
+        key = repr(
+            (
+                os.path.abspath(self.file_path),
+                file_stat.st_size,
+                file_stat.st_mtime_ns,
+                listener.inplay,
+                listener.seconds_to_start,
+                listener.max_inplay_seconds,
+                listener.lightweight,
+                listener.calculate_market_tv,
+                listener.cumulative_runner_tv,
+                betfairlightweight.__version__,
+            )
+        )
+        return os.path.join(
+            directory,
+            "%s.%s.checkpoint"
+            % (
+                os.path.basename(self.file_path),
+                hashlib.sha1(key.encode()).hexdigest()[:16],
+            ),
+        )
+
+    def _create_checkpoint(self, checkpoint_path: str, checkpoints: list) -> None:
+        os.makedirs(os.path.dirname(checkpoint_path), exist_ok=True)
+        temp_path = "%s.%s" % (checkpoint_path, os.getpid())
+        with open(temp_path, "wb") as f:
+            pickle.dump(checkpoints, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, checkpoint_path)  # atomic for multiprocessing
+        logger.info(
+            "Created checkpoint for %s",
+            self.file_path,
+            extra={
+                "checkpoint_path": checkpoint_path,
+                "checkpoints": [(c[0], c[1]) for c in checkpoints],
+            },
+        )
 
 
 class HistoricalStream(BaseStream):
@@ -11,7 +11,8 @@ from .orderstream import OrderStream
 from .simulatedorderstream import SimulatedOrderStream
 from .betdaqorderpolling import BetdaqOrderPolling
 from ..clients import VenueType, BaseClient
-from ..utils import get_file_md
+from ..utils import get_file_md, merge_market_filters
+from .. import config
 from betfairlightweight.resources.streamingresources import MarketDefinition
 
 logger = logging.getLogger(__name__)
@@ -120,9 +121,10 @@ class Streams:
                         stream.stream_id,
                         strategy,
                     )
-                    strategy.streams.append(stream)
                     break
-            else:  # nope? lets create a new one
+            else:
+                stream = self._coalesce_stream(strategy, market_filter)
+            if stream is None:  # nope? lets create a new one
                 stream_id = self._increment_stream_id()
                 logger.info(
                     "Creating new %s (%s) for strategy %s",
@@ -139,7 +141,10 @@ class Streams:
                     conflate_ms=strategy.conflate_ms,
                 )
                 self._streams.append(stream)
-                strategy.streams.append(stream)
+            strategy.streams.append(stream)
+            if self._coalesce(strategy, market_filter):
+                # strategy only processes markets from its own filter(s)
+                strategy.stream_market_filters[stream].append(market_filter)
         # sports data
         for subscription in strategy.sports_data_filter:
             for stream in self:  # check if sports data stream already exists
@@ -173,6 +178,52 @@ class Streams:
                 self._streams.append(stream)
                 strategy.streams.append(stream)
 
+    @staticmethod
+    def _coalesce(strategy: BaseStrategy, market_filter: dict) -> bool:
+        # market definition required to filter markets per strategy
+        return (
+            config.coalesce_market_streams
+            and isinstance(market_filter, dict)
+            and issubclass(strategy.stream_class, MarketStream)
+            and "EX_MARKET_DEF" in strategy.market_data_filter.get("fields", [])
+        )
+
+    def _coalesce_stream(
+        self, strategy: BaseStrategy, market_filter: dict
+    ) -> Optional[MarketStream]:
+        """Widens the market filter of an existing (not
+        started) stream to cover market_filter, only
+        possible if the union can be represented as a
+        single market filter.
+        """
+        if not self._coalesce(strategy, market_filter):
+            return
+        for stream in self:
+            if (
+                type(stream) is strategy.stream_class
+                and not stream.is_alive()
+                and isinstance(stream.market_filter, dict)
+                and stream.market_data_filter == strategy.market_data_filter
+                and stream.streaming_timeout == strategy.streaming_timeout
+                and stream.conflate_ms == strategy.conflate_ms
+            ):
+                merged_market_filter = merge_market_filters(
+                    stream.market_filter, market_filter
+                )
+                if merged_market_filter is not None:
+                    logger.info(
+                        "Coalescing %s (%s) for strategy %s",
+                        strategy.stream_class,
+                        stream.stream_id,
+                        strategy,
+                        extra={
+                            "market_filter": market_filter,
+                            "stream_market_filter": merged_market_filter,
+                        },
+                    )
+                    stream.market_filter = merged_market_filter
+                    return stream
+
     def add_historical_stream(
         self,
         strategy: BaseStrategy,
@@ -1,12 +1,16 @@
 import re
+import sys
+import mmap
 import uuid
+import struct
+import marshal
 import logging
 import hashlib
 import datetime
 import functools
 import smart_open
 from pathlib import Path
-from typing import Optional, Tuple, Callable, Union
+from typing import Iterator, Optional, Tuple, Callable, Union
 from decimal import Decimal, ROUND_HALF_UP
 
 from betfairlightweight.compat import json
@@ -54,6 +58,27 @@ BETDAQ_MAX_PRICE = 1000
 MARKET_ID_REGEX = re.compile(r"1.\d{9}")
 EVENT_ID_REGEX = re.compile(r"\d{8}")
 STRATEGY_NAME_HASH_LENGTH = 13
+# compiled historical files (marshal format is python version specific)
+COMPILED_FILE_PREFIX = b"FLUMINE-COMPILED-"
+COMPILED_FILE_HEADER = COMPILED_FILE_PREFIX + b"%s-%d.%d-%d\n" % (
+    sys.implementation.name.encode(),
+    *sys.version_info[:2],
+    marshal.version,
+)  # e.g. FLUMINE-COMPILED-cpython-3.11-4
+COMPILED_RECORD_LENGTH = struct.Struct("<I")
+COMPILED_CHANGE_KEYS = ("mc", "rc", "cc")
+# streaming market filter keys and the MarketDefinition attribute they filter
+MARKET_FILTER_ATTRIBUTES = {
+    "bspMarket": "bsp_market",
+    "bettingTypes": "betting_type",
+    "eventTypeIds": "event_type_id",
+    "eventIds": "event_id",
+    "turnInPlayEnabled": "turn_in_play_enabled",
+    "marketTypes": "market_type",
+    "venues": "venue",
+    "countryCodes": "country_code",
+    "raceTypes": "race_type",
+}
 
 
 def detect_file_type(file_path: Union[str, tuple]) -> str:
@@ -85,9 +110,16 @@ def get_file_md(file_dir: Union[str, tuple]) -> Optional[MarketDefinition]:
     # get value from raw streaming file marketDefinition
     if isinstance(file_dir, tuple):
         file_dir = file_dir[0]
-    with smart_open.open(file_dir, "r") as f:
-        first_line = f.readline()
-        update = json.loads(first_line)
+    if is_compiled_file(file_dir):
+        for publish_time, changes in read_compiled_file(file_dir):
+            update = {"pt": publish_time, "mc": changes}
+            break
+        else:
+            return None
+    else:
+        with smart_open.open(file_dir, "r") as f:
+            first_line = f.readline()
+            update = json.loads(first_line)
     if (
         "mc" not in update
         or not isinstance(update["mc"], list)
@@ -99,11 +131,112 @@ def get_file_md(file_dir: Union[str, tuple]) -> Optional[MarketDefinition]:
     return MarketDefinition(**md)
 
 
+def is_compiled_file(file_path: str) -> bool:
+    try:
+        with open(file_path, "rb") as f:
+            return f.read(len(COMPILED_FILE_PREFIX)) == COMPILED_FILE_PREFIX
+    except (OSError, TypeError):
+        return False
+
+
+def compile_file(file_path: str, output_path: str) -> int:
+    """Pre-parse a historic/recorded streaming file into
+    a memory mappable binary file of (publish_time, changes)
+    records, removing the json decode when replayed. Returns
+    the number of updates written.
+    """
+    count = 0
+    with smart_open.open(file_path, "r") as f, open(output_path, "wb") as o:
+        o.write(COMPILED_FILE_HEADER)
+        for line in f:
+            data = json.loads(line)
+            for key in COMPILED_CHANGE_KEYS:
+                if key in data:
+                    record = marshal.dumps((data["pt"], data[key]))
+                    o.write(COMPILED_RECORD_LENGTH.pack(len(record)))
+                    o.write(record)
+                    count += 1
+                    break
+    return count
+
+
+def read_compiled_file(file_path: str) -> Iterator[Tuple[int, list]]:
+    with open(file_path, "rb") as f:
+        header = f.readline()
+        if header != COMPILED_FILE_HEADER:
+            raise FlumineException(
+                "Compiled file %s created with a different python version (%s), "
+                "recompile required" % (file_path, header.strip())
+            )
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            position, size = len(header), len(mm)
+            unpack_from, loads = COMPILED_RECORD_LENGTH.unpack_from, marshal.loads
+            length_size = COMPILED_RECORD_LENGTH.size
+            while position < size:
+                (length,) = unpack_from(mm, position)
+                position += length_size
+                yield loads(mm[position : position + length])
+                position += length
+
+
 def chunks(l: list, n: int) -> list:
     for i in range(0, len(l), n):
         yield l[i : i + n]
 
 
+def merge_market_filters(
+    market_filter_a: dict, market_filter_b: dict
+) -> Optional[dict]:
+    """Returns a single streaming market filter covering
+    exactly the markets of both filters or None if not
+    possible, filters can only be merged if they differ
+    by a single key.
+    """
+    keys = [
+        key
+        for key in {**market_filter_a, **market_filter_b}
+        if market_filter_a.get(key) != market_filter_b.get(key)
+    ]
+    if len(keys) > 1:
+        return None
+    merged = dict(market_filter_a)
+    for key in keys:
+        if key != "marketIds" and key not in MARKET_FILTER_ATTRIBUTES:
+            return None
+        value_a, value_b = market_filter_a.get(key), market_filter_b.get(key)
+        if isinstance(value_a, list) and isinstance(value_b, list):
+            merged[key] = value_a + [v for v in value_b if v not in value_a]
+        else:
+            # missing key or boolean filter so covers all markets
+            merged.pop(key, None)
+    return merged
+
+
+def market_filter_match(
+    market_filter: dict,
+    market_id: str,
+    market_definition: Optional[MarketDefinition],
+) -> bool:
+    """Returns True if the market matches the streaming
+    market filter, unknown keys are ignored.
+    """
+    for key, value in market_filter.items():
+        if key == "marketIds":
+            market_value = market_id
+        elif key in MARKET_FILTER_ATTRIBUTES:
+            market_value = getattr(
+                market_definition, MARKET_FILTER_ATTRIBUTES[key], None
+            )
+        else:
+            continue
+        if isinstance(value, list):
+            if market_value not in value:
+                return False
+        elif market_value != value:
+            return False
+    return True
+
+
 def create_cheap_hash(txt: str, length: int = 15) -> str:
     # This is just a hash for debugging purposes.
     #    It does not need to be unique, just fast and short.
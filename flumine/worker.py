@@ -330,3 +330,33 @@ def betdaq_settled_orders(context: dict, flumine) -> None:
 
                 sequence_number = new_sequence_number
                 context[client] = new_sequence_number
+
+
+def log_profiler(context: dict, flumine) -> None:
+    # log and reset event loop timings
+    profiler = flumine.profiler
+    if profiler:
+        stages = profiler.reset()
+        logger.info("Profiler summary", extra={"profiler": profiler.summary(stages)})
+
+
+def log_handler_queue(context: dict, flumine) -> None:
+    # log and reset handler queue depth / residence time
+    info = flumine.handler_queue.reset()
+    logger.info("Handler queue summary", extra={"handler_queue": info})
+
+
+def log_execution_thread_pool(context: dict, flumine) -> None:
+    # log and reset execution thread pool depth / queue time per package type (prioritised)
+    info = flumine.betfair_execution.reset_thread_pool_info()
+    logger.info("Execution thread pool summary", extra={"thread_pool": info})
+
+
+def refresh_http_sessions(context: dict, flumine) -> None:
+    # warm and keep alive execution http sessions
+    execution = flumine.betfair_execution
+    execution.refresh_http_sessions(config.http_session_warm_count)
+    logger.debug(
+        "HTTP sessions refreshed",
+        extra={"http_sessions": execution.http_session_info},
+    )
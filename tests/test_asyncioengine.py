@@ -0,0 +1,78 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from flumine.execution import asyncioengine
+from flumine.execution.asyncioengine import AsyncioEngine
+
+
+@mock.patch("flumine.execution.asyncioengine.aiohttp")
+class AsyncioEngineTest(unittest.TestCase):
+    def _create_engine(self) -> AsyncioEngine:
+        engine = AsyncioEngine("test", max_connections=2)
+        self.addCleanup(engine.shutdown, 1)
+        return engine
+
+    def test_init(self, mock_aiohttp):
+        engine = self._create_engine()
+        self.assertEqual(engine.name, "test")
+        self.assertEqual(engine.max_connections, 2)
+        self.assertEqual(engine.in_flight, 0)
+        self.assertIsNone(engine._http_session)
+        self.assertTrue(engine._thread.daemon)
+        self.assertEqual(engine.info, {"in_flight": 0, "max_connections": 2})
+
+    def test_init_no_aiohttp(self, mock_aiohttp):
+        with mock.patch.object(asyncioengine, "aiohttp", None):
+            with self.assertRaises(ImportError):
+                AsyncioEngine("test")
+
+    def test_submit(self, mock_aiohttp):
+        engine = self._create_engine()
+        engine.start()
+
+        async def coro():
+            return engine.in_flight, asyncio.get_running_loop()
+
+        self.assertEqual(engine.submit(coro()).result(1), (1, engine.loop))
+        self.assertEqual(engine.in_flight, 0)
+
+    def test_post(self, mock_aiohttp):
+        mock_response = mock.Mock(status=200)
+        mock_response.read = mock.AsyncMock(return_value=b"{}")
+        mock_http_session = mock_aiohttp.ClientSession.return_value
+        mock_http_session.post.return_value.__aenter__ = mock.AsyncMock(
+            return_value=mock_response
+        )
+        mock_http_session.post.return_value.__aexit__ = mock.AsyncMock(
+            return_value=None
+        )
+        engine = self._create_engine()
+        self.assertEqual(
+            asyncio.run(engine.post("url", "data", {"a": 1}, 1.1, 2.2)),
+            (200, b"{}"),
+        )
+        mock_aiohttp.TCPConnector.assert_called_with(limit=2)
+        mock_aiohttp.ClientTimeout.assert_called_with(sock_connect=1.1, sock_read=2.2)
+        mock_http_session.post.assert_called_with(
+            "url",
+            data="data",
+            headers={"a": 1},
+            timeout=mock_aiohttp.ClientTimeout.return_value,
+        )
+
+    def test_shutdown(self, mock_aiohttp):
+        engine = AsyncioEngine("test")
+        engine._http_session = mock.Mock(close=mock.AsyncMock())
+        engine.start()
+        engine.submit(asyncio.sleep(0.01))
+        engine.shutdown(1)
+        self.assertFalse(engine._thread.is_alive())
+        self.assertTrue(engine.loop.is_closed())
+        self.assertEqual(engine.in_flight, 0)
+        engine._http_session.close.assert_called_with()
+
+    def test_shutdown_not_started(self, mock_aiohttp):
+        engine = AsyncioEngine("test")
+        engine.shutdown()
+        self.assertTrue(engine.loop.is_closed())
@@ -7,6 +7,7 @@ from flumine.baseflumine import (
     MaxTransactionCount,
     SimulatedMiddleware,
     Market,
+    log_profiler,
 )
 from flumine.clients import VenueType
 from flumine.exceptions import ClientError
@@ -95,6 +96,17 @@ class BaseFlumineTest(unittest.TestCase):
         )
         mock_log_control.assert_called_with(mock_events.StrategyEvent(mock_strategy))
 
+    @mock.patch("flumine.baseflumine.BaseFlumine.add_worker")
+    def test_enable_profiler(self, mock_add_worker):
+        profiler = self.base_flumine.enable_profiler(30, 5)
+        self.assertIs(self.base_flumine.profiler, profiler)
+        self.assertEqual(profiler.sample_rate, 5)
+        worker = mock_add_worker.call_args[0][0]
+        self.assertEqual(worker.function, log_profiler)
+        self.assertEqual(worker.interval, 30)
+        self.base_flumine.enable_profiler(None)
+        mock_add_worker.assert_called_once()
+
     def test_add_worker(self):
         mock_worker = mock.Mock()
         self.base_flumine.add_worker(mock_worker)
@@ -173,6 +185,59 @@ class BaseFlumineTest(unittest.TestCase):
         mock_strategy.check_market_book.assert_not_called()
         mock_strategy.process_market_book.assert_not_called()
 
+    def test__process_market_books_not_in_view(self):
+        self.base_flumine.streams = mock.Mock()
+        mock_strategy = mock.Mock(stream_ids=[1])
+        mock_strategy.market_in_view.return_value = False
+        self.base_flumine.add_strategy(mock_strategy)
+        mock_market_book = mock.Mock(
+            publish_time_epoch=123, market_id="1.123", streaming_unique_id=1, runners=[]
+        )
+        mock_event = mock.Mock(event=[mock_market_book])
+        self.base_flumine._process_market_books(mock_event)
+        mock_strategy.market_in_view.assert_called_with(
+            1, "1.123", mock_market_book.market_definition
+        )
+        mock_strategy.process_new_market.assert_not_called()
+        mock_strategy.check_market_book.assert_not_called()
+
+    def test__process_market_books_profiler(self):
+        self.base_flumine.streams = mock.Mock()
+        mock_strategy = mock.Mock(stream_ids=[1])
+        mock_strategy.check_market_book.side_effect = [False, True, True]
+        self.base_flumine.add_strategy(mock_strategy)
+        mock_middleware = mock.Mock()
+        self.base_flumine._market_middleware = [mock_middleware]
+        mock_profiler = mock.Mock(sampling=True)
+        self.base_flumine.profiler = mock_profiler
+        mock_market_book = mock.Mock(
+            publish_time_epoch=123, market_id="1.123", streaming_unique_id=1, runners=[]
+        )
+        mock_event = mock.Mock(event=[mock_market_book])
+        self.base_flumine._process_market_books(mock_event)
+        self.assertEqual(
+            [c[0][:2] for c in mock_profiler.record.call_args_list],
+            [
+                ("market", None),
+                ("middleware", mock_middleware),
+                ("check_market_book", mock_strategy),
+            ],
+        )
+        mock_profiler.record.reset_mock()
+        self.base_flumine._process_market_books(mock_event)
+        self.assertEqual(
+            [c[0][:2] for c in mock_profiler.record.call_args_list][-2:],
+            [
+                ("check_market_book", mock_strategy),
+                ("process_market_book", mock_strategy),
+            ],
+        )
+        # not sampled
+        mock_profiler.sampling = False
+        mock_profiler.record.reset_mock()
+        self.base_flumine._process_market_books(mock_event)
+        mock_profiler.record.assert_not_called()
+
     def test__process_market_books_check_market_books(self):
         """
         Tests base_flumine._process_market_books() with different return values
@@ -458,6 +523,7 @@ class BaseFlumineTest(unittest.TestCase):
             mock_strategy, mock_market, [mock_order]
         )
         mock_market.blotter.complete_order.assert_called_with(mock_order)
+        mock_market.blotter.has_live_order.assert_called_with(mock_order)
 
     @mock.patch("flumine.baseflumine.utils.call_process_orders_error_handling")
     @mock.patch("flumine.baseflumine.process_betdaq_current_orders")
@@ -691,6 +757,8 @@ class BaseFlumineTest(unittest.TestCase):
         mock__process_cleared_markets.assert_called_with(
             mock_events.ClearedMarketsEvent()
         )
+        cleared_markets = mock_events.ClearedMarketsEvent.call_args_list[0][0][0]
+        self.assertEqual(cleared_markets.client, self.mock_client)
 
     @mock.patch("flumine.baseflumine.events")
     @mock.patch("flumine.baseflumine.BaseFlumine.log_control")
@@ -758,6 +826,26 @@ class BaseFlumineTest(unittest.TestCase):
 
     def test_info(self):
         self.assertTrue(self.base_flumine.info)
+        self.assertIsNone(self.base_flumine.info["profiler"])
+        self.base_flumine.enable_profiler(None)
+        self.base_flumine.profiler.add("market", None, 0.1)
+        self.assertEqual(self.base_flumine.info["profiler"]["market"]["count"], 1)
+
+    @mock.patch("flumine.baseflumine.config")
+    @mock.patch("flumine.baseflumine.BaseFlumine._process_end_flumine")
+    @mock.patch("flumine.baseflumine.BaseFlumine.log_control")
+    def test_enter_execution_priorities(
+        self, mock_log_control, mock__process_end_flumine, mock_config
+    ):
+        mock_config.execution_priorities = None
+        self.mock_client.execution_priorities = None
+        with self.base_flumine:
+            pass
+        self.mock_client.execution.enable_execution_priorities.assert_not_called()
+        self.mock_client.execution_priorities = {"Cancel": 0, "Place": 1}
+        with self.base_flumine:
+            pass
+        self.mock_client.execution.enable_execution_priorities.assert_called_with()
 
     def test_enter_no_clients(self):
         self.base_flumine.clients._clients = []
@@ -0,0 +1,111 @@
+import time
+import unittest
+from unittest import mock
+
+from flumine.execution.batcher import OrderPackageBatcher
+from flumine.order.orderpackage import BetfairOrderPackage, OrderPackageType
+
+
+class OrderPackageBatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.mock_handler = mock.Mock()
+        self.batcher = OrderPackageBatcher(self.mock_handler, 0.01)
+        self.mock_client = mock.Mock()
+        self.addCleanup(self.batcher.shutdown)
+
+    def _create_package(self, order_count=1, **kwargs):
+        package_kwargs = dict(
+            client=self.mock_client,
+            market_id="1.234",
+            orders=[mock.Mock(status=None) for _ in range(order_count)],
+            package_type=OrderPackageType.PLACE,
+            bet_delay=0,
+            market_version=None,
+            customer_strategy_ref="test",
+        )
+        package_kwargs.update(kwargs)
+        return BetfairOrderPackage(**package_kwargs)
+
+    def test_init(self):
+        self.assertEqual(self.batcher.handler, self.mock_handler)
+        self.assertEqual(self.batcher.window, 0.01)
+        self.assertEqual(self.batcher._pending, {})
+        self.assertTrue(self.batcher._thread.daemon)
+
+    def test_add(self):
+        package_one = self._create_package()
+        package_two = self._create_package()
+        package_three = self._create_package(market_version=123)
+        for package in (package_one, package_two, package_three):
+            self.batcher.add(package)
+        self.assertEqual(len(self.batcher._pending), 2)
+        self.assertEqual(len(self.batcher._deadlines), 2)
+        self.assertEqual(
+            self.batcher._pending[OrderPackageBatcher._key(package_one)],
+            [package_one, package_two],
+        )
+        self.mock_handler.assert_not_called()
+
+    @mock.patch("flumine.order.orderpackage.BetfairOrderPackage.order_limit")
+    def test_add_limit(self, mock_order_limit):
+        mock_order_limit.return_value = 3
+        package_one = self._create_package(2)
+        package_two = self._create_package(2)
+        self.batcher.add(package_one)
+        self.batcher.add(package_two)
+        self.mock_handler.assert_called_once_with(package_one)
+        self.assertEqual(
+            list(self.batcher._pending.values()),
+            [[package_two]],
+        )
+        self.assertEqual(len(self.batcher._deadlines), 2)
+
+    def test_window(self):
+        self.batcher.start()
+        package_one = self._create_package()
+        package_two = self._create_package()
+        self.batcher.add(package_one)
+        self.batcher.add(package_two)
+        for _ in range(100):
+            if self.mock_handler.called:
+                break
+            time.sleep(0.01)
+        self.mock_handler.assert_called_once()
+        order_package = self.mock_handler.call_args[0][0]
+        self.assertEqual(order_package.orders, package_one.orders + package_two.orders)
+        self.assertEqual(self.batcher._pending, {})
+        self.assertEqual(
+            self.batcher.info,
+            {"window": 0.01, "packages_received": 2, "packages_sent": 1},
+        )
+
+    def test_dispatch_error(self):
+        self.mock_handler.side_effect = ValueError
+        self.batcher._dispatch([self._create_package()])
+        self.assertEqual(self.batcher.packages_sent, 1)
+
+    def test_merge(self):
+        package_one = self._create_package(2)
+        package_two = self._create_package(1)
+        order_package = OrderPackageBatcher.merge([package_one, package_two])
+        self.assertIsInstance(order_package, BetfairOrderPackage)
+        self.assertEqual(order_package.client, self.mock_client)
+        self.assertEqual(order_package.market_id, "1.234")
+        self.assertEqual(order_package.package_type, OrderPackageType.PLACE)
+        self.assertEqual(order_package.customer_strategy_ref, "test")
+        self.assertEqual(order_package.orders, package_one.orders + package_two.orders)
+        self.assertEqual(order_package._time_created, package_one._time_created)
+
+    def test_merge_single(self):
+        package = self._create_package()
+        self.assertEqual(OrderPackageBatcher.merge([package]), package)
+
+    def test_shutdown(self):
+        self.batcher.start()
+        package = self._create_package()
+        self.batcher.window = 60
+        self.batcher.add(package)
+        self.batcher.shutdown()
+        self.mock_handler.assert_called_once_with(package)
+        self.assertFalse(self.batcher._thread.is_alive())
+        self.assertEqual(self.batcher._pending, {})
@@ -1,10 +1,12 @@
+import random
 import unittest
 from unittest import mock
 
 from flumine.markets.blotter import Blotter, PENDING_STATUS
-from flumine.order.order import OrderStatus
+from flumine.order.order import BaseOrder, OrderStatus
 from flumine.order.ordertype import MarketOnCloseOrder, LimitOrder, LimitOnCloseOrder
 from flumine.order.trade import TradeStatus
+from flumine.utils import calculate_matched_exposure, calculate_unmatched_exposure
 
 
 class BlotterTest(unittest.TestCase):
@@ -16,12 +18,21 @@ class BlotterTest(unittest.TestCase):
         self.assertFalse(self.blotter.active)
         self.assertEqual(self.blotter._orders, {})
         self.assertEqual(self.blotter._bet_id_lookup, {})
-        self.assertEqual(self.blotter._live_orders, [])
+        self.assertEqual(self.blotter._live_orders, {})
+        self.assertEqual(self.blotter._selection_live_orders, {})
+        self.assertEqual(self.blotter._exposure_ledger, {})
+        self.assertIsNone(self.blotter._exposure_batch)
         self.assertEqual(self.blotter._trades, {})
         self.assertEqual(self.blotter._strategy_orders, {})
         self.assertEqual(self.blotter._strategy_selection_orders, {})
         self.assertEqual(self.blotter._client_orders, {})
         self.assertEqual(self.blotter._client_strategy_orders, {})
+        self.assertEqual(self.blotter._strategy_trades, {})
+        self.assertEqual(self.blotter._strategy_status_orders, {})
+        self.assertEqual(self.blotter._strategy_selection_status_orders, {})
+        self.assertEqual(self.blotter._client_status_orders, {})
+        self.assertEqual(self.blotter._client_strategy_status_orders, {})
+        self.assertEqual(self.blotter._order_status_indexes, {})
         self.assertEqual(
             PENDING_STATUS,
             [
@@ -37,6 +48,28 @@ class BlotterTest(unittest.TestCase):
         self.blotter["456"] = mock_order
         self.assertEqual(self.blotter.get_order_bet_id("123"), mock_order)
 
+    def test_get_order_bet_id_rebuild(self):
+        mock_order = mock.Mock(selection_id=2, handicap=3, bet_id=None)
+        self.blotter["456"] = mock_order
+        self.assertEqual(self.blotter._bet_id_lookup, {})
+        # assigned without update_bet_id
+        mock_order.bet_id = "123"
+        self.assertEqual(self.blotter.get_order_bet_id("123"), mock_order)
+        self.assertEqual(self.blotter._bet_id_lookup, {"123": mock_order})
+        # stale
+        mock_order.bet_id = "789"
+        self.assertIsNone(self.blotter.get_order_bet_id("123"))
+        self.assertEqual(self.blotter._bet_id_lookup, {"789": mock_order})
+
+    def test_update_bet_id(self):
+        mock_order = mock.Mock(selection_id=2, handicap=3, bet_id=None)
+        self.blotter["456"] = mock_order
+        self.blotter.update_bet_id(mock_order)
+        self.assertEqual(self.blotter._bet_id_lookup, {})
+        mock_order.bet_id = "123"
+        self.blotter.update_bet_id(mock_order)
+        self.assertEqual(self.blotter._bet_id_lookup, {"123": mock_order})
+
     def test_get_trade(self):
         """Tests retrieving the trade by trade ID."""
         trade_id = "abc-789"
@@ -48,11 +81,12 @@ class BlotterTest(unittest.TestCase):
 
     def test_strategy_trades(self):
         mock_trade_one = mock.Mock(status=TradeStatus.PENDING, strategy=1)
-        self.blotter._trades[mock_trade_one] = []
+        self.blotter["1"] = mock.Mock(trade=mock_trade_one)
+        self.blotter["2"] = mock.Mock(trade=mock_trade_one)
         mock_trade_two = mock.Mock(status=TradeStatus.LIVE, strategy=1)
-        self.blotter._trades[mock_trade_two] = []
+        self.blotter["3"] = mock.Mock(trade=mock_trade_two)
         mock_trade_three = mock.Mock(status=TradeStatus.LIVE, strategy=2)
-        self.blotter._trades[mock_trade_three] = []
+        self.blotter["4"] = mock.Mock(trade=mock_trade_three)
         self.assertEqual(self.blotter.strategy_trades(0), [])
         self.assertEqual(
             self.blotter.strategy_trades(1),
@@ -103,6 +137,62 @@ class BlotterTest(unittest.TestCase):
             [mock_order_three],
         )
 
+    def test_strategy_orders_status_update(self):
+        mock_trade = mock.Mock(strategy=69, selection_id=2, market_id="1.23")
+        orders = [
+            BaseOrder(mock_trade, "BACK", LimitOrder(price=2.0, size=2.0))
+            for _ in range(3)
+        ]
+        for order in orders:
+            self.blotter[order.id] = order
+        self.assertEqual(self.blotter.strategy_orders(69, order_status=[None]), orders)
+        orders[2].placing()
+        orders[1].placing()
+        orders[1].executable()
+        orders[0].executable()
+        self.assertEqual(
+            self.blotter.strategy_orders(69, order_status=[OrderStatus.EXECUTABLE]),
+            [orders[0], orders[1]],
+        )
+        self.assertEqual(
+            self.blotter.strategy_selection_orders(
+                69,
+                2,
+                0,
+                order_status=[OrderStatus.PENDING, OrderStatus.EXECUTABLE],
+            ),
+            orders,
+        )
+        orders[1].execution_complete()
+        self.assertEqual(
+            self.blotter.client_strategy_orders(
+                orders[1].client, 69, order_status=[OrderStatus.EXECUTION_COMPLETE]
+            ),
+            [orders[1]],
+        )
+        self.assertEqual(
+            self.blotter.client_orders(
+                orders[1].client, order_status=[OrderStatus.EXECUTABLE]
+            ),
+            [orders[0]],
+        )
+        self.assertEqual(self.blotter.strategy_orders(12, order_status=[None]), [])
+        self.assertEqual(
+            self.blotter.strategy_orders(69, order_status=[OrderStatus.VIOLATION]),
+            [],
+        )
+
+    def test_update_order_status(self):
+        mock_order = mock.Mock(status=OrderStatus.PENDING)
+        self.blotter["1"] = mock_order
+        self.assertEqual(mock_order._blotter, self.blotter)
+        mock_order.status = OrderStatus.EXECUTABLE
+        self.blotter.update_order_status(mock_order, OrderStatus.PENDING)
+        self.assertEqual(
+            self.blotter._strategy_status_orders[mock_order.trade.strategy],
+            {OrderStatus.PENDING: {}, OrderStatus.EXECUTABLE: {mock_order: None}},
+        )
+
     def test_strategy_selection_orders(self):
         mock_order_one = mock.Mock(
             selection_id=2, handicap=3, status=OrderStatus.EXECUTABLE, size_matched=1
@@ -246,14 +336,34 @@ class BlotterTest(unittest.TestCase):
     def test_live_orders(self):
         self.assertEqual(list(self.blotter.live_orders), [])
         mock_order = mock.Mock(complete=False)
-        self.blotter._live_orders = [mock_order]
+        self.blotter._live_orders = {mock_order: None}
         self.assertEqual(list(self.blotter.live_orders), [mock_order])
 
+    def test_live_orders_mutation(self):
+        mock_order = mock.Mock(selection_id=1, handicap=0)
+        mock_order_two = mock.Mock(selection_id=1, handicap=0)
+        self.blotter["1"] = mock_order
+        self.blotter["2"] = mock_order_two
+        # no copy, snapshot required to complete whilst iterating
+        with self.assertRaises(RuntimeError):
+            for order in self.blotter.live_orders:
+                self.blotter.complete_order(order)
+        for order in list(self.blotter.live_orders):
+            self.blotter.complete_order(order)
+        self.assertEqual(list(self.blotter.live_orders), [])
+        self.assertEqual(self.blotter._selection_live_orders, {(1, 0): {}})
+
     def test_has_live_orders(self):
         self.assertFalse(self.blotter.has_live_orders)
-        self.blotter._live_orders = [mock.Mock()]
+        self.blotter._live_orders = {mock.Mock(): None}
         self.assertTrue(self.blotter.has_live_orders)
 
+    def test_has_live_order(self):
+        mock_order = mock.Mock()
+        self.assertFalse(self.blotter.has_live_order(mock_order))
+        self.blotter._live_orders = {mock_order: None}
+        self.assertTrue(self.blotter.has_live_order(mock_order))
+
     def test_process_closed_market(self):
         mock_market = mock.Mock()
         mock_market_book = mock.Mock(number_of_winners=1)
@@ -732,6 +842,234 @@ class BlotterTest(unittest.TestCase):
             },
         )
 
+    def _create_order(self, strategy, side, price, size, **kwargs):
+        kwargs.setdefault("selection_id", 123)
+        kwargs.setdefault("lookup", (self.blotter.market_id, 123, 0))
+        return mock.Mock(
+            trade=mock.Mock(strategy=strategy),
+            handicap=0,
+            side=side,
+            status=OrderStatus.EXECUTABLE,
+            complete=False,
+            average_price_matched=price,
+            size_matched=0,
+            size_remaining=size,
+            order_type=LimitOrder(price=price, size=size),
+            **kwargs,
+        )
+
+    def test_get_exposures_completed(self):
+        mock_strategy = mock.Mock()
+        mock_order = self._create_order(mock_strategy, "BACK", 5.0, 2.0)
+        mock_order_two = self._create_order(mock_strategy, "LAY", 3.0, 4.0)
+        self.blotter["12345"] = mock_order
+        self.blotter["67890"] = mock_order_two
+        mock_order.size_matched, mock_order.size_remaining = 2.0, 0
+        mock_order.complete = True
+        self.blotter.complete_order(mock_order)
+        exposures = self.blotter.get_exposures(mock_strategy, mock_order.lookup)
+        self.assertEqual(
+            exposures,
+            {
+                "matched_profit_if_lose": -2.0,
+                "matched_profit_if_win": 8.0,
+                "worst_possible_profit_on_lose": -2.0,
+                "worst_possible_profit_on_win": 0.0,
+                "worst_potential_unmatched_profit_if_lose": 0.0,
+                "worst_potential_unmatched_profit_if_win": -8.0,
+            },
+        )
+        self.assertEqual(
+            exposures,
+            self.blotter._calculate_exposures(mock_strategy, mock_order.lookup),
+        )
+        # completed orders before the first live order are in the ledger
+        self.assertEqual(
+            self.blotter._exposure_ledger,
+            {(mock_strategy, 123, 0): [1, 0, [-2.0, 8.0, 0.0, 0.0, 0.0, 0.0, [], []]]},
+        )
+        # other strategy
+        self.assertEqual(
+            self.blotter.get_exposures(mock.Mock(), mock_order.lookup)[
+                "worst_possible_profit_on_win"
+            ],
+            0,
+        )
+
+    def test_get_exposures_completed_exclusion(self):
+        mock_strategy = mock.Mock()
+        mock_order = self._create_order(mock_strategy, "BACK", 5.6, 2.0)
+        self.blotter["12345"] = mock_order
+        mock_order.size_matched = 2.0
+        self.blotter.complete_order(mock_order)
+        self.assertEqual(
+            self.blotter.get_exposures(
+                mock_strategy, mock_order.lookup, exclusion=mock_order
+            ),
+            self.blotter._calculate_exposures(
+                mock_strategy, mock_order.lookup, exclusion=mock_order
+            ),
+        )
+        self.assertEqual(
+            self.blotter.get_exposures(mock_strategy, mock_order.lookup)[
+                "matched_profit_if_win"
+            ],
+            9.2,
+        )
+
+    def test_get_exposures_exclusion_not_in_ledger(self):
+        mock_strategy = mock.Mock()
+        mock_order = self._create_order(mock_strategy, "BACK", 5.6, 2.0)
+        mock_order_two = self._create_order(mock_strategy, "BACK", 3.0, 2.0)
+        self.blotter["12345"] = mock_order
+        self.blotter["67890"] = mock_order_two
+        mock_order.size_matched = mock_order_two.size_matched = 2.0
+        mock_order_two.complete = True
+        self.blotter.complete_order(mock_order_two)
+        # completed order behind a live order is not folded into the ledger
+        exposures = self.blotter.get_exposures(
+            mock_strategy, mock_order.lookup, exclusion=mock_order_two
+        )
+        self.assertEqual(exposures["matched_profit_if_win"], 9.2)
+        self.assertEqual(
+            exposures,
+            self.blotter._calculate_exposures(
+                mock_strategy, mock_order.lookup, exclusion=mock_order_two
+            ),
+        )
+        mock_market_book = mock.Mock(number_of_active_runners=2, number_of_winners=1)
+        self.assertEqual(
+            self.blotter.market_exposure(
+                mock_strategy, mock_market_book, exclusion=mock_order_two
+            ),
+            -4.0,
+        )
+
+    def test_refresh_order_exposure(self):
+        mock_strategy = mock.Mock()
+        mock_order = self._create_order(mock_strategy, "LAY", 3.0, 4.0)
+        self.blotter["12345"] = mock_order
+        mock_order.size_matched = 4.0
+        self.blotter.complete_order(mock_order)
+        self.assertEqual(
+            self.blotter.get_exposures(mock_strategy, mock_order.lookup)[
+                "matched_profit_if_win"
+            ],
+            -8.0,
+        )
+        # voided due to non runner
+        mock_order.size_matched = 0
+        self.blotter.refresh_order_exposure(mock_order)
+        self.assertEqual(self.blotter._exposure_ledger, {})
+        self.assertEqual(
+            self.blotter.get_exposures(mock_strategy, mock_order.lookup)[
+                "matched_profit_if_win"
+            ],
+            0,
+        )
+        # live/unknown order
+        self.blotter.refresh_order_exposure(mock.Mock())
+
+    def test_check_exposures(self):
+        mock_strategy = mock.Mock()
+        lookup = (self.blotter.market_id, 123, 0)
+        self.assertTrue(self.blotter.check_exposures(mock_strategy, lookup))
+        mock_order = self._create_order(mock_strategy, "BACK", 5.6, 2.0)
+        self.blotter["12345"] = mock_order
+        mock_order.size_matched, mock_order.size_remaining = 2.0, 0
+        mock_order.complete = True
+        self.blotter.complete_order(mock_order)
+        self.assertTrue(self.blotter.check_exposures(mock_strategy, lookup))
+        # updated without refresh
+        mock_order.size_matched = 1.0
+        self.assertFalse(self.blotter.check_exposures(mock_strategy, lookup))
+
+    def test_check_exposures_random(self):
+        rng = random.Random(42)
+        strategies = [mock.Mock(), mock.Mock()]
+        lookup = (self.blotter.market_id, 123, 0)
+        orders = []
+        for i in range(500):
+            action = rng.random()
+            live_orders = list(self.blotter.live_orders)
+            if action < 0.3 or not live_orders:
+                if rng.random() < 0.2:
+                    order = self._create_order(
+                        rng.choice(strategies),
+                        rng.choice(["BACK", "LAY"]),
+                        None,
+                        None,
+                    )
+                    order.order_type = MarketOnCloseOrder(
+                        liability=round(rng.uniform(1, 100), 2)
+                    )
+                else:
+                    order = self._create_order(
+                        rng.choice(strategies),
+                        rng.choice(["BACK", "LAY"]),
+                        round(rng.uniform(1.01, 20), 2),
+                        round(rng.uniform(2, 100), 2),
+                    )
+                    if rng.random() < 0.1:
+                        order.status = OrderStatus.VIOLATION
+                self.blotter[str(i)] = order
+                orders.append(order)
+            elif action < 0.6:  # fill
+                order = rng.choice(live_orders)
+                if order.order_type.ORDER_TYPE == LimitOrder.ORDER_TYPE:
+                    fill = round(rng.uniform(0, order.size_remaining), 2)
+                    order.size_matched += fill
+                    order.size_remaining -= fill
+            elif action < 0.9:  # cancel / lapse / fill complete
+                order = rng.choice(live_orders)
+                order.size_remaining = 0
+                order.complete = True
+                order.status = OrderStatus.EXECUTION_COMPLETE
+                self.blotter.complete_order(order)
+            else:  # void
+                order = rng.choice(orders)
+                order.size_matched = 0
+                self.blotter.refresh_order_exposure(order)
+            mock_market_book = mock.Mock(
+                number_of_active_runners=10, number_of_winners=1
+            )
+            new_order = self._create_order(
+                rng.choice(strategies),
+                rng.choice(["BACK", "LAY"]),
+                round(rng.uniform(1.01, 20), 2),
+                round(rng.uniform(2, 100), 2),
+            )
+            for strategy in strategies:
+                self.assertTrue(self.blotter.check_exposures(strategy, lookup))
+                exclusion = rng.choice(orders)
+                self.assertEqual(
+                    self.blotter.get_exposures(
+                        strategy, lookup, exclusion=exclusion, new_order=new_order
+                    ),
+                    baseline_get_exposures(
+                        self.blotter,
+                        strategy,
+                        lookup,
+                        exclusion=exclusion,
+                        new_order=new_order,
+                    ),
+                )
+                self.assertEqual(
+                    self.blotter.market_exposure(
+                        strategy,
+                        mock_market_book,
+                        exclusion=exclusion,
+                        new_order=new_order,
+                    ),
+                    baseline_market_exposure(
+                        self.blotter,
+                        strategy,
+                        mock_market_book,
+                        exclusion=exclusion,
+                        new_order=new_order,
+                    ),
+                )
+
     def test_get_exposures_voided(self):
         mock_strategy = mock.Mock()
         mock_trade = mock.Mock(strategy=mock_strategy)
@@ -805,6 +1143,122 @@ class BlotterTest(unittest.TestCase):
             self.blotter.market_exposure(mock_strategy, mock_market_book), -28.6
         )
 
+    def test_market_exposure_random(self):
+        rng = random.Random(7)
+        strategies = [mock.Mock(), mock.Mock()]
+        mock_market_book = mock.Mock(number_of_active_runners=120, number_of_winners=5)
+        orders = []
+        for i in range(300):
+            selection_id = rng.randint(1, 10)
+            order = self._create_order(
+                rng.choice(strategies),
+                rng.choice(["BACK", "LAY"]),
+                round(rng.uniform(1.01, 200), 2),
+                round(rng.uniform(2, 100), 2),
+                selection_id=selection_id,
+                lookup=(self.blotter.market_id, selection_id, 0),
+            )
+            if rng.random() < 0.1:
+                order.order_type = MarketOnCloseOrder(liability=5.0)
+            self.blotter[str(i)] = order
+            orders.append(order)
+            fill = round(rng.uniform(0, order.size_remaining or 0), 2)
+            order.size_matched, order.size_remaining = fill, order.size_remaining - fill
+            if rng.random() < 0.5:
+                order.complete = True
+                self.blotter.complete_order(order)
+            live_orders = list(self.blotter.live_orders)
+            if live_orders and rng.random() < 0.3:  # fill/complete older order
+                order = rng.choice(live_orders)
+                order.size_matched += order.size_remaining or 0
+                order.size_remaining = 0
+                order.complete = True
+                self.blotter.complete_order(order)
+            if rng.random() < 0.05:  # void
+                order = rng.choice(orders)
+                order.size_matched = 0
+                self.blotter.refresh_order_exposure(order)
+            new_order = self._create_order(
+                rng.choice(strategies),
+                rng.choice(["BACK", "LAY"]),
+                round(rng.uniform(1.01, 200), 2),
+                round(rng.uniform(2, 100), 2),
+                selection_id=selection_id + 1,
+                lookup=(self.blotter.market_id, selection_id + 1, 0),
+            )
+            exclusion = rng.choice(orders)
+            for strategy in strategies:
+                self.assertEqual(
+                    self.blotter.market_exposure(strategy, mock_market_book),
+                    baseline_market_exposure(self.blotter, strategy, mock_market_book),
+                )
+                self.assertEqual(
+                    self.blotter.market_exposure(
+                        strategy,
+                        mock_market_book,
+                        exclusion=exclusion,
+                        new_order=new_order,
+                    ),
+                    baseline_market_exposure(
+                        self.blotter,
+                        strategy,
+                        mock_market_book,
+                        exclusion=exclusion,
+                        new_order=new_order,
+                    ),
+                )
+
+    def test_market_exposure_batch(self):
+        mock_strategy = mock.Mock()
+        mock_market_book = mock.Mock(number_of_active_runners=10, number_of_winners=2)
+        for i in range(20):
+            order = self._create_order(
+                mock_strategy,
+                "BACK" if i % 3 else "LAY",
+                2.0 + i,
+                10.0,
+                selection_id=i % 5,
+                lookup=(self.blotter.market_id, i % 5, 0),
+            )
+            self.blotter[str(i)] = order
+            order.size_matched, order.size_remaining = 5.0, 5.0
+            if i % 2:
+                order.complete = True
+                self.blotter.complete_order(order)
+        new_orders = [
+            self._create_order(
+                mock_strategy,
+                "LAY",
+                3.0 + i,
+                10.0,
+                selection_id=i,
+                lookup=(self.blotter.market_id, i, 0),
+            )
+            for i in range(8)
+        ]
+        self.assertTrue(self.blotter.start_exposure_batch())
+        self.assertFalse(self.blotter.start_exposure_batch())
+        for i, new_order in enumerate(new_orders):
+            self.assertEqual(
+                self.blotter.market_exposure(
+                    mock_strategy, mock_market_book, new_order=new_order
+                ),
+                baseline_market_exposure(
+                    self.blotter, mock_strategy, mock_market_book, new_order=new_order
+                ),
+            )
+            # placed orders are pending
+            new_order.status = OrderStatus.PENDING
+            self.blotter["new%s" % i] = new_order
+        self.assertEqual(list(self.blotter._exposure_batch), [mock_strategy])
+        self.blotter.end_exposure_batch()
+        self.assertIsNone(self.blotter._exposure_batch)
+        # pending orders carry no exposure
+        self.assertEqual(
+            self.blotter.market_exposure(mock_strategy, mock_market_book),
+            baseline_market_exposure(self.blotter, mock_strategy, mock_market_book),
+        )
+
     def test_greened_market_position(self):
         mock_strategy = mock.Mock()
         mock_market_book = mock.Mock(number_of_active_runners=6, number_of_winners=1)
@@ -836,8 +1290,12 @@ class BlotterTest(unittest.TestCase):
         )
 
     def test_complete_order(self):
-        self.blotter._live_orders = ["test"]
-        self.blotter.complete_order("test")
+        mock_order = mock.Mock(selection_id=2, handicap=3)
+        self.blotter._live_orders = {mock_order: None}
+        self.blotter._selection_live_orders[(2, 3)] = {mock_order: None}
+        self.blotter.complete_order(mock_order)
+        self.assertEqual(self.blotter._live_orders, {})
+        self.assertEqual(self.blotter._selection_live_orders, {(2, 3): {}})
 
     def test_has_trade(self):
         mock_trade = mock.Mock()
@@ -859,7 +1317,10 @@ class BlotterTest(unittest.TestCase):
         self.assertTrue(self.blotter.active)
         self.assertEqual(self.blotter._orders, {"123": mock_order})
         self.assertEqual(self.blotter._bet_id_lookup, {"456": mock_order})
-        self.assertEqual(self.blotter._live_orders, [mock_order])
+        self.assertEqual(self.blotter._live_orders, {mock_order: None})
+        self.assertEqual(
+            self.blotter._selection_live_orders, {(2, 3): {mock_order: None}}
+        )
         self.assertEqual(self.blotter._trades, {mock_order.trade: [mock_order]})
         self.assertEqual(
             self.blotter._strategy_orders, {mock_order.trade.strategy: [mock_order]}
@@ -885,3 +1346,97 @@ class BlotterTest(unittest.TestCase):
     def test__len(self):
         self.blotter._orders = {"12345": "test", "54321": "test"}
         self.assertEqual(len(self.blotter), 2)
+
+
+def baseline_market_exposure(
+    blotter, strategy, market_book, exclusion=None, new_order=None
+):
+    # per order calculation prior to the exposure ledger
+    orders = blotter.strategy_orders(strategy)
+    runners = set([order.lookup for order in orders])
+    if new_order is not None:
+        runners.add(new_order.lookup)
+    worst_possible_profits = [
+        baseline_get_exposures(
+            blotter,
+            strategy,
+            lookup,
+            exclusion=exclusion,
+            new_order=(
+                new_order
+                if new_order is not None and new_order.lookup == lookup
+                else None
+            ),
+        )
+        for lookup in runners
+    ]
+    worst_possible_profits_on_loses = [
+        wpp["worst_possible_profit_on_lose"] for wpp in worst_possible_profits
+    ]
+    differences = [
+        wpp["worst_possible_profit_on_win"] - wpp["worst_possible_profit_on_lose"]
+        for wpp in worst_possible_profits
+    ] + (market_book.number_of_active_runners - len(runners)) * [0]
+    worst_differences = sorted(differences)[: market_book.number_of_winners]
+    return sum(worst_possible_profits_on_loses) + sum(worst_differences)
+
+
+def baseline_get_exposures(blotter, strategy, lookup, exclusion=None, new_order=None):
+    # per order calculation prior to the exposure ledger
+    mb, ml = [], []  # matched bets, (price, size)
+    ub, ul = [], []  # unmatched bets, (price, size)
+    moc_win_liability = 0.0
+    moc_lose_liability = 0.0
+    for order in blotter.strategy_selection_orders(strategy, *lookup[1:]) + (
+        [new_order] if new_order is not None else []
+    ):
+        if order == exclusion:
+            continue
+        if order.status in PENDING_STATUS:
+            continue
+        if order.order_type.ORDER_TYPE == LimitOrder.ORDER_TYPE:
+            _size_matched = order.size_matched  # cache
+            _order_side = order.side
+            if _size_matched:
+                if order.order_type.price_ladder_definition == "LINE_RANGE":
+                    average_price_matched = 2.0
+                else:
+                    average_price_matched = order.average_price_matched
+                if _order_side == "BACK":
+                    mb.append((average_price_matched, _size_matched))
+                else:
+                    ml.append((average_price_matched, _size_matched))
+            if not order.complete:
+                _size_remaining = order.size_remaining  # cache
+                if order.order_type.price_ladder_definition == "LINE_RANGE":
+                    order_type_price = 2.0
+                else:
+                    order_type_price = order.order_type.price
+                if order_type_price and _size_remaining:
+                    if _order_side == "BACK":
+                        ub.append((order_type_price, _size_remaining))
+                    else:
+                        ul.append((order_type_price, _size_remaining))
+        else:
+            if order.side == "BACK":
+                moc_lose_liability -= order.order_type.liability
+            else:
+                moc_win_liability -= order.order_type.liability
+    matched_exposure = calculate_matched_exposure(mb, ml)
+    unmatched_exposure = calculate_unmatched_exposure(ub, ul)
+
+    worst_possible_profit_on_win = (
+        matched_exposure[0] + unmatched_exposure[0] + moc_win_liability
+    )
+    worst_possible_profit_on_lose = (
+        matched_exposure[1] + unmatched_exposure[1] + moc_lose_liability
+    )
+
+    return {
+        "matched_profit_if_win": matched_exposure[0],
+        "matched_profit_if_lose": matched_exposure[1],
+        "worst_potential_unmatched_profit_if_win": unmatched_exposure[0],
+        "worst_potential_unmatched_profit_if_lose": unmatched_exposure[1],
+        "worst_possible_profit_on_win": worst_possible_profit_on_win,
+        "worst_possible_profit_on_lose": worst_possible_profit_on_lose,
+    }
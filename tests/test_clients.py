@@ -159,6 +159,7 @@ class BaseClientTest(unittest.TestCase):
         self.assertFalse(self.base_client.simulated_full_match)
         self.assertIsNone(self.base_client.execution)
         self.assertIsNone(self.base_client.order_stream_cls)
+        self.assertIsNone(self.base_client.execution_priorities)
 
     def test_init_assert(self):
         with self.assertRaises(AssertionError):
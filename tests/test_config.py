@@ -8,12 +8,24 @@ class ConfigTest(unittest.TestCase):
         self.assertFalse(config.simulated)
         self.assertTrue(config.simulated_strategy_isolation)
         self.assertFalse(config.simulation_available_prices)
+        self.assertIsNone(config.simulation_read_buffer_size)
+        self.assertIsNone(config.simulation_checkpoint_directory)
+        self.assertIsNone(config.simulation_json_decoder)
+        self.assertFalse(config.simulation_lazy_market_books)
+        self.assertFalse(config.coalesce_market_streams)
         self.assertIsNone(config.customer_strategy_ref)
         self.assertIsInstance(config.process_id, int)
         self.assertIsNone(config.current_time)
         self.assertFalse(config.raise_errors)
+        self.assertIsNone(config.handler_queue_policy)
         self.assertEqual(config.max_execution_workers, 32)
+        self.assertIsNone(config.execution_priorities)
+        self.assertEqual(config.http_session_warm_count, 0)
         self.assertFalse(config.async_place_orders)
+        self.assertFalse(config.collapse_cancel_place)
+        self.assertIsNone(config.execution_batch_window)
+        self.assertFalse(config.asyncio_execution)
+        self.assertEqual(config.max_asyncio_connections, 100)
         self.assertEqual(config.place_latency, 0.120)
         self.assertEqual(config.cancel_latency, 0.170)
         self.assertEqual(config.update_latency, 0.150)
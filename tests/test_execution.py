@@ -1,10 +1,15 @@
 import time
+import json
+import asyncio
 import unittest
+import threading
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 from unittest.mock import call
 
 from betdaq import BetdaqError
-from betfairlightweight import BetfairError
+from betfairlightweight import APIClient, BetfairError
 
 from flumine import config
 from flumine.clients.clients import VenueType
@@ -16,8 +21,12 @@ from flumine.execution.baseexecution import (
     OrderPackageType,
 )
 from flumine.execution.betdaqexecution import BetdaqExecution
+from flumine.execution import asyncioengine
+from flumine.execution.asyncioengine import AsyncioEngine
 from flumine.execution.betfairexecution import BetfairExecution
 from flumine.execution.simulatedexecution import SimulatedExecution
+from flumine.execution.prioritypool import PriorityThreadPoolExecutor
+from flumine.order.orderpackage import BetfairOrderPackage
 
 
 class BaseExecutionTest(unittest.TestCase):
@@ -31,10 +40,18 @@ class BaseExecutionTest(unittest.TestCase):
         self.assertEqual(self.execution.flumine, self.mock_flumine)
         self.assertEqual(self.execution._max_workers, 2)
         self.assertIsNotNone(self.execution._thread_pool)
+        self.assertNotIsInstance(
+            self.execution._thread_pool, PriorityThreadPoolExecutor
+        )
+        self.assertIsNone(self.execution.thread_pool_info)
+        self.assertIsNone(self.execution.reset_thread_pool_info())
         self.assertIsNone(self.execution.VENUE)
         self.assertEqual(self.execution._bet_id, 100000000000)
         self.assertEqual(self.execution._sessions, [])
         self.assertEqual(self.execution._sessions_created, 0)
+        self.assertEqual(self.execution._sessions_requested, 0)
+        self.assertEqual(self.execution._sessions_reused, 0)
+        self.assertEqual(self.execution._sessions_evicted, 0)
 
     @mock.patch("flumine.execution.baseexecution.BaseExecution._get_http_session")
     @mock.patch("flumine.execution.baseexecution.BaseExecution.execute_place")
@@ -98,6 +115,50 @@ class BaseExecutionTest(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             self.execution.handler(mock_order_package)
 
+    def test__submit(self):
+        mock_func = mock.Mock()
+        mock_order_package = mock.Mock(package_type=OrderPackageType.PLACE)
+        mock_thread_pool = mock.Mock()
+        self.execution._thread_pool = mock_thread_pool
+        self.assertEqual(
+            self.execution._submit(mock_func, mock_order_package, 1),
+            mock_thread_pool.submit.return_value,
+        )
+        mock_thread_pool.submit.assert_called_with(mock_func, mock_order_package, 1)
+
+    @mock.patch("flumine.execution.baseexecution.config")
+    def test__submit_priorities(self, mock_config):
+        mock_config.execution_priorities = {"Cancel": -1}
+        mock_func = mock.Mock()
+        mock_thread_pool = mock.Mock(spec=PriorityThreadPoolExecutor)
+        self.execution._thread_pool = mock_thread_pool
+        mock_client = mock.Mock(execution_priorities=None)
+        for package_type, client, priority in (
+            (OrderPackageType.CANCEL, mock_client, -1),
+            (OrderPackageType.PLACE, mock_client, 0),
+            # client overrides config
+            (OrderPackageType.PLACE, mock.Mock(execution_priorities={"Place": 3}), 3),
+        ):
+            mock_order_package = mock.Mock(package_type=package_type, client=client)
+            self.execution._submit(mock_func, mock_order_package, 1)
+            mock_thread_pool.submit.assert_called_with(
+                mock_func,
+                mock_order_package,
+                1,
+                priority=priority,
+                lane=package_type.value,
+            )
+        mock_config.execution_priorities = None
+        self.execution._submit(mock_func, mock_order_package, 1)
+        mock_thread_pool.submit.assert_called_with(
+            mock_func, mock_order_package, 1, priority=3, lane="Place"
+        )
+        mock_order_package.client = mock_client
+        self.execution._submit(mock_func, mock_order_package, 1)
+        mock_thread_pool.submit.assert_called_with(
+            mock_func, mock_order_package, 1, priority=0, lane="Place"
+        )
+
     def test_execute_place(self):
         with self.assertRaises(NotImplementedError):
             self.execution.execute_place(None, None)
@@ -114,6 +175,25 @@ class BaseExecutionTest(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             self.execution.execute_place(None, None)
 
+    def test_enable_execution_priorities(self):
+        thread_pool = self.execution._thread_pool
+        self.execution.enable_execution_priorities()
+        self.assertIsInstance(self.execution._thread_pool, PriorityThreadPoolExecutor)
+        self.assertEqual(self.execution._thread_pool._max_workers, 2)
+        self.assertTrue(thread_pool._shutdown)
+        self.assertEqual(
+            self.execution.thread_pool_info,
+            {"depth": 0, "max_depth": 0, "queue_time": {}},
+        )
+        self.assertEqual(
+            self.execution.reset_thread_pool_info(),
+            {"depth": 0, "max_depth": 0, "queue_time": {}},
+        )
+        # only replaced once
+        priority_thread_pool = self.execution._thread_pool
+        self.execution.enable_execution_priorities()
+        self.assertEqual(self.execution._thread_pool, priority_thread_pool)
+
     @mock.patch("flumine.execution.baseexecution.BaseExecution._create_new_session")
     def test__get_http_session(self, mock__create_new_session):
         mock_session_one = mock.Mock(time_returned=time.time())
@@ -122,6 +202,8 @@ class BaseExecutionTest(unittest.TestCase):
         self.assertEqual(self.execution._get_http_session(), mock_session_one)
         self.assertEqual(self.execution._get_http_session(), mock_session_two)
         self.assertEqual(self.execution._get_http_session(), mock__create_new_session())
+        self.assertEqual(self.execution._sessions_requested, 3)
+        self.assertEqual(self.execution._sessions_reused, 2)
 
     @mock.patch("flumine.execution.baseexecution.BaseExecution._return_http_session")
     @mock.patch("flumine.execution.baseexecution.BaseExecution._create_new_session")
@@ -155,6 +237,105 @@ class BaseExecutionTest(unittest.TestCase):
     def test__return_http_session_err_close(self):
         mock_session = mock.Mock()
         self.execution._return_http_session(mock_session, err=True)
+        self.assertEqual(self.execution._sessions_evicted, 1)
+
+    @mock.patch("flumine.execution.baseexecution.BaseExecution._warm_http_session")
+    def test_refresh_http_sessions_no_url(self, mock__warm_http_session):
+        self.execution.refresh_http_sessions(2)
+        mock__warm_http_session.assert_not_called()
+        self.assertEqual(self.execution._sessions, [])
+
+    @mock.patch(
+        "flumine.execution.baseexecution.BaseExecution.http_session_urls",
+        new_callable=mock.PropertyMock,
+        return_value=["url"],
+    )
+    @mock.patch(
+        "flumine.execution.baseexecution.BaseExecution._warm_http_session",
+        return_value=True,
+    )
+    def test_refresh_http_sessions(self, mock__warm_http_session, _):
+        mock_session_one = mock.Mock(time_returned=time.time())
+        mock_session_two = mock.Mock(time_returned=time.time() - 61)
+        self.execution._sessions = [mock_session_one, mock_session_two]
+        self.execution.refresh_http_sessions(2)
+        mock__warm_http_session.assert_called_once_with(mock_session_two, ["url"])
+        self.assertEqual(self.execution._sessions, [mock_session_one, mock_session_two])
+        self.assertGreater(mock_session_two.time_returned, time.time() - 1)
+        # top up capped at max_workers
+        self.execution.refresh_http_sessions(5)
+        self.assertEqual(len(self.execution._sessions), 2)
+        self.execution._sessions = [mock_session_one]
+        self.execution.refresh_http_sessions(2)
+        self.assertEqual(len(self.execution._sessions), 2)
+        self.assertEqual(self.execution._sessions_created, 1)
+
+    @mock.patch(
+        "flumine.execution.baseexecution.BaseExecution.http_session_urls",
+        new_callable=mock.PropertyMock,
+        return_value=["url"],
+    )
+    @mock.patch(
+        "flumine.execution.baseexecution.BaseExecution._warm_http_session",
+        return_value=False,
+    )
+    def test_refresh_http_sessions_error(self, mock__warm_http_session, _):
+        mock_session = mock.Mock(time_returned=time.time() - 61)
+        self.execution._sessions = [mock_session]
+        self.execution.refresh_http_sessions(2)
+        self.assertEqual(self.execution._sessions, [])
+        self.assertEqual(mock__warm_http_session.call_count, 2)
+        self.assertEqual(self.execution._sessions_evicted, 2)
+
+    def test__warm_http_session(self):
+        mock_session = mock.Mock()
+        self.assertTrue(
+            self.execution._warm_http_session(mock_session, ["url", "url_it"])
+        )
+        mock_session.head.assert_has_calls(
+            [mock.call("url", timeout=3.05), mock.call("url_it", timeout=3.05)]
+        )
+        mock_session.head.side_effect = requests.ConnectionError()
+        self.assertFalse(
+            self.execution._warm_http_session(mock_session, ["url", "url_it"])
+        )
+        mock_session.head.assert_called_with("url", timeout=3.05)
+
+    def test_http_session_urls(self):
+        self.assertEqual(self.execution.http_session_urls, [])
+
+    def test_http_session_counters_threaded(self):
+        def get_and_return():
+            for _ in range(1000):
+                self.execution._return_http_session(self.execution._get_http_session())
+
+        threads = [threading.Thread(target=get_and_return) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        info = self.execution.http_session_info
+        self.assertEqual(info["sessions_requested"], 4000)
+        self.assertEqual(
+            info["sessions_created"] + info["sessions_reused"],
+            info["sessions_requested"],
+        )
+
+    def test_http_session_info(self):
+        self.assertIsNone(self.execution.http_session_info["reuse_ratio"])
+        self.execution._sessions_requested = 4
+        self.execution._sessions_reused = 3
+        self.assertEqual(
+            self.execution.http_session_info,
+            {
+                "live_sessions_count": 0,
+                "sessions_created": 0,
+                "sessions_reused": 3,
+                "sessions_evicted": 0,
+                "sessions_requested": 4,
+                "reuse_ratio": 0.75,
+            },
+        )
 
     @mock.patch("flumine.execution.baseexecution.OrderEvent")
     def test__order_logger_place(self, mock_order_event):
@@ -228,6 +409,20 @@ class BaseExecutionTest(unittest.TestCase):
         mock_order.responses.placed.assert_called_with(mock_instruction_report)
         self.mock_flumine.log_control.assert_called_with(mock_order_event(mock_order))
 
+    def test__update_bet_id(self):
+        mock_order = mock.Mock(market_id="1.23")
+        mock_market = mock.Mock()
+        self.mock_flumine.markets.markets = {"1.23": mock_market}
+        self.execution._update_bet_id(mock_order, "123")
+        self.assertEqual(mock_order.bet_id, "123")
+        mock_market.blotter.update_bet_id.assert_called_with(mock_order)
+
+    def test__update_bet_id_no_market(self):
+        mock_order = mock.Mock(market_id="1.23")
+        self.mock_flumine.markets.markets = {}
+        self.execution._update_bet_id(mock_order, "123")
+        self.assertEqual(mock_order.bet_id, "123")
+
     def test_shutdown(self):
         self.execution.shutdown()
         self.assertTrue(self.execution._thread_pool._shutdown)
@@ -241,6 +436,24 @@ class BetfairExecutionTest(unittest.TestCase):
     def test_init(self):
         self.assertEqual(self.execution.VENUE, VenueType.BETFAIR)
 
+    def test_http_session_urls(self):
+        mock_client_one = mock.Mock(execution=self.execution)
+        mock_client_one.betting_client.betting.url = "url"
+        mock_client_two = mock.Mock(execution=self.execution)
+        mock_client_two.betting_client.betting.url = "url_it"
+        mock_client_three = mock.Mock(execution=self.execution)
+        mock_client_three.betting_client.betting.url = "url"
+        mock_client_paper = mock.Mock(execution=mock.Mock())
+        self.mock_flumine.clients = [
+            mock_client_one,
+            mock_client_two,
+            mock_client_three,
+            mock_client_paper,
+        ]
+        self.assertEqual(self.execution.http_session_urls, ["url", "url_it"])
+        self.mock_flumine.clients = []
+        self.assertEqual(self.execution.http_session_urls, [])
+
     @mock.patch("flumine.execution.betfairexecution.BetfairExecution._order_logger")
     @mock.patch("flumine.execution.betfairexecution.BetfairExecution.place")
     @mock.patch("flumine.execution.betfairexecution.BetfairExecution._execution_helper")
@@ -806,7 +1019,7 @@ class BetfairExecutionTest(unittest.TestCase):
         # mock_market.transaction.__exit__ = mock.Mock()
         self.mock_flumine.markets.markets = {"1.23": mock_market}
         mock_session = mock.Mock()
-        mock_order = mock.Mock(market_id="1.23", bet_id=123)
+        mock_order = mock.Mock(market_id="1.23", bet_id=123, replacement_order=None)
         mock_order.trade.__enter__ = mock.Mock()
         mock_order.trade.__exit__ = mock.Mock()
         mock_order_package = mock.MagicMock(market_id="1.23", info={})
@@ -840,6 +1053,120 @@ class BetfairExecutionTest(unittest.TestCase):
         mock_order.trade.__exit__.assert_called_with(None, None, None)
         mock_order_package.client.add_transaction.assert_called_with(1)
 
+    @mock.patch("flumine.execution.betfairexecution.BetfairExecution._order_logger")
+    def test__process_replace_collapsed(self, mock__order_logger):
+        mock_market = mock.Mock()
+        self.mock_flumine.markets.markets = {"1.23": mock_market}
+        mock_replacement_order = mock.Mock()
+        mock_order = mock.MagicMock(replacement_order=mock_replacement_order)
+        mock_order_package = mock.MagicMock(market_id="1.23")
+        mock_order_package.__iter__.side_effect = lambda: iter([mock_order])
+        mock_instruction_report = mock.Mock()
+        mock_instruction_report.cancel_instruction_reports.status = "SUCCESS"
+        mock_instruction_report.place_instruction_reports.status = "SUCCESS"
+        mock_response = mock.Mock(replace_instruction_reports=[mock_instruction_report])
+        self.execution._process_replace(mock_order_package, mock_response)
+        mock_order.execution_complete.assert_called_with()
+        mock_order.trade.create_order_replacement.assert_not_called()
+        mock_market.place_order.assert_not_called()
+        mock__order_logger.assert_called_with(
+            mock_replacement_order,
+            mock_instruction_report.place_instruction_reports,
+            OrderPackageType.REPLACE,
+        )
+        mock_replacement_order.executable.assert_called_with()
+        self.assertIsNone(mock_order.replacement_order)
+
+    @mock.patch("flumine.execution.betfairexecution.BetfairExecution._order_logger")
+    def test__process_replace_collapsed_size(self, mock__order_logger):
+        # order partially matched between transaction and execution
+        self.mock_flumine.markets.markets = {"1.23": mock.Mock()}
+        mock_replacement_order = mock.Mock()
+        mock_replacement_order.order_type.size = 10.0
+        mock_order = mock.MagicMock(replacement_order=mock_replacement_order)
+        mock_order_package = mock.MagicMock(market_id="1.23")
+        mock_order_package.__iter__.side_effect = lambda: iter([mock_order])
+        mock_instruction_report = mock.Mock()
+        mock_instruction_report.cancel_instruction_reports.status = "SUCCESS"
+        mock_instruction_report.place_instruction_reports.status = "SUCCESS"
+        mock_instruction_report.place_instruction_reports.instruction.limit_order.size = (
+            6.0
+        )
+        mock_response = mock.Mock(replace_instruction_reports=[mock_instruction_report])
+        self.execution._process_replace(mock_order_package, mock_response)
+        self.assertEqual(mock_replacement_order.order_type.size, 6.0)
+        mock_replacement_order.executable.assert_called_with()
+
+    @mock.patch(
+        "flumine.execution.betfairexecution.BetfairExecution._place_replacement_order"
+    )
+    def test__process_replace_collapsed_failure(self, mock__place_replacement_order):
+        self.mock_flumine.markets.markets = {"1.23": mock.Mock()}
+        mock_replacement_order = mock.Mock()
+        mock_replacement_order_two = mock.Mock()
+        mock_order = mock.MagicMock(replacement_order=mock_replacement_order)
+        mock_order_two = mock.MagicMock(replacement_order=mock_replacement_order_two)
+        mock_order_package = mock.MagicMock(market_id="1.23")
+        mock_order_package.__iter__.side_effect = lambda: iter(
+            [mock_order, mock_order_two]
+        )
+        mock_instruction_report = mock.Mock()
+        mock_instruction_report.cancel_instruction_reports.status = "FAILURE"
+        mock_instruction_report.place_instruction_reports.status = "FAILURE"
+        mock_instruction_report_two = mock.Mock()
+        mock_instruction_report_two.cancel_instruction_reports.status = "SUCCESS"
+        mock_instruction_report_two.place_instruction_reports.status = "FAILURE"
+        mock_response = mock.Mock(
+            replace_instruction_reports=[
+                mock_instruction_report,
+                mock_instruction_report_two,
+            ]
+        )
+        self.execution._process_replace(mock_order_package, mock_response)
+        mock_order.executable.assert_called_with()
+        mock__place_replacement_order.assert_called_once_with(
+            mock_order_package, mock_replacement_order
+        )
+        mock_replacement_order_two.execution_complete.assert_called_with()
+
+    @mock.patch(
+        "flumine.execution.betfairexecution.BetfairExecution._place_replacement_order"
+    )
+    def test__process_replace_collapsed_complete(self, mock__place_replacement_order):
+        self.mock_flumine.markets.markets = {"1.23": mock.Mock()}
+        mock_replacement_order = mock.Mock()
+        mock_order = mock.MagicMock(replacement_order=mock_replacement_order)
+        mock_order_package = mock.MagicMock(market_id="1.23")
+        mock_order_package.__iter__.side_effect = lambda: iter([mock_order])
+        mock_response = mock.Mock(replace_instruction_reports=[])
+        self.execution._process_replace(mock_order_package, mock_response)
+        mock__place_replacement_order.assert_called_once_with(
+            mock_order_package, mock_replacement_order
+        )
+        self.assertIsNone(mock_order.replacement_order)
+
+    @mock.patch("flumine.execution.betfairexecution.BetfairExecution.handler")
+    def test__place_replacement_order(self, mock_handler):
+        mock_replacement_order = mock.Mock()
+        order_package = BetfairOrderPackage(
+            client=mock.Mock(),
+            market_id="1.23",
+            orders=[mock.Mock()],
+            package_type=OrderPackageType.REPLACE,
+            bet_delay=1,
+            market_version=123,
+            customer_strategy_ref="test",
+        )
+        self.execution._place_replacement_order(order_package, mock_replacement_order)
+        place_package = mock_handler.call_args[0][0]
+        self.assertEqual(place_package.package_type, OrderPackageType.PLACE)
+        self.assertEqual(place_package.orders, [mock_replacement_order])
+        self.assertEqual(place_package.client, order_package.client)
+        self.assertEqual(place_package.market_id, "1.23")
+        self.assertEqual(place_package.bet_delay, 1)
+        self.assertEqual(place_package._market_version, 123)
+        self.assertEqual(place_package.customer_strategy_ref, "test")
+
     @mock.patch("flumine.execution.betfairexecution.BetfairExecution.replace")
     @mock.patch("flumine.execution.betfairexecution.BetfairExecution._execution_helper")
     def test_execute_replace_error(self, mock__execution_helper, mock_replace):
@@ -1009,6 +1336,300 @@ class BetfairExecutionTest(unittest.TestCase):
         mock_trading_function.assert_called_with(mock_order_package, mock_session)
         mock__return_http_session.assert_called_with(mock_session, err=True)
 
+    @mock.patch("flumine.execution.betfairexecution.config")
+    @mock.patch("flumine.execution.betfairexecution.BetfairExecution._execute_handler")
+    @mock.patch("flumine.execution.betfairexecution.BetfairExecution._get_batcher")
+    def test_handler_batch(self, mock__get_batcher, mock__execute_handler, mock_config):
+        mock_config.execution_batch_window = 0.002
+        mock_order_package = mock.Mock(retry_count=0)
+        self.execution.handler(mock_order_package)
+        mock__get_batcher.return_value.add.assert_called_with(mock_order_package)
+        mock__execute_handler.assert_not_called()
+        # retries are not batched
+        mock_order_package.retry_count = 1
+        self.execution.handler(mock_order_package)
+        mock__execute_handler.assert_called_with(mock_order_package)
+
+    @mock.patch("flumine.execution.betfairexecution.OrderPackageBatcher")
+    def test__get_batcher(self, mock_order_package_batcher):
+        self.assertEqual(
+            self.execution._get_batcher(), mock_order_package_batcher.return_value
+        )
+        self.execution._get_batcher()
+        mock_order_package_batcher.assert_called_once_with(
+            self.execution._execute_handler, config.execution_batch_window
+        )
+        mock_order_package_batcher.return_value.start.assert_called_once_with()
+
+    @mock.patch("flumine.execution.betfairexecution.config")
+    @mock.patch("flumine.execution.betfairexecution.BetfairExecution._asyncio_handler")
+    @mock.patch(
+        "flumine.execution.betfairexecution.BetfairExecution._get_asyncio_engine"
+    )
+    def test_handler_asyncio(
+        self, mock__get_asyncio_engine, mock__asyncio_handler, mock_config
+    ):
+        mock_config.asyncio_execution = True
+        mock_order_package = mock.Mock()
+        self.execution.handler(mock_order_package)
+        mock__asyncio_handler.assert_called_with(
+            mock_order_package, mock__get_asyncio_engine.return_value
+        )
+
+    @mock.patch("flumine.execution.betfairexecution.config")
+    @mock.patch("flumine.execution.baseexecution.BaseExecution.handler")
+    @mock.patch(
+        "flumine.execution.betfairexecution.BetfairExecution._get_asyncio_engine",
+        return_value=False,
+    )
+    def test_handler_asyncio_unavailable(
+        self, mock__get_asyncio_engine, mock_handler, mock_config
+    ):
+        mock_config.asyncio_execution = True
+        mock_order_package = mock.Mock()
+        self.execution.handler(mock_order_package)
+        mock_handler.assert_called_with(mock_order_package)
+
+    @mock.patch("flumine.execution.betfairexecution.AsyncioEngine")
+    def test__get_asyncio_engine(self, mock_asyncio_engine):
+        self.assertEqual(
+            self.execution._get_asyncio_engine(), mock_asyncio_engine.return_value
+        )
+        self.execution._get_asyncio_engine()
+        mock_asyncio_engine.assert_called_once_with(
+            "BetfairExecutionAsyncio", max_connections=config.max_asyncio_connections
+        )
+        mock_asyncio_engine.return_value.start.assert_called_once_with()
+
+    @mock.patch(
+        "flumine.execution.betfairexecution.AsyncioEngine", side_effect=ImportError
+    )
+    def test__get_asyncio_engine_import_error(self, mock_asyncio_engine):
+        self.assertFalse(self.execution._get_asyncio_engine())
+        self.assertFalse(self.execution._get_asyncio_engine())
+        mock_asyncio_engine.assert_called_once()
+
+    @mock.patch(
+        "flumine.execution.betfairexecution.BetfairExecution._execute_async",
+        new_callable=mock.Mock,
+    )
+    def test__asyncio_handler(self, mock__execute_async):
+        mock_asyncio_engine = mock.Mock()
+        mock_order_package = mock.Mock(
+            package_type=OrderPackageType.PLACE, elapsed_seconds=0.1, info={}
+        )
+        self.execution._asyncio_handler(mock_order_package, mock_asyncio_engine)
+        mock__execute_async.assert_called_with(mock_order_package, mock_asyncio_engine)
+        mock_asyncio_engine.submit.assert_called_with(mock__execute_async.return_value)
+
+    def test__asyncio_handler_error(self):
+        mock_order_package = mock.Mock(package_type=None)
+        with self.assertRaises(NotImplementedError):
+            self.execution._asyncio_handler(mock_order_package, mock.Mock())
+
+    def _create_order_package(self, package_type=OrderPackageType.PLACE):
+        mock_order_package = mock.Mock(
+            package_type=package_type,
+            market_id="1.234",
+            place_instructions=[{"selectionId": 123}],
+            market_version=None,
+            customer_strategy_ref="test",
+            async_=False,
+            elapsed_seconds=0.001,
+            retry_count=0,
+            orders=[mock.Mock()],
+            info={},
+        )
+        mock_order_package.id.hex = "abc"
+        mock_order_package.client.betting_client = APIClient(
+            "username", "password", app_key="app_key"
+        )
+        return mock_order_package
+
+    def _create_asyncio_engine(self, status_code: int, content: bytes):
+        mock_asyncio_engine = mock.Mock(info={})
+        mock_asyncio_engine.post = mock.AsyncMock(return_value=(status_code, content))
+        return mock_asyncio_engine
+
+    def _run_execute_async(self, order_package, mock_asyncio_engine) -> None:
+        async def run():
+            mock_asyncio_engine.loop = asyncio.get_running_loop()
+            await self.execution._execute_async(order_package, mock_asyncio_engine)
+
+        asyncio.run(run())
+
+    @mock.patch("flumine.execution.betfairexecution.BetfairExecution._process_place")
+    def test__execute_async_parity(self, mock__process_place):
+        # local mock betfair api, thread pool and asyncio paths should match
+        content = (
+            b'{"jsonrpc": "2.0", "result": {"status": "SUCCESS", "marketId": '
+            b'"1.234", "instructionReports": [{"status": "SUCCESS", "instruction": '
+            b'{"selectionId": 123, "side": "BACK", "orderType": "LIMIT"}, '
+            b'"betId": "1", "orderStatus": "EXECUTION_COMPLETE"}]}, "id": 1}'
+        )
+        mock_order_package = self._create_order_package()
+        mock_http_session = mock.Mock()
+        mock_http_session.post.return_value = mock.Mock(
+            status_code=200, content=content
+        )
+        self.execution.execute_place(mock_order_package, mock_http_session)
+        mock_asyncio_engine = self._create_asyncio_engine(200, content)
+        self._run_execute_async(mock_order_package, mock_asyncio_engine)
+        # same request
+        sync_call = mock_http_session.post.call_args
+        mock_asyncio_engine.post.assert_called_with(
+            sync_call[0][0],
+            sync_call[1]["data"],
+            sync_call[1]["headers"],
+            *sync_call[1]["timeout"],
+        )
+        # same response processed
+        (_, sync_response), (_, async_response) = [
+            c[0] for c in mock__process_place.call_args_list
+        ]
+        self.assertEqual(sync_response._data, async_response._data)
+        self.assertEqual(
+            sync_response.place_instruction_reports[0].bet_id,
+            async_response.place_instruction_reports[0].bet_id,
+        )
+
+    @unittest.skipIf(asyncioengine.aiohttp is None, "aiohttp not installed")
+    @mock.patch("flumine.execution.betfairexecution.BetfairExecution._process_place")
+    def test__execute_async_parity_local_server(self, mock__process_place):
+        # real requests (thread pool) and aiohttp (asyncio) against a local api
+        content = (
+            b'{"jsonrpc": "2.0", "result": {"status": "SUCCESS", "marketId": '
+            b'"1.234", "instructionReports": [{"status": "SUCCESS", "instruction": '
+            b'{"selectionId": 123, "side": "BACK", "orderType": "LIMIT"}, '
+            b'"betId": "1", "orderStatus": "EXECUTION_COMPLETE"}]}, "id": 1}'
+        )
+        requests_received = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                requests_received.append((self.path, dict(self.headers), body))
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        mock_order_package = self._create_order_package()
+        betting_client = mock_order_package.client.betting_client
+        betting_client.api_uri = "http://127.0.0.1:%s/" % server.server_port
+        betting_client.session_token = "token"
+        process_threads = []
+        mock__process_place.side_effect = lambda *_: process_threads.append(
+            threading.current_thread()
+        )
+
+        self.execution.execute_place(mock_order_package, requests.Session())
+        asyncio_engine = AsyncioEngine("test")
+        asyncio_engine.start()
+        asyncio_engine.submit(
+            self.execution._execute_async(mock_order_package, asyncio_engine)
+        ).result(5)
+        asyncio_engine.shutdown(5)
+        self.execution._thread_pool.shutdown()
+
+        # same request
+        (sync_path, sync_headers, sync_body), (
+            async_path,
+            async_headers,
+            async_body,
+        ) = requests_received
+        self.assertEqual(sync_path, async_path)
+        self.assertEqual(sync_body, async_body)
+        for header in betting_client.request_headers:
+            self.assertEqual(sync_headers[header], async_headers[header])
+        # same response processed
+        (_, sync_response), (_, async_response) = [
+            c[0] for c in mock__process_place.call_args_list
+        ]
+        self.assertEqual(sync_response._data, async_response._data)
+        self.assertEqual(
+            sync_response.place_instruction_reports[0].bet_id,
+            async_response.place_instruction_reports[0].bet_id,
+        )
+        # processed off the event loop
+        self.assertIsNot(process_threads[1], asyncio_engine._thread)
+
+    @mock.patch("flumine.execution.betfairexecution.BetfairExecution._process_cancel")
+    def test__execute_async_cancel(self, mock__process_cancel):
+        mock_order_package = self._create_order_package(OrderPackageType.CANCEL)
+        mock_order_package.cancel_instructions = [{"betId": "1"}]
+        mock_asyncio_engine = self._create_asyncio_engine(
+            200, b'{"result": {"status": "SUCCESS", "instructionReports": []}}'
+        )
+        self._run_execute_async(mock_order_package, mock_asyncio_engine)
+        mock__process_cancel.assert_called_once()
+        self.assertEqual(
+            json.loads(mock_asyncio_engine.post.call_args[0][1])["method"],
+            "SportsAPING/v1.0/cancelOrders",
+        )
+
+    @mock.patch("flumine.execution.betfairexecution.BetfairExecution._retry_or_reset")
+    @mock.patch("flumine.execution.betfairexecution.BetfairExecution._process_place")
+    def test__execute_async_status_code_error(
+        self, mock__process_place, mock__retry_or_reset
+    ):
+        mock_order_package = self._create_order_package()
+        mock_asyncio_engine = self._create_asyncio_engine(503, b"")
+        self._run_execute_async(mock_order_package, mock_asyncio_engine)
+        mock__process_place.assert_not_called()
+        mock__retry_or_reset.assert_called_with(mock_order_package)
+
+    @mock.patch("flumine.execution.betfairexecution.BetfairExecution._retry_or_reset")
+    @mock.patch("flumine.execution.betfairexecution.BetfairExecution._process_place")
+    def test__execute_async_api_error(self, mock__process_place, mock__retry_or_reset):
+        mock_order_package = self._create_order_package()
+        mock_asyncio_engine = self._create_asyncio_engine(
+            200, b'{"error": {"code": -32099}}'
+        )
+        self._run_execute_async(mock_order_package, mock_asyncio_engine)
+        mock__process_place.assert_not_called()
+        mock__retry_or_reset.assert_called_with(mock_order_package)
+
+    @mock.patch("flumine.execution.betfairexecution.BetfairExecution._retry_or_reset")
+    def test__execute_async_unknown_error(self, mock__retry_or_reset):
+        mock_order_package = self._create_order_package(OrderPackageType.CANCEL)
+        mock_order_package.cancel_instructions = []
+        mock_asyncio_engine = self._create_asyncio_engine(200, b"")
+        self._run_execute_async(mock_order_package, mock_asyncio_engine)
+        mock_asyncio_engine.post.assert_not_called()
+        mock__retry_or_reset.assert_not_called()
+
+    def test__execute_async_empty(self):
+        mock_order_package = self._create_order_package()
+        mock_order_package.orders = []
+        mock_asyncio_engine = self._create_asyncio_engine(200, b"")
+        self._run_execute_async(mock_order_package, mock_asyncio_engine)
+        mock_asyncio_engine.post.assert_not_called()
+
+    @mock.patch("flumine.execution.baseexecution.BaseExecution.shutdown")
+    def test_shutdown(self, mock_shutdown):
+        mock_manager = mock.Mock()
+        mock_manager.attach_mock(mock_shutdown, "thread_pool")
+        self.execution._asyncio_engine = mock_manager.asyncio_engine
+        self.execution._batcher = mock_manager.batcher
+        self.execution.shutdown()
+        # thread pool last as in flight asyncio responses are processed on it
+        self.assertEqual(
+            mock_manager.mock_calls,
+            [
+                mock.call.batcher.shutdown(),
+                mock.call.asyncio_engine.shutdown(),
+                mock.call.thread_pool(),
+            ],
+        )
+
 
 class SimulatedExecutionTest(unittest.TestCase):
     def setUp(self) -> None:
@@ -64,6 +64,107 @@ class FlumineTest(unittest.TestCase):
         mock__process_custom_event.assert_called_with(mock_events[8])
         mock__add_default_workers.assert_called()
 
+    @mock.patch("flumine.flumine.Flumine._add_default_workers")
+    @mock.patch("flumine.flumine.Flumine._process_end_flumine")
+    @mock.patch("flumine.flumine.Flumine._process_custom_event")
+    @mock.patch("flumine.flumine.Flumine._process_market_books")
+    def test_run_profiler(
+        self,
+        mock__process_market_books,
+        mock__process_custom_event,
+        mock__process_end_flumine,
+        mock__add_default_workers,
+    ):
+        self.flumine.enable_profiler(None, 2)
+        mock_events = [
+            events.MarketBookEvent(None),
+            events.MarketBookEvent(None),
+            events.CustomEvent(None, None),
+            events.CustomEvent(None, None),
+            events.TerminationEvent(None),
+        ]
+        for i in mock_events:
+            self.flumine.handler_queue.put(i)
+        self.flumine.run()
+        info = self.flumine.profiler.info
+        self.assertEqual(
+            sorted(info), ["event.CUSTOM_EVENT", "event.MARKET_BOOK", "handler_queue"]
+        )
+        self.assertEqual(info["handler_queue"]["count"], 2)
+        self.assertEqual(info["event.MARKET_BOOK"]["count"], 1)
+        self.assertEqual(info["event.CUSTOM_EVENT"]["count"], 1)
+
+    @mock.patch("flumine.flumine.config")
+    @mock.patch("flumine.worker.BackgroundWorker")
+    @mock.patch("flumine.Flumine.add_worker")
+    def test__add_default_workers_http_session_warm(
+        self, mock_add_worker, mock_worker, mock_config
+    ):
+        mock_config.http_session_warm_count = 4
+        mock_client = mock.Mock(market_recording_mode=True)
+        mock_client.betting_client.session_timeout = 1200
+        self.flumine.clients = [mock_client]
+        self.flumine._add_default_workers()
+        self.assertIn(
+            mock.call(self.flumine, function=worker.refresh_http_sessions, interval=30),
+            mock_worker.call_args_list,
+        )
+
+    @mock.patch("flumine.worker.BackgroundWorker")
+    @mock.patch("flumine.Flumine.add_worker")
+    def test__add_default_workers_execution_priorities(
+        self, mock_add_worker, mock_worker
+    ):
+        mock_client = mock.Mock(market_recording_mode=True)
+        mock_client.betting_client.session_timeout = 1200
+        self.flumine.clients = [mock_client]
+        self.flumine.betfair_execution.enable_execution_priorities()
+        self.flumine._add_default_workers()
+        self.assertIn(
+            mock.call(
+                self.flumine,
+                function=worker.log_execution_thread_pool,
+                interval=60,
+                start_delay=60,
+            ),
+            mock_worker.call_args_list,
+        )
+
+    @mock.patch("flumine.handlerqueue.config")
+    @mock.patch("flumine.flumine.Flumine._add_default_workers")
+    @mock.patch("flumine.flumine.Flumine._process_end_flumine")
+    @mock.patch("flumine.flumine.Flumine._process_current_orders")
+    @mock.patch("flumine.flumine.Flumine._process_market_books")
+    def test_run_drop_stale_market_books(
+        self,
+        mock__process_market_books,
+        mock__process_current_orders,
+        mock__process_end_flumine,
+        mock__add_default_workers,
+        mock_config,
+    ):
+        mock_config.handler_queue_policy = "drop_stale_market_books"
+        market_book_one = mock.Mock(streaming_unique_id=1, market_id="1.1")
+        market_book_two = mock.Mock(streaming_unique_id=1, market_id="1.2")
+        market_book_three = mock.Mock(streaming_unique_id=1, market_id="1.1")
+        current_orders_event = events.CurrentOrdersEvent(None)
+        mock_events = [
+            events.MarketBookEvent([market_book_one, market_book_two]),
+            current_orders_event,
+            events.MarketBookEvent([market_book_three]),
+            events.TerminationEvent(None),
+        ]
+        for i in mock_events:
+            self.flumine.handler_queue.put(i)
+        processed = []
+        mock__process_market_books.side_effect = lambda e: processed.append(
+            list(e.event)
+        )
+        self.flumine.run()
+        self.assertEqual(processed, [[market_book_two], [market_book_three]])
+        mock__process_current_orders.assert_called_once_with(current_orders_event)
+        self.assertEqual(self.flumine.handler_queue.dropped, 1)
+
     @mock.patch("flumine.worker.BackgroundWorker")
     @mock.patch("flumine.Flumine.add_worker")
     def test__add_default_workers(self, mock_add_worker, mock_worker):
@@ -86,6 +187,12 @@ class FlumineTest(unittest.TestCase):
                     interval=60,
                     start_delay=10,
                 ),
+                mock.call(
+                    self.flumine,
+                    function=worker.log_handler_queue,
+                    interval=60,
+                    start_delay=60,
+                ),
                 mock.call(
                     self.flumine,
                     function=worker.poll_account_balance,
@@ -123,6 +230,12 @@ class FlumineTest(unittest.TestCase):
                     interval=60,
                     start_delay=10,
                 ),
+                mock.call(
+                    self.flumine,
+                    function=worker.log_handler_queue,
+                    interval=60,
+                    start_delay=60,
+                ),
             ],
         )
 
@@ -148,6 +261,12 @@ class FlumineTest(unittest.TestCase):
                     interval=60,
                     start_delay=10,
                 ),
+                mock.call(
+                    self.flumine,
+                    function=worker.log_handler_queue,
+                    interval=60,
+                    start_delay=60,
+                ),
                 mock.call(
                     self.flumine,
                     function=worker.poll_account_balance,
@@ -169,6 +288,19 @@ class FlumineTest(unittest.TestCase):
             ],
         )
 
+    def test_info(self):
+        self.assertEqual(
+            self.flumine.info["handler_queue"], self.flumine.handler_queue.info
+        )
+        self.assertEqual(
+            self.flumine.info["http_sessions"],
+            self.flumine.betfair_execution.http_session_info,
+        )
+        self.assertEqual(
+            self.flumine.info["execution_thread_pool"],
+            self.flumine.betfair_execution.thread_pool_info,
+        )
+
     def test_str(self):
         assert str(self.flumine) == "<Flumine>"
 
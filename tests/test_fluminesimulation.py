@@ -167,9 +167,11 @@ class FlumineSimulationTest(unittest.TestCase):
         mock_order_two = mock.Mock(size_remaining=1, complete=False)
         mock_order_two.order_type.ORDER_TYPE = OrderTypes.LIMIT
         mock_order_two.trade.status = TradeStatus.COMPLETE
-        mock_market.blotter._live_orders = [mock_order, mock_order_two]
+        mock_market.blotter["1"] = mock_order
+        mock_market.blotter["2"] = mock_order_two
         self.flumine._process_simulated_orders(mock_market)
         mock_order.execution_complete.assert_called()
+        self.assertEqual(list(mock_market.blotter.live_orders), [mock_order_two])
         mock_order_two.execution_complete.assert_not_called()
 
     def test__process_simulated_orders_strategies(self):
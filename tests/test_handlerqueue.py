@@ -0,0 +1,87 @@
+import queue
+import unittest
+from unittest import mock
+
+from flumine.handlerqueue import HandlerQueue, DROP_STALE_MARKET_BOOKS
+from flumine.events import events
+
+
+class HandlerQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.handler_queue = HandlerQueue()
+
+    def test_init(self):
+        self.assertIsInstance(self.handler_queue, queue.Queue)
+        self.assertEqual(self.handler_queue.max_depth, 0)
+        self.assertEqual(self.handler_queue.dropped, 0)
+        self.assertEqual(self.handler_queue._market_books, {})
+
+    def test_put_get(self):
+        event_one = events.CustomEvent(None, None)
+        event_two = events.MarketBookEvent([])
+        self.handler_queue.put(event_one)
+        self.handler_queue.put(event_two)
+        self.assertEqual(self.handler_queue.max_depth, 2)
+        self.assertIsNotNone(event_one._time_queued)
+        self.assertEqual(self.handler_queue.get(), event_one)
+        self.assertEqual(self.handler_queue.get(), event_two)
+        self.assertEqual(self.handler_queue.max_depth, 2)
+        info = self.handler_queue.info
+        self.assertEqual(info["depth"], 0)
+        self.assertEqual(info["residence"]["count"], 2)
+
+    @mock.patch("flumine.handlerqueue.config")
+    def test_drop_stale_market_books(self, mock_config):
+        mock_config.handler_queue_policy = DROP_STALE_MARKET_BOOKS
+        market_book_one = mock.Mock(streaming_unique_id=1, market_id="1.1")
+        market_book_two = mock.Mock(streaming_unique_id=2, market_id="1.1")
+        market_book_three = mock.Mock(streaming_unique_id=1, market_id="1.1")
+        market_book_four = mock.Mock(streaming_unique_id=1, market_id="1.1")
+        event_one = events.MarketBookEvent([market_book_one, market_book_two])
+        event_two = events.MarketBookEvent([market_book_three])
+        event_three = events.MarketBookEvent([market_book_four])
+        self.handler_queue.put(event_one)
+        self.handler_queue.put(event_two)
+        self.assertEqual(event_one.event, [market_book_two])
+        self.assertEqual(self.handler_queue.get(), event_one)
+        self.assertEqual(self.handler_queue._market_books, {(1, "1.1"): event_two})
+        self.assertEqual(self.handler_queue.get(), event_two)
+        self.assertEqual(self.handler_queue._market_books, {})
+        # processed books are not dropped
+        self.handler_queue.put(event_three)
+        self.assertEqual(event_two.event, [market_book_three])
+        self.assertEqual(self.handler_queue.dropped, 1)
+
+    def test_drop_stale_market_books_disabled(self):
+        market_book_one = mock.Mock(streaming_unique_id=1, market_id="1.1")
+        market_book_two = mock.Mock(streaming_unique_id=1, market_id="1.1")
+        event_one = events.MarketBookEvent([market_book_one])
+        self.handler_queue.put(event_one)
+        self.handler_queue.put(events.MarketBookEvent([market_book_two]))
+        self.assertEqual(event_one.event, [market_book_one])
+        self.assertEqual(self.handler_queue.dropped, 0)
+
+    def test_reset(self):
+        self.handler_queue.put(events.CustomEvent(None, None))
+        self.handler_queue.put(events.CustomEvent(None, None))
+        self.handler_queue.get()
+        self.handler_queue.dropped = 3
+        info = self.handler_queue.reset()
+        self.assertEqual(info["max_depth"], 2)
+        self.assertEqual(info["dropped"], 3)
+        self.assertEqual(info["residence"]["count"], 1)
+        self.assertEqual(self.handler_queue.max_depth, 1)
+        self.assertEqual(self.handler_queue.dropped, 0)
+        self.assertIsNone(self.handler_queue.info["residence"])
+
+    def test_info(self):
+        self.assertEqual(
+            self.handler_queue.info,
+            {
+                "depth": 0,
+                "max_depth": 0,
+                "dropped": 0,
+                "policy": None,
+                "residence": None,
+            },
+        )
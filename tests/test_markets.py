@@ -224,6 +224,24 @@ class MarketTest(unittest.TestCase):
         mock_transaction.assert_called_with(client=1, customer_strategy_ref="dinger")
         mock_transaction.place_order.assert_called_with(mock_order, 2, False, True)
 
+    @mock.patch("flumine.markets.market.Market.transaction")
+    def test_place_orders(self, mock_transaction):
+        mock_transaction.return_value.__enter__.return_value = mock_transaction
+        mock_transaction.place_orders.return_value = [True, False]
+        mock_order = mock.Mock()
+        mock_order.trade.strategy = "test"
+        self.assertEqual(
+            self.market.place_orders(
+                [mock_order, mock_order], 2, False, force=True, client=1
+            ),
+            [True, False],
+        )
+        mock_transaction.assert_called_with(client=1, customer_strategy_ref="test")
+        mock_transaction.place_orders.assert_called_with(
+            [mock_order, mock_order], 2, False, True
+        )
+        self.assertEqual(self.market.place_orders([]), [])
+
     @mock.patch("flumine.markets.market.Market.transaction")
     def test_cancel_order(self, mock_transaction):
         mock_transaction.return_value.__enter__.return_value = mock_transaction
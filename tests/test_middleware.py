@@ -16,6 +16,12 @@ from flumine.markets.middleware import (
 from flumine.order.ordertype import MarketOnCloseOrder
 
 
+def _mock_blotter(*orders):
+    mock_blotter = mock.MagicMock()
+    mock_blotter.__iter__.side_effect = lambda: iter(orders)
+    return mock_blotter
+
+
 class MiddlewareTest(unittest.TestCase):
     def setUp(self) -> None:
         self.middleware = Middleware()
@@ -39,6 +45,7 @@ class SimulatedMiddlewareTest(unittest.TestCase):
     def test_init(self):
         self.assertEqual(self.middleware.markets, {})
         self.assertEqual(self.middleware._runner_removals, [])
+        self.assertEqual(self.middleware._sorted_orders, {})
         self.assertEqual(WIN_MINIMUM_ADJUSTMENT_FACTOR, 2.5)
         self.assertEqual(PLACE_MINIMUM_ADJUSTMENT_FACTOR, 0)
         self.assertEqual(
@@ -57,14 +64,16 @@ class SimulatedMiddlewareTest(unittest.TestCase):
     @mock.patch("flumine.markets.middleware.SimulatedMiddleware._process_runner")
     def test_call(self, mock__process_runner, mock__process_simulated_orders):
         mock_market = mock.Mock(context={})
-        mock_market_book = mock.Mock()
+        mock_market_book = mock.Mock(
+            streaming_sequential=False, streaming_changed_runners=None
+        )
         mock_runner = mock.Mock(status="ACTIVE")
         mock_market_book.runners = [mock_runner]
         mock_market.market_book = mock_market_book
         self.middleware(mock_market)
-        mock__process_runner.assert_called_with({}, mock_runner)
+        mock__process_runner.assert_called_with({}, mock_runner, None)
         self.assertEqual(mock_market.context, {"simulated": {}})
-        mock__process_simulated_orders.assert_called_with(mock_market, {})
+        mock__process_simulated_orders.assert_called_with(mock_market, {}, None)
 
     @mock.patch(
         "flumine.markets.middleware.SimulatedMiddleware._process_simulated_orders"
@@ -76,7 +85,9 @@ class SimulatedMiddlewareTest(unittest.TestCase):
         self, mock__process_runner_removal, mock__process_simulated_orders
     ):
         mock_market = mock.Mock(context={})
-        mock_market_book = mock.Mock()
+        mock_market_book = mock.Mock(
+            streaming_sequential=False, streaming_changed_runners=None
+        )
         mock_runner = mock.Mock(status="REMOVED")
         mock_market_book.runners = [mock_runner]
         mock_market.market_book = mock_market_book
@@ -101,9 +112,11 @@ class SimulatedMiddlewareTest(unittest.TestCase):
     def test_remove_market(self):
         mock_market = mock.Mock(market_id="1.23")
         self.middleware.markets = {mock_market.market_id: []}
+        self.middleware._sorted_orders[mock_market.market_id] = {}
         self.middleware.remove_market(mock_market)
         self.middleware.remove_market(mock_market)
         self.assertEqual(self.middleware.markets, {})
+        self.assertEqual(self.middleware._sorted_orders, {})
 
     def test__process_runner_removal(self):
         mock_simulated = mock.MagicMock(matched=[[123, 8.6, 10]])
@@ -112,7 +125,7 @@ class SimulatedMiddlewareTest(unittest.TestCase):
         mock_simulated_two = mock.MagicMock(matched=[[123, 8.6, 10]])
         mock_simulated_two.__bool__.return_value = False
         mock_order_two = mock.Mock(simulated=mock_simulated_two, info={})
-        mock_market = mock.Mock(blotter=[mock_order, mock_order_two])
+        mock_market = mock.Mock(blotter=_mock_blotter(mock_order, mock_order_two))
         self.middleware._process_runner_removal(mock_market, 12345, 0, 16.2)
         self.assertEqual(mock_order.simulated.matched, [[123, 7.21, 10]])
         self.assertEqual(mock_order.simulated.average_price_matched, 7.21)
@@ -122,7 +135,7 @@ class SimulatedMiddlewareTest(unittest.TestCase):
         mock_simulated = mock.MagicMock(matched=[[123, 8.6, 10]])
         mock_simulated.__bool__.return_value = True
         mock_order = mock.Mock(simulated=mock_simulated)
-        mock_market = mock.Mock(blotter=[mock_order])
+        mock_market = mock.Mock(blotter=_mock_blotter(mock_order))
         self.middleware._process_runner_removal(mock_market, 12345, 0, 2.4)
         self.assertEqual(mock_order.simulated.matched, [[123, 8.6, 10]])
 
@@ -134,7 +147,7 @@ class SimulatedMiddlewareTest(unittest.TestCase):
         )
         mock_order.order_type.size = 10
         mock_order.order_type.ORDER_TYPE = OrderTypes.LIMIT
-        mock_market = mock.Mock(market_id="1.23", blotter=[mock_order])
+        mock_market = mock.Mock(market_id="1.23", blotter=_mock_blotter(mock_order))
         self.middleware._process_runner_removal(mock_market, 12345, 0, 16.2)
         self.assertEqual(mock_order.simulated.size_matched, 0)
         self.assertEqual(mock_order.simulated.average_price_matched, 0)
@@ -145,7 +158,7 @@ class SimulatedMiddlewareTest(unittest.TestCase):
         mock_simulated = mock.MagicMock(matched=[[123, 8.6, 10]])
         mock_simulated.__bool__.return_value = True
         mock_order = mock.Mock(simulated=mock_simulated)
-        mock_market = mock.Mock(blotter=[mock_order])
+        mock_market = mock.Mock(blotter=_mock_blotter(mock_order))
         self.middleware._process_runner_removal(mock_market, 12345, 0, None)
         self.assertEqual(mock_order.simulated.matched, [[123, 8.6, 10]])
 
@@ -166,13 +179,16 @@ class SimulatedMiddlewareTest(unittest.TestCase):
             mock.Mock(selection_id=1234, handicap=0, adjustment_factor=20)
         ]
         mock_market = mock.Mock(
-            market_type="WIN", blotter=[mock_order], market_book=mock_market_book
+            market_type="WIN",
+            blotter=_mock_blotter(mock_order),
+            market_book=mock_market_book,
         )
         self.middleware._process_runner_removal(mock_market, 12345, 0, 50)
 
         # The liability of £200 is adjusted by the multiplier of 37.5%, which s
         # defined in the example here: https://github.com/betcode-org/flumine/issues/454
         self.assertEqual(mock_order.order_type.liability, 75)
+        mock_market.blotter.refresh_order_exposure.assert_called_with(mock_order)
 
     def test__process_runner_removal_sp_win_inplay(self):
         order_type = MarketOnCloseOrder(liability=200)
@@ -191,7 +207,9 @@ class SimulatedMiddlewareTest(unittest.TestCase):
             mock.Mock(selection_id=1234, handicap=0, adjustment_factor=20)
         ]
         mock_market = mock.Mock(
-            market_type="WIN", blotter=[mock_order], market_book=mock_market_book
+            market_type="WIN",
+            blotter=_mock_blotter(mock_order),
+            market_book=mock_market_book,
         )
         self.middleware._process_runner_removal(mock_market, 12345, 0, 50)
 
@@ -218,7 +236,9 @@ class SimulatedMiddlewareTest(unittest.TestCase):
             mock.Mock(selection_id=1234, handicap=0, adjustment_factor=20)
         ]
         mock_market = mock.Mock(
-            market_type="PLACE", blotter=[mock_order], market_book=mock_market_book
+            market_type="PLACE",
+            blotter=_mock_blotter(mock_order),
+            market_book=mock_market_book,
         )
         self.middleware._process_runner_removal(mock_market, 12345, 0, 50)
 
@@ -242,7 +262,9 @@ class SimulatedMiddlewareTest(unittest.TestCase):
             mock.Mock(selection_id=1234, handicap=0, adjustment_factor=20)
         ]
         mock_market = mock.Mock(
-            market_type="PLACE", blotter=[mock_order], market_book=mock_market_book
+            market_type="PLACE",
+            blotter=_mock_blotter(mock_order),
+            market_book=mock_market_book,
         )
         self.middleware._process_runner_removal(mock_market, 12345, 0, 50)
 
@@ -259,67 +281,220 @@ class SimulatedMiddlewareTest(unittest.TestCase):
         self.assertEqual(self.middleware._calculate_reduction_factor(10, 75.18), 2.48)
         self.assertEqual(self.middleware._calculate_reduction_factor(1.01, 75.18), 1.01)
 
+    def _mock_order(self, selection_id, side, price, status=OrderStatus.EXECUTABLE):
+        mock_order = mock.Mock(
+            selection_id=selection_id, handicap=0, status=status, side=side
+        )
+        mock_order.order_type.price = price
+        mock_order.order_type.ORDER_TYPE = OrderTypes.LIMIT
+        mock_order.simulated.take_sp = False
+        return mock_order
+
     @mock.patch("flumine.markets.middleware.config")
     def test__process_simulated_orders_strategy_isolation(self, mock_config):
         mock_config.simulated_strategy_isolation = True
         mock_market_book = mock.Mock()
-        mock_market = mock.Mock()
-        mock_order = mock.Mock(
-            selection_id=123, handicap=1, status=OrderStatus.EXECUTABLE, side="LAY"
-        )
-        mock_order.order_type.price = 1.02
-        mock_order.order_type.ORDER_TYPE = OrderTypes.LIMIT
-        mock_order_two = mock.Mock(
-            selection_id=123, handicap=1, status=OrderStatus.PENDING
-        )
-        mock_order_three = mock.Mock(
-            selection_id=123, handicap=1, status=OrderStatus.EXECUTABLE, simulated=False
-        )
-        mock_market.blotter._strategy_orders = {
-            "test": [mock_order, mock_order_two, mock_order_three]
+        mock_market = mock.Mock(market_book=mock_market_book)
+        mock_order = self._mock_order(123, "LAY", 1.02)
+        mock_order_two = self._mock_order(123, "LAY", 1.03, OrderStatus.PENDING)
+        mock_order_three = self._mock_order(123, "LAY", 1.04)
+        mock_order_three.simulated = False
+        mock_order_four = self._mock_order(123, "BACK", 1.02)
+        mock_order_four.trade.strategy = mock_order.trade.strategy
+        mock_market.blotter._selection_live_orders = {
+            (123, 0): dict.fromkeys(
+                [mock_order_four, mock_order, mock_order_two, mock_order_three]
+            )
         }
         mock_runner = mock.Mock(traded={1: 2})
-        mock_market_analytics = {
-            (mock_order.selection_id, mock_order.handicap): mock_runner
-        }
-        mock_market.market_book = mock_market_book
+        mock_market_analytics = {(123, 0): mock_runner}
         self.middleware._process_simulated_orders(mock_market, mock_market_analytics)
         mock_order.simulated.assert_called_with(
             mock_market_book, (mock_runner.runner, {1: 2})
         )
         mock_order_two.simulated.assert_not_called()
+        # same strategy shares (consumes) the ledger
+        self.assertIs(
+            mock_order.simulated.call_args[0][1][1],
+            mock_order_four.simulated.call_args[0][1][1],
+        )
+        self.assertIsNot(mock_order.simulated.call_args[0][1][1], mock_runner.traded)
+        # sorted copy cached, blotter index unchanged
+        self.assertEqual(
+            self.middleware._sorted_orders[mock_market.market_id][(123, 0)],
+            (
+                mock_order_three,
+                [mock_order_three, mock_order_two, mock_order, mock_order_four],
+            ),
+        )
+        self.assertEqual(
+            list(mock_market.blotter._selection_live_orders[(123, 0)]),
+            [mock_order_four, mock_order, mock_order_two, mock_order_three],
+        )
+
+    @mock.patch("flumine.markets.middleware.config")
+    def test__process_simulated_orders_strategy_ledgers(self, mock_config):
+        mock_config.simulated_strategy_isolation = True
+        mock_market = mock.Mock()
+        mock_order = self._mock_order(123, "LAY", 1.02)
+        mock_order_two = self._mock_order(123, "LAY", 1.02)
+        mock_market.blotter._selection_live_orders = {
+            (123, 0): dict.fromkeys([mock_order, mock_order_two])
+        }
+        mock_market_analytics = {(123, 0): mock.Mock(traded={1: 2})}
+        self.middleware._process_simulated_orders(mock_market, mock_market_analytics)
+        self.assertIsNot(
+            mock_order.simulated.call_args[0][1][1],
+            mock_order_two.simulated.call_args[0][1][1],
+        )
 
     @mock.patch("flumine.markets.middleware.config")
     def test__process_simulated_orders(self, mock_config):
         mock_config.simulated_strategy_isolation = False
         mock_market_book = mock.Mock()
-        mock_market = mock.Mock()
-        mock_order = mock.Mock(
-            selection_id=123, handicap=1, status=OrderStatus.EXECUTABLE, side="LAY"
-        )
-        mock_order.order_type.price = 1.02
-        mock_order.order_type.ORDER_TYPE = OrderTypes.LIMIT
-        mock_order_two = mock.Mock(
-            selection_id=123, handicap=1, status=OrderStatus.PENDING
+        mock_market = mock.Mock(market_book=mock_market_book)
+        mock_order = self._mock_order(123, "LAY", 1.02)
+        mock_order_two = self._mock_order(123, "LAY", 1.02, OrderStatus.PENDING)
+        mock_order_three = self._mock_order(123, "LAY", 1.02)
+        mock_order_three.simulated = False
+        mock_order_four = self._mock_order(123, "LAY", 1.01)
+        mock_market.blotter._selection_live_orders = {
+            (123, 0): dict.fromkeys(
+                [mock_order, mock_order_two, mock_order_three, mock_order_four]
+            ),
+            (456, 0): {},
+        }
+        mock_runner = mock.Mock(traded={1: 2})
+        mock_market_analytics = {(123, 0): mock_runner}
+        self.middleware._process_simulated_orders(mock_market, mock_market_analytics)
+        mock_order.simulated.assert_called_with(
+            mock_market_book, (mock_runner.runner, {1: 2})
         )
-        mock_order_three = mock.Mock(
-            selection_id=123, handicap=1, status=OrderStatus.EXECUTABLE, simulated=False
+        mock_order_two.simulated.assert_not_called()
+        # instance shares the ledger across strategies
+        self.assertIs(
+            mock_order.simulated.call_args[0][1][1],
+            mock_order_four.simulated.call_args[0][1][1],
         )
-        mock_market.blotter.live_orders = [
-            mock_order,
-            mock_order_two,
-            mock_order_three,
-        ]
-        mock_runner = mock.Mock(traded={1: 2})
-        mock_market_analytics = {
-            (mock_order.selection_id, mock_order.handicap): mock_runner
+
+    @mock.patch("flumine.markets.middleware.config")
+    def test__process_simulated_orders_changed_runners(self, mock_config):
+        mock_config.simulated_strategy_isolation = True
+        mock_market_book = mock.Mock()
+        mock_market = mock.Mock(market_book=mock_market_book)
+        mock_order = self._mock_order(123, "LAY", 1.02)
+        mock_order_two = self._mock_order(456, "LAY", 1.02)
+        mock_order_three = self._mock_order(456, "LAY", 1.02)
+        mock_order_three.simulated.take_sp = True
+        mock_market.blotter._selection_live_orders = {
+            (123, 0): {mock_order: None},
+            (456, 0): dict.fromkeys([mock_order_two, mock_order_three]),
         }
-        mock_market.market_book = mock_market_book
-        self.middleware._process_simulated_orders(mock_market, mock_market_analytics)
+        mock_runner = mock.Mock(traded={1: 2})
+        mock_runner_two = mock.Mock(traded={})
+        mock_market_analytics = {(123, 0): mock_runner, (456, 0): mock_runner_two}
+        mock_market_book.bsp_reconciled = False
+        self.middleware._process_simulated_orders(
+            mock_market, mock_market_analytics, {(123, 0)}
+        )
         mock_order.simulated.assert_called_with(
             mock_market_book, (mock_runner.runner, {1: 2})
         )
         mock_order_two.simulated.assert_not_called()
+        mock_order_three.simulated.assert_not_called()
+        # SP orders processed on unchanged runners after reconciliation
+        mock_market_book.bsp_reconciled = True
+        self.middleware._process_simulated_orders(
+            mock_market, mock_market_analytics, {(123, 0)}
+        )
+        mock_order_two.simulated.assert_not_called()
+        mock_order_three.simulated.assert_called_with(
+            mock_market_book, (mock_runner_two.runner, {})
+        )
+
+    @mock.patch(
+        "flumine.markets.middleware.SimulatedMiddleware._sort_orders",
+        side_effect=lambda orders: orders,
+    )
+    def test__process_simulated_orders_sorted(self, mock__sort_orders):
+        mock_market = mock.Mock(market_id="1.23")
+        mock_order = self._mock_order(123, "LAY", 1.02)
+        mock_order_two = self._mock_order(123, "LAY", 1.03)
+        orders = {mock_order: None}
+        mock_market.blotter._selection_live_orders = {(123, 0): orders}
+        mock_market_analytics = {(123, 0): mock.Mock(traded={})}
+        self.middleware._process_simulated_orders(mock_market, mock_market_analytics)
+        mock__sort_orders.assert_called_once_with([mock_order])
+        self.middleware._process_simulated_orders(mock_market, mock_market_analytics)
+        mock__sort_orders.assert_called_once_with([mock_order])
+        self.assertEqual(
+            self.middleware._sorted_orders,
+            {"1.23": {(123, 0): (mock_order, [mock_order])}},
+        )
+        # order added
+        orders[mock_order_two] = None
+        self.middleware._process_simulated_orders(mock_market, mock_market_analytics)
+        self.assertEqual(mock__sort_orders.call_count, 2)
+        # order completed
+        del orders[mock_order]
+        self.middleware._process_simulated_orders(mock_market, mock_market_analytics)
+        self.assertEqual(mock__sort_orders.call_count, 3)
+        self.assertEqual(
+            self.middleware._sorted_orders,
+            {"1.23": {(123, 0): (mock_order_two, [mock_order_two])}},
+        )
+
+    def test__order_priority(self):
+        order = self._mock_order(123, "LAY", 1.02)
+        self.assertEqual(self.middleware._order_priority(order), (0, -1.02))
+        order = self._mock_order(123, "BACK", 1.02)
+        self.assertEqual(self.middleware._order_priority(order), (1, 1.02))
+        order.order_type.ORDER_TYPE = OrderTypes.MARKET_ON_CLOSE
+        self.assertEqual(self.middleware._order_priority(order), (2, 0))
+
+    @mock.patch("flumine.markets.middleware.config")
+    def test__get_changed_runners(self, mock_config):
+        mock_config.simulation_available_prices = False
+        mock_market_book = mock.Mock(streaming_changed_runners={(123, 0)})
+        self.assertEqual(
+            self.middleware._get_changed_runners(mock_market_book), {(123, 0)}
+        )
+        self.assertIsNone(self.middleware._get_changed_runners(mock.Mock(spec=[])))
+        mock_config.simulation_available_prices = True
+        self.assertIsNone(self.middleware._get_changed_runners(mock_market_book))
+
+    @mock.patch(
+        "flumine.markets.middleware.SimulatedMiddleware._process_simulated_orders"
+    )
+    @mock.patch("flumine.markets.middleware.SimulatedMiddleware._process_runner")
+    def test_call_changed_runners(
+        self, mock__process_runner, mock__process_simulated_orders
+    ):
+        mock_runner = mock.Mock(status="ACTIVE", selection_id=123, handicap=0)
+        mock_runner_two = mock.Mock(status="ACTIVE", selection_id=456, handicap=0)
+        mock_market = mock.Mock(context={}, market_id="1.23")
+        mock_market.market_book = mock.Mock(
+            streaming_sequential=False,
+            streaming_changed_runners={(123, 0)},
+            runners=[mock_runner, mock_runner_two],
+        )
+        runner_analytics = mock.Mock(traded={1.01: 2})
+        runner_analytics_two = mock.Mock(traded={1.01: 2})
+        self.middleware.markets["1.23"] = {
+            (123, 0): runner_analytics,
+            (456, 0): runner_analytics_two,
+        }
+        with mock.patch("flumine.markets.middleware.config") as mock_config:
+            mock_config.simulation_available_prices = False
+            self.middleware(mock_market)
+        mock__process_runner.assert_called_once_with(
+            self.middleware.markets["1.23"], mock_runner, None
+        )
+        self.assertEqual(runner_analytics.traded, {1.01: 2})
+        self.assertEqual(runner_analytics_two.traded, {})
+        mock__process_simulated_orders.assert_called_with(
+            mock_market, self.middleware.markets["1.23"], {(123, 0)}
+        )
 
     def test__sort_orders(self):
         order_one = mock.Mock(side="LAY", bet_id=1)
@@ -370,6 +545,63 @@ class SimulatedMiddlewareTest(unittest.TestCase):
         mock_runner_analytics.assert_called_with(mock_runner)
         mock_runner_analytics().assert_called_with(mock_runner)
 
+    @mock.patch("flumine.markets.middleware.RunnerAnalytics")
+    def test__process_runner_traded_updates(self, mock_runner_analytics):
+        market_analytics = {}
+        mock_runner = mock.Mock(selection_id=123, handicap=0)
+        self.middleware._process_runner(
+            market_analytics, mock_runner, {(123, 0): [[1.01, 2]]}
+        )
+        mock_runner_analytics().assert_called_with(mock_runner, [[1.01, 2]])
+        self.middleware._process_runner(market_analytics, mock_runner, {})
+        mock_runner_analytics().assert_called_with(mock_runner, None)
+
+    def test__get_traded_updates(self):
+        mock_market_book = mock.Mock(
+            streaming_sequential=True,
+            streaming_update={
+                "id": "1.23",
+                "rc": [
+                    {"id": 123, "trd": [[1.01, 2]]},
+                    {"id": 456, "hc": 1.5, "trd": [[2.0, 0]]},
+                    {"id": 789, "atb": [[1.01, 2]]},
+                ],
+            },
+        )
+        self.assertEqual(
+            self.middleware._get_traded_updates(mock_market_book),
+            {(123, 0): [[1.01, 2]], (456, 1.5): [[2.0, 0]]},
+        )
+
+    def test__get_traded_updates_not_sequential(self):
+        mock_market_book = mock.Mock(
+            streaming_sequential=False, streaming_update={"rc": []}
+        )
+        self.assertIsNone(self.middleware._get_traded_updates(mock_market_book))
+        mock_market_book = mock.Mock(
+            streaming_sequential=True, streaming_update={"img": True, "rc": []}
+        )
+        self.assertIsNone(self.middleware._get_traded_updates(mock_market_book))
+        mock_market_book = mock.Mock(spec=["streaming_update"])
+        self.assertIsNone(self.middleware._get_traded_updates(mock_market_book))
+
+    def test_call_runner_skipped(self):
+        mock_market = mock.Mock(context={}, market_id="1.23")
+        mock_market.blotter.active = False
+        mock_runner = mock.Mock(status="ACTIVE", selection_id=123, handicap=0)
+        mock_runner.ex.traded_volume = []
+        mock_market.market_book = mock.Mock(
+            streaming_sequential=False,
+            streaming_changed_runners=None,
+            runners=[mock_runner],
+        )
+        self.middleware(mock_market)
+        runner_analytics = self.middleware.markets["1.23"][(123, 0)]
+        self.assertTrue(runner_analytics.sequential)
+        mock_runner.status = "HIDDEN"
+        self.middleware(mock_market)
+        self.assertFalse(runner_analytics.sequential)
+
 
 class RunnerAnalyticsTest(unittest.TestCase):
     def setUp(self) -> None:
@@ -396,6 +628,72 @@ class RunnerAnalyticsTest(unittest.TestCase):
         self.assertEqual(self.runner_analytics.traded, mock__calculate_traded())
         self.assertEqual(self.runner_analytics.runner, mock_runner)
 
+    @mock.patch("flumine.markets.middleware.RunnerAnalytics._calculate_traded")
+    @mock.patch("flumine.markets.middleware.RunnerAnalytics._calculate_traded_update")
+    def test_call_traded_update(
+        self, mock__calculate_traded_update, mock__calculate_traded
+    ):
+        mock_runner = mock.Mock()
+        self.runner_analytics(mock_runner, [[1.01, 3]])
+        mock__calculate_traded_update.assert_called_with([[1.01, 3]])
+        mock__calculate_traded.assert_not_called()
+        self.assertEqual(self.runner_analytics.traded, mock__calculate_traded_update())
+        self.assertEqual(
+            self.runner_analytics._traded_volume, mock_runner.ex.traded_volume
+        )
+
+    @mock.patch("flumine.markets.middleware.RunnerAnalytics._calculate_traded")
+    @mock.patch("flumine.markets.middleware.RunnerAnalytics._calculate_traded_update")
+    def test_call_traded_update_not_sequential(
+        self, mock__calculate_traded_update, mock__calculate_traded
+    ):
+        mock_runner = mock.Mock()
+        self.runner_analytics.sequential = False
+        self.runner_analytics(mock_runner, [[1.01, 3]])
+        mock__calculate_traded_update.assert_not_called()
+        mock__calculate_traded.assert_called_with(mock_runner.ex.traded_volume)
+        self.assertTrue(self.runner_analytics.sequential)
+
+    def test__calculate_traded_update(self):
+        self.runner_analytics._p_v = {1.01: 30, 1.02: 5, 1.03: 10}
+        self.assertEqual(
+            self.runner_analytics._calculate_traded_update(
+                [[10, 32], [1.03, 0], [1.01, 69], [1.02, 5]]
+            ),
+            {1.01: 39.0, 10: 32},
+        )
+        self.assertEqual(self.runner_analytics._p_v, {1.01: 69, 1.02: 5, 10: 32})
+
+    def test__calculate_traded_update_order(self):
+        self.runner_analytics._p_v = {}
+        traded = self.runner_analytics._calculate_traded_update(
+            [[10, 32], [1.5, 2], [3.1, 1]]
+        )
+        self.assertEqual(list(traded), [1.5, 3.1, 10])
+
+    def test__calculate_traded_update_matches_full(self):
+        traded_volume = [{"price": 1.01, "size": 2}]
+        updates = [
+            [[1.02, 10.5], [1.01, 3.33]],
+            [[1.5, 4], [1.02, 0]],
+            [[1.02, 1], [1.5, 4.01], [1.01, 3.33]],
+        ]
+        full = RunnerAnalytics(self.mock_runner)
+        for update in updates:
+            ladder = {i["price"]: i["size"] for i in traded_volume}
+            for price, size in update:
+                if size == 0:
+                    ladder.pop(price, None)
+                else:
+                    ladder[price] = size
+            traded_volume = [
+                {"price": price, "size": size} for price, size in sorted(ladder.items())
+            ]
+            self.assertEqual(
+                list(self.runner_analytics._calculate_traded_update(update).items()),
+                list(full._calculate_traded(traded_volume).items()),
+            )
+
     def test__calculate_traded_dict_empty(self):
         self.runner_analytics._traded_volume = []
         self.assertEqual(self.runner_analytics._calculate_traded([]), {})
@@ -46,6 +46,7 @@ class BaseOrderTest(unittest.TestCase):
         self.assertIsNone(self.order.market_type)
         self.assertEqual(self.order.each_way_divisor, 1)
         self.assertIsNone(self.order.status)
+        self.assertIsNone(self.order._blotter)
         self.assertFalse(self.order.complete)
         self.assertEqual(self.order.status_log, [])
         self.assertIsNone(self.order.violation_msg)
@@ -55,6 +56,7 @@ class BaseOrderTest(unittest.TestCase):
         self.assertIsNone(self.order.bet_id)
         self.assertIsNone(self.order.VENUE)
         self.assertEqual(self.order.update_data, {})
+        self.assertIsNone(self.order.replacement_order)
         self.assertIsNone(self.order.publish_time)
         self.assertIsNone(self.order.market_version)
         self.assertIsNone(self.order.async_)
@@ -105,6 +107,16 @@ class BaseOrderTest(unittest.TestCase):
             mock_datetime.datetime.now.return_value,
         )
 
+    @mock.patch("flumine.order.order.BaseOrder.info")
+    def test__update_status_blotter(self, mock_info):
+        self.order._blotter = mock.Mock()
+        self.order._update_status(OrderStatus.PENDING)
+        self.order._blotter.update_order_status.assert_called_with(self.order, None)
+        self.order._update_status(OrderStatus.EXECUTABLE)
+        self.order._blotter.update_order_status.assert_called_with(
+            self.order, OrderStatus.PENDING
+        )
+
     @mock.patch("flumine.order.order.BaseOrder._update_status")
     def test_placing(self, mock__update_status):
         self.order.placing()
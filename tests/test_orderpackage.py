@@ -73,6 +73,15 @@ class OrderPackageTest(unittest.TestCase):
         self.order_package.reset_orders(True)
         mock_order.execution_complete.assert_called()
 
+    def test_reset_orders_replacement_order(self):
+        mock_replacement_order = mock.Mock()
+        mock_order = mock.MagicMock(replacement_order=mock_replacement_order)
+        self.order_package._orders = [mock_order]
+        self.order_package.reset_orders()
+        mock_order.executable.assert_called()
+        mock_replacement_order.execution_complete.assert_called_with()
+        self.assertIsNone(mock_order.replacement_order)
+
     def test_calc_simulated_delay(self):
         config.place_latency = 0.1
         config.cancel_latency = 0.2
@@ -0,0 +1,225 @@
+import unittest
+from unittest import mock
+
+from flumine import FlumineSimulation, BaseStrategy, clients
+from flumine.order.trade import Trade
+from flumine.order.ordertype import LimitOrder
+from flumine.events import events
+from flumine.simulation import parallel
+from flumine.utils import get_price
+
+
+class BackFavourite(BaseStrategy):
+    def check_market_book(self, market, market_book):
+        return not market_book.inplay and market.seconds_to_start < 100
+
+    def process_market_book(self, market, market_book):
+        runner = market_book.runners[0]
+        runner_context = self.get_runner_context(market.market_id, runner.selection_id)
+        if runner_context.trade_count == 0:
+            trade = Trade(
+                market_book.market_id, runner.selection_id, runner.handicap, self
+            )
+            order = trade.create_order(
+                side="BACK",
+                order_type=LimitOrder(get_price(runner.ex.available_to_back, 0), 2),
+            )
+            market.place_order(order)
+
+
+def setup(markets: list) -> FlumineSimulation:
+    framework = FlumineSimulation(client=clients.SimulatedClient())
+    framework.add_strategy(BackFavourite(market_filter={"markets": markets}))
+    return framework
+
+
+def setup_clients(markets: list) -> FlumineSimulation:
+    framework = FlumineSimulation(client=clients.SimulatedClient(username="one"))
+    framework.add_client(clients.SimulatedClient(username="two"))
+    framework.add_strategy(BackFavourite(market_filter={"markets": markets}))
+    return framework
+
+
+def setup_error(markets: list) -> FlumineSimulation:
+    raise ValueError("setup error")
+
+
+class SimulationResultsControlTest(unittest.TestCase):
+    def setUp(self):
+        self.control = parallel.SimulationResultsControl()
+
+    def test_init(self):
+        self.assertEqual(self.control.NAME, "SIMULATION_RESULTS_CONTROL")
+        self.assertEqual(self.control.orders, [])
+        self.assertEqual(self.control.cleared_markets, [])
+
+    def test__process_cleared_orders_meta(self):
+        mock_order = mock.Mock(info={"id": 1})
+        self.control._process_cleared_orders_meta(
+            events.ClearedOrdersMetaEvent([mock_order])
+        )
+        self.assertEqual(self.control.orders, [{"id": 1}])
+
+    def test__process_cleared_markets(self):
+        mock_cleared_market = mock.Mock(profit=1.2, bet_count=2)
+        mock_client = mock.Mock(username="test")
+        self.control._process_cleared_markets(
+            events.ClearedMarketsEvent(
+                mock.Mock(orders=[mock_cleared_market], client=mock_client)
+            )
+        )
+        self.assertEqual(len(self.control.cleared_markets), 1)
+        self.assertEqual(self.control.cleared_markets[0]["username"], "test")
+        self.assertEqual(self.control.cleared_markets[0]["profit"], 1.2)
+        self.assertEqual(self.control.cleared_markets[0]["betCount"], 2)
+
+    def test__process_cleared_markets_no_client(self):
+        self.control._process_cleared_markets(
+            events.ClearedMarketsEvent(mock.Mock(orders=[mock.Mock()], spec=["orders"]))
+        )
+        self.assertIsNone(self.control.cleared_markets[0]["username"])
+
+
+class SimulationResultsTest(unittest.TestCase):
+    def setUp(self):
+        self.results = parallel.SimulationResults()
+
+    def test_add(self):
+        self.results.add(
+            {
+                "orders": [{"id": 1}],
+                "cleared_markets": [{"profit": 1.234, "betCount": 1}],
+            }
+        )
+        self.results.add(
+            {
+                "orders": [{"id": 2}],
+                "cleared_markets": [{"profit": -1, "betCount": 1}],
+            }
+        )
+        self.assertEqual(len(self.results), 2)
+        self.assertEqual(self.results.process_count, 2)
+        self.assertEqual(self.results.profit, 0.23)
+        self.assertEqual(self.results.bet_count, 2)
+
+    def test_client_totals(self):
+        self.results.add(
+            {
+                "orders": [],
+                "cleared_markets": [
+                    {"username": "a", "profit": 1.234, "betCount": 1},
+                    {"username": "b", "profit": -1, "betCount": 2},
+                ],
+            }
+        )
+        self.results.add(
+            {
+                "orders": [],
+                "cleared_markets": [{"username": "a", "profit": 0.5, "betCount": 3}],
+            }
+        )
+        self.assertEqual(
+            self.results.client_totals,
+            {
+                "a": {"profit": 1.73, "bet_count": 4},
+                "b": {"profit": -1, "bet_count": 2},
+            },
+        )
+
+
+class ParallelSimulationTest(unittest.TestCase):
+    def setUp(self):
+        self.simulation = parallel.ParallelSimulation(
+            setup, ["c", "a", "b"], workers=2, markets_per_process=2
+        )
+
+    def test_init(self):
+        self.assertEqual(self.simulation.setup, setup)
+        self.assertEqual(self.simulation.workers, 2)
+        self.assertEqual(self.simulation.markets_per_process, 2)
+        self.assertFalse(self.simulation.event_processing)
+        self.assertEqual(self.simulation.event_groups, {})
+        self.assertEqual(self.simulation.max_tasks_per_child, 1)
+
+    def test_create_shards(self):
+        self.assertEqual(self.simulation.create_shards(), [["a", "b"], ["c"]])
+
+    @mock.patch("flumine.simulation.parallel.get_file_md")
+    def test_create_shards_event_processing(self, mock_get_file_md):
+        event_ids = {"a": "1", "b": "2", "c": "1", "d": "3"}
+        mock_get_file_md.side_effect = lambda m: mock.Mock(event_id=event_ids[m])
+        self.simulation.markets = ["a", "b", "c", "d"]
+        self.simulation.event_processing = True
+        self.assertEqual(self.simulation.create_shards(), [["a", "c"], ["b", "d"]])
+        self.simulation.event_groups = {"2": "1"}
+        self.assertEqual(self.simulation.create_shards(), [["a", "b", "c"], ["d"]])
+
+    def test_add_logging_control(self):
+        mock_control = mock.Mock()
+        self.simulation.add_logging_control(mock_control)
+        self.assertEqual(self.simulation._logging_controls, [mock_control])
+
+    def test__log_cleared_markets(self):
+        mock_control = mock.Mock()
+        self.simulation._logging_controls = [mock_control]
+        self.simulation._log_cleared_markets(
+            {"cleared_markets": [{"marketId": "1.1", "profit": 1}]}
+        )
+        event = mock_control.logging_queue.put.call_args[0][0]
+        self.assertEqual(event.event.orders[0].market_id, "1.1")
+        self.assertEqual(event.event.orders[0].profit, 1)
+
+    def test_run(self):
+        simulation = parallel.ParallelSimulation(
+            setup,
+            ["tests/resources/1.197931750", "tests/resources/1.197931751"],
+            workers=2,
+            markets_per_process=1,
+        )
+        mock_control = mock.Mock()
+        simulation._logging_controls = [mock_control]
+        results = simulation.run()
+        self.assertEqual(results.process_count, 2)
+        self.assertEqual(len(results.orders), 2)
+        self.assertEqual(
+            sorted(c["marketId"] for c in results.cleared_markets),
+            ["1.197931750", "1.197931751"],
+        )
+        self.assertEqual(results.bet_count, 2)
+        mock_control.start.assert_called_with()
+        mock_control.join.assert_called_with()
+
+    def test_run_error(self):
+        simulation = parallel.ParallelSimulation(
+            setup_error, ["tests/resources/1.197931750"], workers=1
+        )
+        mock_control = mock.Mock()
+        simulation._logging_controls = [mock_control]
+        with self.assertRaises(ValueError):
+            simulation.run()
+        mock_control.start.assert_called_with()
+        termination_event = mock_control.logging_queue.put.call_args[0][0]
+        self.assertIsInstance(termination_event, events.TerminationEvent)
+        mock_control.join.assert_called_with()
+
+    def test_run_clients(self):
+        simulation = parallel.ParallelSimulation(
+            setup_clients,
+            ["tests/resources/1.197931750", "tests/resources/1.197931751"],
+            workers=2,
+            markets_per_process=1,
+        )
+        results = simulation.run()
+        self.assertEqual(len(results.cleared_markets), 4)
+        client_totals = results.client_totals
+        self.assertEqual(sorted(client_totals), ["one", "two"])
+        # orders placed using the default client
+        self.assertEqual(client_totals["one"]["bet_count"], 2)
+        self.assertEqual(client_totals["one"]["profit"], results.profit)
+        self.assertEqual(client_totals["two"], {"profit": 0, "bet_count": 0})
+
+    def test_str(self):
+        self.assertEqual(str(self.simulation), "<ParallelSimulation>")
+
+    def test_repr(self):
+        self.assertEqual(repr(self.simulation), "<ParallelSimulation>")
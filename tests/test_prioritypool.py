@@ -0,0 +1,120 @@
+import threading
+import unittest
+from unittest import mock
+
+from flumine.execution.prioritypool import (
+    PriorityWorkQueue,
+    PriorityThreadPoolExecutor,
+    SHUTDOWN_PRIORITY,
+)
+
+
+class PriorityWorkQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.queue = PriorityWorkQueue()
+
+    def _put(self, work_item, priority=0, lane=None):
+        self.queue.next_priority = (priority, lane)
+        self.queue.put(work_item)
+
+    def test_init(self):
+        self.assertEqual(self.queue.queue, [])
+        self.assertEqual(self.queue.max_depth, 0)
+        self.assertEqual(self.queue.next_priority, (0, None))
+        self.assertEqual(
+            self.queue.info, {"depth": 0, "max_depth": 0, "queue_time": {}}
+        )
+
+    def test_priority(self):
+        place, update, cancel, replace, place_two = (mock.Mock() for _ in range(5))
+        self._put(place, 3, "Place")
+        self._put(update, 2, "Update")
+        self._put(None, 3, "Place")  # worker exit sentinel
+        self._put(cancel, 0, "Cancel")
+        self._put(replace, 1, "Replace")
+        self._put(place_two, 3, "Place")
+        self.assertEqual(self.queue.qsize(), 6)
+        self.assertEqual(self.queue.max_depth, 6)
+        self.assertEqual(
+            [self.queue.get_nowait() for _ in range(6)],
+            [cancel, replace, update, place, place_two, None],
+        )
+        queue_time = self.queue.info["queue_time"]
+        self.assertEqual(sorted(queue_time), ["Cancel", "Place", "Replace", "Update"])
+        self.assertEqual(queue_time["Place"]["count"], 2)
+
+    def test_priority_fifo(self):
+        work_items = [mock.Mock() for _ in range(3)]
+        for work_item in work_items:
+            self._put(work_item)
+        self.assertEqual([self.queue.get_nowait() for _ in range(3)], work_items)
+
+    def test_priority_shutdown(self):
+        self.queue.put(None)
+        self.assertEqual(self.queue.queue[0][0], SHUTDOWN_PRIORITY)
+        self.assertIsNone(self.queue.queue[0][2])
+
+    def test_info_locked(self):
+        # profiler timings are updated by worker threads
+        self.queue.mutex = mock.MagicMock()
+        self.assertEqual(self.queue.info["depth"], 0)
+        self.queue.mutex.__enter__.assert_called_with()
+        self.queue.mutex.__exit__.assert_called()
+
+    def test_reset(self):
+        self._put(mock.Mock(), 3, "Place")
+        self._put(mock.Mock(), 3, "Place")
+        self.queue.get_nowait()
+        info = self.queue.reset()
+        self.assertEqual(info["max_depth"], 2)
+        self.assertEqual(info["queue_time"]["Place"]["count"], 1)
+        self.assertEqual(
+            self.queue.info, {"depth": 1, "max_depth": 1, "queue_time": {}}
+        )
+
+
+class PriorityThreadPoolExecutorTest(unittest.TestCase):
+    def test_submit(self):
+        thread_pool = PriorityThreadPoolExecutor(max_workers=1)
+        self.addCleanup(thread_pool.shutdown)
+        started = threading.Event()
+        blocked = threading.Event()
+        executed = []
+
+        def func(name, http_session=None):
+            started.set()
+            blocked.wait(1)
+            executed.append((name, http_session))
+
+        thread_pool.submit(func, "Place", priority=3, lane="Place")
+        started.wait(1)  # worker busy
+        futures = [
+            thread_pool.submit(func, "Place", priority=3, lane="Place"),
+            thread_pool.submit(func, "Update", 1, priority=2, lane="Update"),
+            thread_pool.submit(func, "Cancel", http_session=2, priority=0),
+            thread_pool.submit(func, "Unknown"),
+        ]
+        self.assertEqual(thread_pool._work_queue.next_priority, (0, None))
+        blocked.set()
+        thread_pool.shutdown(wait=True)
+        self.assertEqual(
+            executed,
+            [
+                ("Place", None),
+                ("Cancel", 2),
+                ("Unknown", None),
+                ("Update", 1),
+                ("Place", None),
+            ],
+        )
+        self.assertTrue(all(future.done() for future in futures))
+        queue_time = thread_pool.reset()["queue_time"]
+        self.assertEqual(sorted(queue_time), ["Place", "Update"])
+        self.assertEqual(queue_time["Place"]["count"], 2)
+
+    def test_submit_error(self):
+        thread_pool = PriorityThreadPoolExecutor(max_workers=1)
+        thread_pool.shutdown()
+        with self.assertRaises(RuntimeError):
+            thread_pool.submit(print, priority=1, lane="Place")
+        self.assertEqual(thread_pool._work_queue.next_priority, (0, None))
@@ -37,6 +37,8 @@ class ProcessCurrentOrdersTest(unittest.TestCase):
         betfair_order.id = "123"
         betfair_order.complete = True
         market.blotter["123"] = betfair_order
+        market.blotter.refresh_order_exposure = mock.Mock()
+        market.blotter.update_bet_id = mock.Mock()
         event = mock.Mock(event=[mock.Mock(orders=[current_order])])
 
         process.process_current_orders(
@@ -49,6 +51,8 @@ class ProcessCurrentOrdersTest(unittest.TestCase):
         mock_process_current_order.assert_called_with(
             betfair_order, current_order, mock_log_control
         )
+        market.blotter.refresh_order_exposure.assert_called_with(betfair_order)
+        market.blotter.update_bet_id.assert_called_with(betfair_order)
 
     def test_process_current_order(self):
         mock_order = mock.Mock(status=OrderStatus.EXECUTABLE)
@@ -0,0 +1,83 @@
+import unittest
+from unittest import mock
+
+from flumine.profiler import Profiler, BUCKET_COUNT, _percentile
+
+
+class ProfilerTest(unittest.TestCase):
+    def setUp(self):
+        self.profiler = Profiler(sample_rate=2)
+
+    def test_init(self):
+        self.assertEqual(self.profiler.sample_rate, 2)
+        self.assertTrue(self.profiler.sampling)
+        self.assertEqual(self.profiler._event_count, 0)
+        self.assertEqual(self.profiler._stages, {})
+
+    def test_sample(self):
+        self.assertEqual(
+            [self.profiler.sample() for _ in range(4)], [False, True, False, True]
+        )
+        self.assertTrue(self.profiler.sampling)
+
+    @mock.patch("flumine.profiler.perf_counter", return_value=10.5)
+    def test_record(self, mock_perf_counter):
+        self.profiler.record("market", None, 10.0)
+        timings = self.profiler._stages[("market", None)]
+        self.assertEqual(timings[:2], [0.5, 0.5])
+        self.assertEqual(timings[2 + 19], 1)  # 500000us
+
+    def test_add(self):
+        self.profiler.add("market", None, 0.000003)
+        self.profiler.add("market", None, 0.000001)
+        self.profiler.add("market", None, 1e-7)
+        self.profiler.add("market", None, 1e9)
+        timings = self.profiler._stages[("market", None)]
+        self.assertAlmostEqual(timings[0], 1e9 + 0.0000041)
+        self.assertEqual(timings[1], 1e9)
+        self.assertEqual(timings[2], 1)  # <1us
+        self.assertEqual(timings[3], 1)  # 1us
+        self.assertEqual(timings[4], 1)  # 2-3us
+        self.assertEqual(timings[-1], 1)  # capped
+        self.assertEqual(len(timings), 2 + BUCKET_COUNT)
+
+    def test_reset(self):
+        self.profiler.add("market", None, 0.1)
+        stages = self.profiler.reset()
+        self.assertIn(("market", None), stages)
+        self.assertEqual(self.profiler._stages, {})
+
+    def test_summary(self):
+        mock_strategy = mock.Mock()
+        mock_strategy.name = "test"
+        for _ in range(99):
+            self.profiler.add("check_market_book", mock_strategy, 0.00001)
+        self.profiler.add("check_market_book", mock_strategy, 0.01)
+        self.profiler.add("middleware", object(), 0.001)
+        self.profiler._stages[("event", None)] = [0.0, 0.0] + [0] * BUCKET_COUNT
+        self.assertEqual(
+            self.profiler.info,
+            {
+                "check_market_book.test": {
+                    "count": 100,
+                    "total": 0.01099,
+                    "mean": 0.00011,
+                    "p50": 1.6e-05,
+                    "p99": 1.6e-05,
+                    "max": 0.01,
+                },
+                "middleware.object": {
+                    "count": 1,
+                    "total": 0.001,
+                    "mean": 0.001,
+                    "p50": 0.001,
+                    "p99": 0.001,
+                    "max": 0.001,
+                },
+            },
+        )
+
+    def test__percentile(self):
+        self.assertEqual(_percentile([1, 0, 1], 2, 0.5, 0.000004), 0.000001)
+        self.assertEqual(_percentile([1, 0, 1], 2, 0.99, 0.000003), 0.000003)
+        self.assertEqual(_percentile([1, 0, 0], 2, 0.99, 0.000003), 0.000003)
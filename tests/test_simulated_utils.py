@@ -52,3 +52,43 @@ class SimulatedDateTimeTest(unittest.TestCase):
 
         self.assertIsInstance(datetime.datetime.utcnow(), datetime.datetime)
         self.assertIsInstance(datetime.datetime.now(), datetime.datetime)
+
+
+class MergeMarketBookGeneratorsTest(unittest.TestCase):
+    @staticmethod
+    def _gen(name: str, epochs: list):
+        for epoch in epochs:
+            yield [mock.Mock(publish_time_epoch=epoch, market_id=name)]
+
+    def test_merge(self):
+        gens = [
+            self._gen("1", [1, 4, 6]),
+            self._gen("2", [2, 3, 7]),
+            self._gen("3", [5]),
+        ]
+        self.assertEqual(
+            [m[0].publish_time_epoch for m in utils.merge_market_book_generators(gens)],
+            [1, 2, 3, 4, 5, 6, 7],
+        )
+
+    def test_merge_ties(self):
+        # ties yielded first in first out (requeued to the back)
+        gens = [
+            self._gen("1", [1, 1, 2]),
+            self._gen("2", [1, 2]),
+            self._gen("3", [1]),
+        ]
+        self.assertEqual(
+            [
+                (m[0].market_id, m[0].publish_time_epoch)
+                for m in utils.merge_market_book_generators(gens)
+            ],
+            [("1", 1), ("2", 1), ("3", 1), ("1", 1), ("2", 2), ("1", 2)],
+        )
+
+    def test_merge_empty(self):
+        gens = [self._gen("1", []), self._gen("2", [1])]
+        self.assertEqual(
+            [m[0].market_id for m in utils.merge_market_book_generators(gens)],
+            ["2"],
+        )
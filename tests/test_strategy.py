@@ -112,6 +112,8 @@ class BaseStrategyTest(unittest.TestCase):
         self.assertEqual(self.strategy.max_live_trade_count, 3)
         self.assertEqual(self.strategy.streams, [])
         self.assertEqual(self.strategy.historic_stream_ids, set())
+        self.assertEqual(self.strategy.stream_market_filters, {})
+        self.assertEqual(self.strategy._market_views, {})
         self.assertEqual(self.strategy.name_hash, "a94a8fe5ccb19")
         self.assertFalse(self.strategy.multi_order_trades)
         self.assertEqual(strategy.STRATEGY_NAME_HASH_LENGTH, 13)
@@ -174,8 +176,10 @@ class BaseStrategyTest(unittest.TestCase):
             ("1.23", 891, 7): 2,
             ("1.24", 112, 7): 3,
         }
+        self.strategy._market_views = {(1, "1.23"): True, (1, "1.24"): False}
         self.strategy.remove_market("1.23")
         self.assertEqual(self.strategy._invested, {("1.24", 112, 7): 3})
+        self.assertEqual(self.strategy._market_views, {(1, "1.24"): False})
 
     def test_validate_order(self):
         mock_order = mock.Mock()
@@ -280,6 +284,53 @@ class BaseStrategyTest(unittest.TestCase):
         self.assertFalse(self.strategy.market_cached("1.234"))
         self.assertFalse(self.strategy.market_cached("1.789"))
 
+    def test_market_cached_coalesced(self):
+        mock_stream = mock.Mock()
+        mock_stream._listener.stream._caches = {"1.234": None, "1.789": None}
+        self.strategy.streams = [mock_stream]
+        self.strategy.stream_market_filters[mock_stream].append({})
+        self.strategy._market_views = {(mock_stream, "1.234"): True}
+        self.assertTrue(self.strategy.market_cached("1.234"))
+        self.assertFalse(self.strategy.market_cached("1.789"))
+
+    def test_market_in_view(self):
+        mock_stream = mock.Mock(stream_id=321)
+        mock_stream_two = mock.Mock(stream_id=654)
+        self.strategy.streams = [mock_stream, mock_stream_two]
+        self.assertTrue(self.strategy.market_in_view(321, "1.23"))
+        self.strategy.stream_market_filters[mock_stream] = [
+            {"marketTypes": ["WIN"]},
+            {"marketIds": ["1.24"]},
+        ]
+        self.assertTrue(
+            self.strategy.market_in_view(321, "1.23", mock.Mock(market_type="WIN"))
+        )
+        self.assertFalse(
+            self.strategy.market_in_view(321, "1.25", mock.Mock(market_type="PLACE"))
+        )
+        self.assertTrue(
+            self.strategy.market_in_view(321, "1.24", mock.Mock(market_type="PLACE"))
+        )
+        self.assertEqual(
+            self.strategy._market_views,
+            {
+                (mock_stream, "1.23"): True,
+                (mock_stream, "1.25"): False,
+                (mock_stream, "1.24"): True,
+            },
+        )
+        # cached
+        self.assertFalse(self.strategy.market_in_view(321, "1.25", None))
+        # stream not coalesced
+        self.assertTrue(self.strategy.market_in_view(654, "1.25", None))
+        # not cached until the market definition is received
+        self.assertFalse(self.strategy.market_in_view(321, "1.26", None))
+        self.assertNotIn((mock_stream, "1.26"), self.strategy._market_views)
+        self.assertTrue(
+            self.strategy.market_in_view(321, "1.26", mock.Mock(market_type="WIN"))
+        )
+        self.assertTrue(self.strategy._market_views[(mock_stream, "1.26")])
+
     def test_stream_ids(self):
         mock_stream = mock.Mock(stream_id=321)
         self.strategy.streams = [mock_stream]
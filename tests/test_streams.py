@@ -1,14 +1,23 @@
+import io
+import os
+import copy
+import json
+import pickle
 import unittest
+import tempfile
 import datetime
 from unittest import mock
 from unittest.mock import call
 
+from flumine import utils
 from flumine.clients import VenueType
 from flumine.streams import streams, datastream, historicalstream, betdaqorderpolling
 from flumine.streams.basestream import BaseStream
 from flumine.streams.simulatedorderstream import CurrentOrders
+from flumine.strategy.strategy import BaseStrategy
 from flumine.streams import orderstream
 from flumine.exceptions import ListenerError
+from betfairlightweight.resources import MarketBook
 
 
 class StreamsTest(unittest.TestCase):
@@ -279,6 +288,70 @@ class StreamsTest(unittest.TestCase):
         self.assertEqual(len(self.streams), 1)
         mock_increment.assert_not_called()
 
+    @mock.patch("flumine.streams.streams.config")
+    def test_add_stream_coalesce(self, mock_config):
+        mock_config.coalesce_market_streams = True
+        strategy_one = BaseStrategy(
+            market_filter={"eventTypeIds": ["7"], "marketTypes": ["WIN"]}
+        )
+        strategy_two = BaseStrategy(
+            market_filter=[
+                {"eventTypeIds": ["7"], "marketTypes": ["PLACE"]},
+                {"eventTypeIds": ["7"], "marketTypes": ["WIN"]},
+            ]
+        )
+        strategy_three = BaseStrategy(
+            market_filter={"eventTypeIds": ["4339"], "marketTypes": ["PLACE"]}
+        )
+        strategy_four = BaseStrategy(
+            market_filter={"eventTypeIds": ["7"], "marketTypes": ["WIN"]},
+            conflate_ms=100,
+        )
+        for strategy in (strategy_one, strategy_two, strategy_three, strategy_four):
+            self.streams.add_stream(strategy)
+        self.assertEqual(len(self.streams), 3)
+        stream = self.streams._streams[0]
+        self.assertEqual(
+            stream.market_filter,
+            {"eventTypeIds": ["7"], "marketTypes": ["WIN", "PLACE"]},
+        )
+        self.assertEqual(strategy_one.streams, [stream])
+        self.assertEqual(strategy_two.streams, [stream, stream])
+        self.assertEqual(
+            strategy_one.stream_market_filters,
+            {stream: [{"eventTypeIds": ["7"], "marketTypes": ["WIN"]}]},
+        )
+        self.assertEqual(
+            strategy_two.stream_market_filters,
+            {stream: strategy_two.market_filter},
+        )
+        self.assertEqual(strategy_three.streams, [self.streams._streams[1]])
+        self.assertEqual(strategy_four.streams, [self.streams._streams[2]])
+
+    def test_add_stream_coalesce_disabled(self):
+        strategy_one = BaseStrategy(market_filter={"marketTypes": ["WIN"]})
+        strategy_two = BaseStrategy(market_filter={"marketTypes": ["PLACE"]})
+        self.streams.add_stream(strategy_one)
+        self.streams.add_stream(strategy_two)
+        self.assertEqual(len(self.streams), 2)
+        self.assertEqual(strategy_one.stream_market_filters, {})
+        self.assertEqual(strategy_two.stream_market_filters, {})
+
+    @mock.patch("flumine.streams.streams.config")
+    def test_add_stream_coalesce_market_definition(self, mock_config):
+        mock_config.coalesce_market_streams = True
+        strategy_one = BaseStrategy(
+            market_filter={"marketTypes": ["WIN"]},
+            market_data_filter={"fields": ["EX_BEST_OFFERS"]},
+        )
+        strategy_two = BaseStrategy(
+            market_filter={"marketTypes": ["PLACE"]},
+            market_data_filter={"fields": ["EX_BEST_OFFERS"]},
+        )
+        self.streams.add_stream(strategy_one)
+        self.streams.add_stream(strategy_two)
+        self.assertEqual(len(self.streams), 2)
+
     @mock.patch(
         "flumine.streams.streams.SportsDataStream", autospec=streams.SportsDataStream
     )
@@ -1217,6 +1290,323 @@ class TestHistoricListener(unittest.TestCase):
         # error
         self.assertIsNone(self.listener.on_data("p"))
 
+    def test_on_update(self):
+        mock_stream = mock.Mock(_lookup="mc")
+        self.listener.stream = mock_stream
+        self.listener.on_update({"pt": 123, "mc": {}})
+        self.listener.stream._process.assert_called_with({}, 123)
+        self.assertIsNone(self.listener.on_update(None))
+
+
+class TestReadLines(unittest.TestCase):
+    def test_read_lines(self):
+        f = io.StringIO('{"a": 1}\n{"b": 22}\n{"c": 333}')
+        for buffer_size in (1, 3, 8, 1024):
+            f.seek(0)
+            self.assertEqual(
+                list(historicalstream.read_lines(f, buffer_size)),
+                ['{"a": 1}', '{"b": 22}', '{"c": 333}'],
+            )
+
+    def test_read_lines_trailing_newline(self):
+        f = io.StringIO("abc\ndef\n")
+        self.assertEqual(list(historicalstream.read_lines(f, 2)), ["abc", "def"])
+
+    def test_read_lines_long_line(self):
+        # line spanning many chunks, empty lines and no trailing newline
+        long_line = "x" * 10000
+        f = io.StringIO("a\n\n%s\nb\n%s" % (long_line, long_line))
+        self.assertEqual(
+            list(historicalstream.read_lines(f, 7)),
+            ["a", "", long_line, "b", long_line],
+        )
+
+
+class TestJsonDecoding(unittest.TestCase):
+    def test_get_json_loads(self):
+        self.assertEqual(
+            historicalstream.get_json_loads(None), historicalstream.json.loads
+        )
+        self.assertEqual(historicalstream.get_json_loads("json"), json.loads)
+        self.assertEqual(
+            historicalstream.get_json_loads("unknown"), historicalstream.json.loads
+        )
+
+    def test_decode_lines(self):
+        lines = ['{"a": 1}\n', '{"b": 22}\n', '{"c": 333}']
+        self.assertEqual(
+            list(historicalstream.decode_lines(iter(lines), json.loads)),
+            [{"a": 1}, {"b": 22}, {"c": 333}],
+        )
+
+    def test_decode_lines_error(self):
+        lines = ['{"a": 1}\n', "{b\n", '{"c": 333}', "\n"]
+        with self.assertLogs(historicalstream.logger, level="ERROR") as logs:
+            decoded = list(historicalstream.decode_lines(iter(lines), json.loads))
+        self.assertEqual(decoded, [{"a": 1}, None, {"c": 333}, None])
+        self.assertEqual(len(logs.output), 2)
+
+
+class TestFlumineHistoricalGeneratorStream(unittest.TestCase):
+    def _market_books(
+        self, file_path="tests/resources/BASIC-1.132153978", **listener_kwargs
+    ) -> list:
+        stream = historicalstream.HistoricalStream(
+            flumine=None,
+            stream_id=1,
+            market_filter=file_path,
+            output_queue=False,
+            **listener_kwargs,
+        )
+        return [
+            [
+                (
+                    m.market_id,
+                    m.publish_time_epoch,
+                    m.total_matched,
+                    m.status,
+                    m.inplay,
+                    [
+                        (
+                            r.selection_id,
+                            r.last_price_traded,
+                            r.ex.available_to_back,
+                            r.ex.available_to_lay,
+                            r.ex.traded_volume,
+                        )
+                        for r in m.runners
+                    ],
+                )
+                for m in mbs
+            ]
+            for mbs in stream.create_generator()()
+        ]
+
+    def test__read_loop_compiled(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "1.132153978")
+            utils.compile_file("tests/resources/BASIC-1.132153978", output_path)
+            with mock.patch(
+                "flumine.streams.historicalstream.is_compiled_file",
+                wraps=utils.is_compiled_file,
+            ) as mock_is_compiled_file:
+                market_books = self._market_books(output_path)
+            mock_is_compiled_file.assert_called_once_with(output_path)
+            self.assertEqual(self._market_books(), market_books)
+
+    @mock.patch("flumine.streams.historicalstream.config")
+    def test__read_loop_buffer_size(self, mock_config):
+        mock_config.simulation_read_buffer_size = None
+        mock_config.simulation_json_decoder = None
+        mock_config.simulation_checkpoint_directory = None
+        market_books = self._market_books()
+        mock_config.simulation_read_buffer_size = 1024
+        self.assertEqual(market_books, self._market_books())
+        self.assertGreater(len(market_books), 0)
+
+    @mock.patch("flumine.streams.historicalstream.config")
+    def test__read_loop_json_decoder(self, mock_config):
+        mock_config.simulation_read_buffer_size = None
+        mock_config.simulation_checkpoint_directory = None
+        mock_config.simulation_json_decoder = None
+        market_books = self._market_books()
+        self.assertGreater(len(market_books), 0)
+        for decoder in ("json", "unknown"):
+            mock_config.simulation_json_decoder = decoder
+            self.assertEqual(market_books, self._market_books())
+
+    def _streaming_sequential(self, **listener_kwargs) -> list:
+        stream = historicalstream.HistoricalStream(
+            flumine=None,
+            stream_id=1,
+            market_filter="tests/resources/SELF-1.181223995",
+            output_queue=False,
+            **listener_kwargs,
+        )
+        return [
+            m.streaming_sequential for mbs in stream.create_generator()() for m in mbs
+        ]
+
+    def test__read_loop_streaming_sequential(self):
+        for lazy in (True, False):
+            with mock.patch(
+                "flumine.streams.historicalstream.config.simulation_lazy_market_books",
+                lazy,
+            ):
+                sequential = self._streaming_sequential()
+                self.assertFalse(sequential[0])
+                self.assertTrue(all(sequential[1:]))
+                # suspended updates yielded between filtered updates
+                sequential = self._streaming_sequential(inplay=True)
+                self.assertFalse(sequential[0])
+                self.assertIn(False, sequential[1:])
+                self.assertTrue(sequential[-1])
+
+    def test_get_changed_runners(self):
+        mock_cache = mock.Mock(
+            streaming_sequential=True,
+            streaming_update={"rc": [{"id": 123}, {"id": 456, "hc": 1.5}]},
+        )
+        self.assertEqual(
+            historicalstream.get_changed_runners(mock_cache), {(123, 0), (456, 1.5)}
+        )
+        mock_cache.streaming_update = {"marketDefinition": {}, "rc": []}
+        self.assertIsNone(historicalstream.get_changed_runners(mock_cache))
+        mock_cache.streaming_update = {"rc": []}
+        mock_cache.streaming_sequential = False
+        self.assertIsNone(historicalstream.get_changed_runners(mock_cache))
+
+    def test_create_market_book(self):
+        listener = historicalstream.HistoricListener()
+        stream = historicalstream.FlumineHistoricalGeneratorStream(
+            "tests/resources/BASIC-1.132153978", listener, "marketSubscription", 1
+        )
+        stream.listener.register_stream(1, "marketSubscription")
+        attributes = [
+            "market_id",
+            "bet_delay",
+            "bet_delay_models",
+            "bsp_reconciled",
+            "complete",
+            "cross_matching",
+            "inplay",
+            "is_market_data_delayed",
+            "last_match_time",
+            "number_of_active_runners",
+            "number_of_runners",
+            "number_of_winners",
+            "runners_voidable",
+            "status",
+            "suspend_reason",
+            "total_available",
+            "total_matched",
+            "version",
+            "publish_time",
+            "publish_time_epoch",
+            "streaming_unique_id",
+            "streaming_update",
+            "streaming_snap",
+            "market_definition",
+            "elapsed_time",
+            "runners",
+            "_data",
+        ]
+        for active in stream._process_file():
+            for cache in stream.listener.stream._caches.values():
+                market_book = cache.create_resource(1, snap=True)
+                lazy_market_book = historicalstream.create_market_book(cache, 1)
+                self.assertIsInstance(lazy_market_book, MarketBook)
+                for attribute in attributes:
+                    self.assertEqual(
+                        getattr(market_book, attribute),
+                        getattr(lazy_market_book, attribute),
+                    )
+                self.assertEqual(
+                    getattr(market_book.price_ladder_definition, "type", None),
+                    getattr(lazy_market_book.price_ladder_definition, "type", None),
+                )
+                self.assertIsNone(market_book.key_line_description)
+                self.assertIsNone(lazy_market_book.key_line_description)
+                with self.assertRaises(AttributeError):
+                    lazy_market_book.unknown
+
+    def test_create_market_book_copy(self):
+        listener = historicalstream.HistoricListener()
+        stream = historicalstream.FlumineHistoricalGeneratorStream(
+            "tests/resources/BASIC-1.132153978", listener, "marketSubscription", 1
+        )
+        stream.listener.register_stream(1, "marketSubscription")
+        for active in stream._process_file():
+            for cache in stream.listener.stream._caches.values():
+                market_book = historicalstream.create_market_book(cache, 1)
+                for market_book_copy in (
+                    copy.copy(market_book),
+                    copy.deepcopy(market_book),
+                    pickle.loads(pickle.dumps(market_book)),
+                ):
+                    self.assertIsInstance(market_book_copy, MarketBook)
+                    for attribute in (
+                        "market_id",
+                        "status",
+                        "publish_time",
+                        "number_of_runners",
+                        "last_match_time",
+                        "cross_matching",
+                        "_data",
+                    ):
+                        self.assertEqual(
+                            getattr(market_book, attribute),
+                            getattr(market_book_copy, attribute),
+                        )
+                    self.assertEqual(
+                        [r.selection_id for r in market_book.runners],
+                        [r.selection_id for r in market_book_copy.runners],
+                    )
+
+    @mock.patch("flumine.streams.historicalstream.CHECKPOINT_MIN_UPDATES", 1)
+    @mock.patch("flumine.streams.historicalstream.config")
+    def test__read_loop_checkpoint(self, mock_config):
+        mock_config.simulation_read_buffer_size = None
+        mock_config.simulation_json_decoder = None
+        for listener_kwargs in (
+            {"inplay": True},
+            {"seconds_to_start": 60},
+            {"seconds_to_start": 600, "inplay": False},
+        ):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                mock_config.simulation_checkpoint_directory = None
+                market_books = self._market_books(**listener_kwargs)
+                mock_config.simulation_checkpoint_directory = tmp_dir
+                self.assertEqual(market_books, self._market_books(**listener_kwargs))
+                self.assertEqual(len(os.listdir(tmp_dir)), 1)
+                # replay from checkpoint
+                self.assertEqual(market_books, self._market_books(**listener_kwargs))
+
+    @mock.patch("flumine.streams.historicalstream.CHECKPOINT_MIN_UPDATES", 1)
+    @mock.patch("flumine.streams.historicalstream.get_json_loads")
+    @mock.patch("flumine.streams.historicalstream.config")
+    def test__read_loop_checkpoint_json_decoder(self, mock_config, mock_get_json_loads):
+        mock_loads = mock.Mock(side_effect=json.loads)
+        mock_get_json_loads.return_value = mock_loads
+        mock_config.simulation_read_buffer_size = None
+        mock_config.simulation_json_decoder = None
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            mock_config.simulation_checkpoint_directory = None
+            market_books = self._market_books(inplay=True)
+            mock_config.simulation_checkpoint_directory = tmp_dir
+            self._market_books(inplay=True)  # create checkpoint
+            mock_config.simulation_json_decoder = "test"
+            mock_loads.reset_mock()
+            # replay from checkpoint
+            self.assertEqual(market_books, self._market_books(inplay=True))
+            mock_get_json_loads.assert_called_with("test")
+            self.assertTrue(mock_loads.called)
+
+    @mock.patch("flumine.streams.historicalstream.config")
+    def test__checkpoint_path(self, mock_config):
+        mock_config.simulation_checkpoint_directory = "/tmp/checkpoints"
+        listener = historicalstream.HistoricListener(inplay=True)
+        stream = historicalstream.FlumineHistoricalGeneratorStream(
+            "tests/resources/BASIC-1.132153978", listener, "marketSubscription", 1
+        )
+        self.assertTrue(
+            stream._checkpoint_path().startswith("/tmp/checkpoints/BASIC-1.132153978.")
+        )
+        # different filter
+        listener.inplay = False
+        self.assertIsNone(stream._checkpoint_path())
+        listener.seconds_to_start = 600
+        path = stream._checkpoint_path()
+        listener.seconds_to_start = 60
+        self.assertNotEqual(path, stream._checkpoint_path())
+        # remote file
+        stream.file_path = "s3://bucket/1.132153978"
+        self.assertIsNone(stream._checkpoint_path())
+        # disabled
+        stream.file_path = "tests/resources/BASIC-1.132153978"
+        mock_config.simulation_checkpoint_directory = None
+        self.assertIsNone(stream._checkpoint_path())
+
 
 class TestOrderStream(unittest.TestCase):
     def setUp(self) -> None:
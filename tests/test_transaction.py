@@ -5,13 +5,16 @@ from unittest.mock import call
 from flumine.clients import VenueType
 from flumine.execution.transaction import Transaction, OrderPackageType
 from flumine.exceptions import ControlError, OrderError
+from flumine.order.ordertype import OrderTypes
 
 
 class TransactionTest(unittest.TestCase):
     def setUp(self) -> None:
         mock_blotter = {}
         self.mock_market = mock.Mock(blotter=mock_blotter)
-        self.mock_client = mock.Mock(trading_controls=[], VENUE=VenueType.BETFAIR)
+        self.mock_client = mock.Mock(
+            trading_controls=[], VENUE=VenueType.BETFAIR, paper_trade=False
+        )
         self.transaction = Transaction(
             self.mock_market, 1, False, self.mock_client, customer_strategy_ref="dotty"
         )
@@ -134,6 +137,36 @@ class TransactionTest(unittest.TestCase):
         self.transaction._pending_place = [(mock_order, None)]
         self.assertTrue(self.transaction._pending_orders)
 
+    @mock.patch("flumine.execution.transaction.Transaction.place_order")
+    def test_place_orders(self, mock_place_order):
+        mock_blotter = mock.Mock()
+        mock_blotter.start_exposure_batch.return_value = True
+        self.transaction.market.blotter = mock_blotter
+        mock_place_order.side_effect = [True, False]
+        mock_order_one, mock_order_two = mock.Mock(), mock.Mock()
+        self.assertEqual(
+            self.transaction.place_orders([mock_order_one, mock_order_two], 123),
+            [True, False],
+        )
+        mock_place_order.assert_has_calls(
+            [
+                mock.call(mock_order_one, 123, True, False),
+                mock.call(mock_order_two, 123, True, False),
+            ]
+        )
+        mock_blotter.start_exposure_batch.assert_called_with()
+        mock_blotter.end_exposure_batch.assert_called_with()
+
+    @mock.patch("flumine.execution.transaction.Transaction.place_order")
+    def test_place_orders_nested(self, mock_place_order):
+        mock_blotter = mock.Mock()
+        mock_blotter.start_exposure_batch.return_value = False
+        self.transaction.market.blotter = mock_blotter
+        mock_place_order.side_effect = ValueError
+        with self.assertRaises(ValueError):
+            self.transaction.place_orders([mock.Mock()])
+        mock_blotter.end_exposure_batch.assert_not_called()
+
     @mock.patch(
         "flumine.execution.transaction.Transaction._validate_controls",
         return_value=True,
@@ -352,6 +385,102 @@ class TransactionTest(unittest.TestCase):
         )
         self.assertFalse(self.transaction._pending_orders)
 
+    @mock.patch("flumine.execution.transaction.config")
+    @mock.patch("flumine.execution.transaction.Transaction._create_order_package")
+    def test_execute_collapse_cancel_place(
+        self, mock__create_order_package, mock_config
+    ):
+        mock_config.collapse_cancel_place = True
+        mock__create_order_package.return_value = [mock.Mock()]
+        mock_cancel_order = self._create_mock_order(1.5, size_remaining=2)
+        mock_cancel_order.update_data = {"size_reduction": None}
+        mock_place_order = self._create_mock_order(1.6, size=2)
+        self.transaction._pending_place = [(mock_place_order, 1234)]
+        self.transaction._pending_cancel = [(mock_cancel_order, None)]
+        self.assertEqual(self.transaction.execute(), 1)
+        mock__create_order_package.assert_called_once_with(
+            [(mock_cancel_order, 1234)], OrderPackageType.REPLACE
+        )
+        mock_cancel_order.replacing.assert_called_with()
+        self.assertEqual(mock_cancel_order.update_data["new_price"], 1.6)
+        self.assertEqual(mock_cancel_order.replacement_order, mock_place_order)
+
+    def test__collapse_cancel_place(self):
+        mock_cancel_order = self._create_mock_order(1.5, size_remaining=2)
+        mock_cancel_order_two = self._create_mock_order(1.5, size_remaining=2)
+        mock_place_order = self._create_mock_order(1.6, size=2)
+        mock_place_order_two = self._create_mock_order(1.7, size=2)
+        self.transaction._pending_place = [
+            (mock_place_order, None),
+            (mock_place_order_two, None),
+        ]
+        self.transaction._pending_cancel = [
+            (mock_cancel_order, None),
+            (mock_cancel_order_two, None),
+        ]
+        self.transaction._collapse_cancel_place()
+        self.assertEqual(self.transaction._pending_place, [])
+        self.assertEqual(self.transaction._pending_cancel, [])
+        self.assertEqual(
+            self.transaction._pending_replace,
+            [(mock_cancel_order, None), (mock_cancel_order_two, None)],
+        )
+        self.assertEqual(mock_cancel_order.replacement_order, mock_place_order)
+        self.assertEqual(mock_cancel_order_two.replacement_order, mock_place_order_two)
+
+    def test__collapse_cancel_place_no_match(self):
+        mock_cancel_orders = [
+            self._create_mock_order(1.5, size_remaining=2),  # size
+            self._create_mock_order(1.6, size_remaining=1),  # price
+            self._create_mock_order(1.5, size_remaining=1, side="LAY"),
+            self._create_mock_order(1.5, size_remaining=1, selection_id=2),
+            self._create_mock_order(1.5, size_remaining=1, persistence_type="PERSIST"),
+            self._create_mock_order(1.5, size_remaining=1, trade_id="other"),
+        ]
+        mock_cancel_orders.append(self._create_mock_order(1.5, size_remaining=1))
+        mock_cancel_orders[-1].update_data = {"size_reduction": 0.5}
+        mock_place_order = self._create_mock_order(1.6, size=1)
+        self.transaction._pending_place = [(mock_place_order, None)]
+        self.transaction._pending_cancel = [(o, None) for o in mock_cancel_orders]
+        self.transaction._collapse_cancel_place()
+        self.assertEqual(self.transaction._pending_place, [(mock_place_order, None)])
+        self.assertEqual(len(self.transaction._pending_cancel), 7)
+        self.assertEqual(self.transaction._pending_replace, [])
+
+    def test__collapse_cancel_place_paper_trade(self):
+        self.mock_client.paper_trade = True
+        mock_cancel_order = self._create_mock_order(1.5, size_remaining=2)
+        mock_place_order = self._create_mock_order(1.6, size=2)
+        self.transaction._pending_place = [(mock_place_order, None)]
+        self.transaction._pending_cancel = [(mock_cancel_order, None)]
+        self.transaction._collapse_cancel_place()
+        self.assertEqual(self.transaction._pending_replace, [])
+
+    @staticmethod
+    def _create_mock_order(
+        price,
+        size=None,
+        size_remaining=None,
+        side="BACK",
+        selection_id=1,
+        persistence_type="LAPSE",
+        trade_id="trade",
+    ):
+        mock_order = mock.Mock(
+            selection_id=selection_id,
+            handicap=0,
+            side=side,
+            size_remaining=size_remaining,
+            update_data={},
+            replacement_order=None,
+        )
+        mock_order.trade.id = trade_id
+        mock_order.order_type.ORDER_TYPE = OrderTypes.LIMIT
+        mock_order.order_type.price = price
+        mock_order.order_type.size = size
+        mock_order.order_type.persistence_type = persistence_type
+        return mock_order
+
     def test__validate_controls(self):
         mock_trading_control = mock.Mock()
         mock_client_control = mock.Mock()
@@ -1,8 +1,14 @@
+import os
+import sys
+import marshal
 import logging
 import unittest
+import tempfile
 import datetime
 from unittest import mock
 
+from betfairlightweight.compat import json
+
 from flumine import utils, FlumineException
 
 
@@ -50,9 +56,132 @@ class UtilsTest(unittest.TestCase):
             "29761984",
         )
 
+    def test_compile_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "1.132153978")
+            self.assertFalse(
+                utils.is_compiled_file("tests/resources/BASIC-1.132153978")
+            )
+            count = utils.compile_file("tests/resources/BASIC-1.132153978", output_path)
+            self.assertTrue(utils.is_compiled_file(output_path))
+            with open("tests/resources/BASIC-1.132153978") as f:
+                lines = [json.loads(line) for line in f]
+            self.assertEqual(count, len(lines))
+            self.assertEqual(
+                list(utils.read_compiled_file(output_path)),
+                [(line["pt"], line["mc"]) for line in lines],
+            )
+            self.assertEqual(
+                utils.get_file_md(output_path).market_type,
+                utils.get_file_md("tests/resources/BASIC-1.132153978").market_type,
+            )
+
+    def test_is_compiled_file_missing(self):
+        self.assertFalse(utils.is_compiled_file("s3://bucket/1.123"))
+
+    def test_read_compiled_file_version_error(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "1.132153978")
+            with open(output_path, "wb") as f:
+                f.write(utils.COMPILED_FILE_PREFIX + b"0\n")
+            self.assertTrue(utils.is_compiled_file(output_path))
+            with self.assertRaises(FlumineException):
+                list(utils.read_compiled_file(output_path))
+
+    def test_read_compiled_file_python_version_error(self):
+        # same marshal version, different python version
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "1.132153978")
+            with open(output_path, "wb") as f:
+                f.write(
+                    utils.COMPILED_FILE_PREFIX
+                    + b"%s-2.7-%d\n"
+                    % (sys.implementation.name.encode(), marshal.version)
+                )
+            with self.assertRaises(FlumineException):
+                list(utils.read_compiled_file(output_path))
+
+    def test_compiled_file_header(self):
+        self.assertEqual(
+            utils.COMPILED_FILE_HEADER,
+            b"FLUMINE-COMPILED-%s-%d.%d-%d\n"
+            % (
+                sys.implementation.name.encode(),
+                sys.version_info.major,
+                sys.version_info.minor,
+                marshal.version,
+            ),
+        )
+
     def test_chunks(self):
         self.assertEqual([i for i in utils.chunks([1, 2, 3], 1)], [[1], [2], [3]])
 
+    def test_merge_market_filters(self):
+        self.assertEqual(
+            utils.merge_market_filters(
+                {"eventTypeIds": ["7"], "marketTypes": ["WIN"]},
+                {"eventTypeIds": ["7"], "marketTypes": ["PLACE", "WIN"]},
+            ),
+            {"eventTypeIds": ["7"], "marketTypes": ["WIN", "PLACE"]},
+        )
+        self.assertEqual(
+            utils.merge_market_filters(
+                {"eventTypeIds": ["7"]}, {"eventTypeIds": ["7"], "venues": ["Ascot"]}
+            ),
+            {"eventTypeIds": ["7"]},
+        )
+        self.assertEqual(
+            utils.merge_market_filters(
+                {"eventTypeIds": ["7"], "bspMarket": True},
+                {"eventTypeIds": ["7"], "bspMarket": False},
+            ),
+            {"eventTypeIds": ["7"]},
+        )
+        self.assertEqual(
+            utils.merge_market_filters({"marketIds": ["1.1"]}, {"marketIds": ["1.1"]}),
+            {"marketIds": ["1.1"]},
+        )
+        self.assertIsNone(
+            utils.merge_market_filters(
+                {"eventTypeIds": ["7"], "marketTypes": ["WIN"]},
+                {"eventTypeIds": ["4339"], "marketTypes": ["PLACE"]},
+            )
+        )
+        self.assertIsNone(utils.merge_market_filters({"unknown": 1}, {"unknown": 2}))
+
+    def test_market_filter_match(self):
+        market_definition = mock.Mock(
+            event_type_id="7", market_type="WIN", bsp_market=True
+        )
+        self.assertTrue(utils.market_filter_match({}, "1.1", market_definition))
+        self.assertTrue(
+            utils.market_filter_match(
+                {
+                    "marketIds": ["1.1"],
+                    "eventTypeIds": ["7"],
+                    "marketTypes": ["WIN", "PLACE"],
+                    "bspMarket": True,
+                    "unknown": 1,
+                },
+                "1.1",
+                market_definition,
+            )
+        )
+        self.assertFalse(
+            utils.market_filter_match({"marketIds": ["1.2"]}, "1.1", market_definition)
+        )
+        self.assertFalse(
+            utils.market_filter_match(
+                {"marketTypes": ["PLACE"]}, "1.1", market_definition
+            )
+        )
+        self.assertFalse(
+            utils.market_filter_match({"bspMarket": False}, "1.1", market_definition)
+        )
+        self.assertFalse(
+            utils.market_filter_match({"marketTypes": ["WIN"]}, "1.1", None)
+        )
+
     def test_create_cheap_hash(self):
         self.assertEqual(
             utils.create_cheap_hash("test"),
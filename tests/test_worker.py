@@ -202,6 +202,51 @@ class WorkersTest(unittest.TestCase):
         )
         mock_flumine.log_control.assert_called_with(mock_events.BalanceEvent())
 
+    @mock.patch("flumine.worker.logger")
+    def test_log_profiler(self, mock_logger):
+        mock_flumine = mock.Mock()
+        worker.log_profiler({}, mock_flumine)
+        mock_flumine.profiler.summary.assert_called_with(
+            mock_flumine.profiler.reset.return_value
+        )
+        mock_logger.info.assert_called_with(
+            "Profiler summary",
+            extra={"profiler": mock_flumine.profiler.summary.return_value},
+        )
+        mock_flumine.profiler = None
+        worker.log_profiler({}, mock_flumine)
+        mock_logger.info.assert_called_once()
+
+    @mock.patch("flumine.worker.logger")
+    def test_log_handler_queue(self, mock_logger):
+        mock_flumine = mock.Mock()
+        worker.log_handler_queue({}, mock_flumine)
+        mock_flumine.handler_queue.reset.assert_called_with()
+        mock_logger.info.assert_called_with(
+            "Handler queue summary",
+            extra={"handler_queue": mock_flumine.handler_queue.reset.return_value},
+        )
+
+    @mock.patch("flumine.worker.logger")
+    def test_log_execution_thread_pool(self, mock_logger):
+        mock_flumine = mock.Mock()
+        worker.log_execution_thread_pool({}, mock_flumine)
+        mock_flumine.betfair_execution.reset_thread_pool_info.assert_called_with()
+        mock_logger.info.assert_called_with(
+            "Execution thread pool summary",
+            extra={
+                "thread_pool": mock_flumine.betfair_execution.reset_thread_pool_info.return_value
+            },
+        )
+
+    @mock.patch("flumine.worker.config")
+    def test_refresh_http_sessions(self, mock_config):
+        mock_flumine = mock.Mock()
+        worker.refresh_http_sessions({}, mock_flumine)
+        mock_flumine.betfair_execution.refresh_http_sessions.assert_called_with(
+            mock_config.http_session_warm_count
+        )
+
     @mock.patch("flumine.worker._get_cleared_market")
     @mock.patch("flumine.worker._get_cleared_orders")
     def test_poll_market_closure(